@@ -17,7 +17,7 @@ from neuravox.shared.config import UnifiedConfig
 from neuravox.shared.logging_config import configure_logging, get_app_logger, get_config_logger, get_db_logger, get_logger
 from neuravox.shared.logging_formats import PrefixFormatter
 from neuravox.db.database import get_database_manager
-from neuravox.api.routers import health, files, jobs, processing, auth, workspace
+from neuravox.api.routers import health, files, jobs, processing, auth, workspace, batch
 from neuravox.api.routers import config as config_router
 from neuravox.api.middleware.rate_limit import RateLimitMiddleware
 from neuravox.api.middleware.request_context import RequestContextMiddleware, get_request_id
@@ -173,6 +173,7 @@ def create_app(config_path: Optional[Path] = None) -> FastAPI:
     app.include_router(processing.router, prefix="/api/v1", tags=["processing"])
     app.include_router(config_router.router, prefix="/api/v1", tags=["configuration"])
     app.include_router(workspace.router, prefix="/api/v1", tags=["workspace"])
+    app.include_router(batch.router, prefix="/api/v1", tags=["batch"])
     
     # Mount static files for web interface
     web_dir = Path(__file__).parent.parent / "web"
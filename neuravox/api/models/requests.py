@@ -117,4 +117,32 @@ class CreateApiKeyRequest(BaseModel):
     """Request to create a new API key"""
     name: str = Field(..., min_length=1, max_length=100, description="Name for the API key")
     user_id: str = Field(..., min_length=1, max_length=100, description="User identifier")
-    rate_limit_per_minute: int = Field(60, ge=1, le=1000, description="Rate limit per minute")
\ No newline at end of file
+    rate_limit_per_minute: int = Field(60, ge=1, le=1000, description="Rate limit per minute")
+
+# Headers a batch sub-request may set itself; credentials come from the batch call
+BATCH_REQUEST_HEADERS = frozenset({"accept", "if-none-match", "if-modified-since"})
+
+class BatchRequestItem(BaseModel):
+    """Single sub-request of a batch call"""
+    method: str = Field("GET", description="HTTP method (only GET is supported)")
+    path: str = Field(..., description="Endpoint path relative to /api/v1, e.g. /config")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Extra headers: Accept, If-None-Match or If-Modified-Since")
+    
+    @validator('method')
+    def validate_method(cls, v):
+        if v.upper() != 'GET':
+            raise ValueError("Only GET requests can be batched")
+        return v.upper()
+    
+    @validator('path')
+    def validate_path(cls, v):
+        if not v.startswith('/') or v.startswith('/$batch'):
+            raise ValueError("Path must start with / and cannot be a batch call")
+        return v
+    
+    @validator('headers')
+    def validate_headers(cls, v):
+        disallowed = sorted(name for name in v if name.lower() not in BATCH_REQUEST_HEADERS)
+        if disallowed:
+            raise ValueError(f"Headers not allowed in a batch sub-request: {', '.join(disallowed)}")
+        return v
@@ -155,4 +155,10 @@ class CreateApiKeyResponse(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     last_used_at: Optional[datetime] = Field(None, description="Last used timestamp")
     is_active: bool = Field(..., description="Whether key is active")
-    rate_limit_per_minute: int = Field(..., description="Rate limit per minute")
\ No newline at end of file
+    rate_limit_per_minute: int = Field(..., description="Rate limit per minute")
+
+class BatchResponseItem(BaseModel):
+    """Single sub-response of a batch call"""
+    status: int = Field(..., description="HTTP status code of the sub-request")
+    headers: Dict[str, str] = Field(default_factory=dict, description="Response headers of the sub-request")
+    body: Any = Field(None, description="Decoded response body")
@@ -0,0 +1,64 @@
+"""Batch endpoint for issuing several read-only requests in one round trip"""
+
+import asyncio
+from typing import List
+
+import httpx
+from fastapi import APIRouter, Depends, HTTPException, Request
+
+from neuravox.api.middleware.auth import require_api_key
+from neuravox.api.models.requests import BatchRequestItem
+from neuravox.api.models.responses import BatchResponseItem
+
+
+router = APIRouter()
+
+MAX_BATCH_SIZE = 20
+
+# Headers of the batch call passed on to every sub-request: the caller's
+# credentials, and the proxy headers rate limiting identifies clients by
+FORWARDED_HEADERS = ("Authorization", "X-API-Key", "X-Forwarded-For", "X-Real-IP")
+
+
+def _decode_body(response: httpx.Response):
+    """Return the JSON body of a sub-response, its text if not JSON, or None for 304"""
+    if response.status_code == 304:
+        return None
+    if response.headers.get("content-type", "").startswith("application/json"):
+        return response.json()
+    return response.text
+
+
+@router.post("/$batch", response_model=List[BatchResponseItem])
+async def batch_requests(
+    items: List[BatchRequestItem],
+    request: Request,
+    _api_key = Depends(require_api_key)
+):
+    """Run a list of GET requests against this API and return their responses in order"""
+    
+    if len(items) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_SIZE} requests per batch")
+    
+    # Sub-requests are dispatched in-process through the app itself, so each one
+    # still passes auth and rate limiting as the caller, from the caller's address
+    headers = {name: request.headers[name] for name in FORWARDED_HEADERS if name in request.headers}
+    api_prefix = request.url.path[:-len("/$batch")]
+    base_url = str(request.base_url).rstrip("/") + api_prefix
+    # ("127.0.0.1", 123) is what httpx reports when no address is given
+    client_address = (request.client.host, request.client.port) if request.client else ("127.0.0.1", 123)
+    
+    transport = httpx.ASGITransport(app=request.app, client=client_address)
+    async with httpx.AsyncClient(transport=transport, base_url=base_url, headers=headers) as client:
+        responses = await asyncio.gather(
+            *(client.get(item.path, headers=item.headers) for item in items)
+        )
+    
+    return [
+        BatchResponseItem(
+            status=response.status_code,
+            headers=dict(response.headers),
+            body=_decode_body(response)
+        )
+        for response in responses
+    ]
@@ -1,10 +1,11 @@
 """Configuration management endpoints"""
 
+import hashlib
 from typing import Dict, Any, Optional
 from pathlib import Path
 from pydantic import BaseModel, Field
 
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Request, Response
 
 from neuravox.shared.config import UnifiedConfig
 from neuravox.api.models.responses import ConfigResponse, ModelInfoResponse
@@ -22,8 +23,12 @@ class UpdateConfigRequest(BaseModel):
 
 
 @router.get("/config", response_model=ConfigResponse)
-async def get_config():
-    """Get current configuration"""
+async def get_config(request: Request, response: Response):
+    """Get current configuration
+    
+    The response carries an ETag; clients that send it back in If-None-Match
+    get an empty 304 while the configuration is unchanged.
+    """
     
     try:
         config = UnifiedConfig()
@@ -48,7 +53,7 @@ async def get_config():
                 parameters=model_config.parameters
             ))
         
-        return ConfigResponse(
+        config_response = ConfigResponse(
             workspace=str(config.workspace),
             processing={
                 "silence_threshold": config.processing.silence_threshold,
@@ -68,6 +73,13 @@ async def get_config():
             },
             models=models
         )
+        
+        etag = f'"{hashlib.sha256(config_response.model_dump_json().encode()).hexdigest()[:32]}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        
+        response.headers["ETag"] = etag
+        return config_response
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to get configuration: {str(e)}")
@@ -118,6 +130,7 @@ async def update_config(
     
     try:
         import yaml
+        from neuravox.shared.config_loader import SafeLoader, SafeDumper
         
         config = UnifiedConfig()
         config_data = {}
@@ -125,7 +138,7 @@ async def update_config(
         # Load existing config if it exists
         if config.config_path.exists():
             with open(config.config_path) as f:
-                config_data = yaml.safe_load(f) or {}
+                config_data = yaml.load(f, Loader=SafeLoader) or {}
         
         # Apply updates
         if request.processing:
@@ -146,7 +159,7 @@ async def update_config(
         
         # Write updated config
         with open(config.config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False, sort_keys=False)
+            yaml.dump(config_data, f, Dumper=SafeDumper, default_flow_style=False, sort_keys=False)
         
         # Reload config to get updated values
         updated_config = UnifiedConfig()
@@ -5,7 +5,7 @@ import psutil
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import text
 
@@ -65,6 +65,12 @@ async def health_check(db: AsyncSession = Depends(get_db_session)):
     )
 
 
+@router.head("/health")
+async def health_probe():
+    """Liveness probe: answers without checking the database, workspace or system load"""
+    return Response(status_code=200)
+
+
 @router.get("/status")
 async def system_status():
     """Detailed system status endpoint"""
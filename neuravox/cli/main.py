@@ -523,7 +523,7 @@ def resume(
         table.add_row(
             file_info["file_id"],
             Path(file_info["original_path"]).name,
-            file_info.get("error_message", "Unknown error")[:50] + "...",
+            (file_info["error_message"] or "Unknown error")[:50] + "...",
         )
 
     console.print(table)
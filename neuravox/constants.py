@@ -71,6 +71,7 @@ class EnvironmentVariables:
     GOOGLE_API_KEY = "GOOGLE_API_KEY"
     WHISPER_MODEL = "WHISPER_MODEL"
     WHISPER_DEVICE = "WHISPER_DEVICE"
+    WHISPER_BACKEND = "WHISPER_BACKEND"
 
 
 class DirectoryNames:
@@ -127,8 +128,10 @@ class FileNaming:
     METADATA_SUFFIX = "_metadata.json"
     MANIFEST_SUFFIX = "_manifest.json"
     PROCESSING_METADATA_FILE = "processing_metadata.json"
-    TRANSCRIPTION_METADATA_SUFFIX = "_transcription_metadata.json"
-    CHUNKS_DETAIL_SUFFIX = "_chunks.json"
+    TRANSCRIPTION_SIDECAR_SUFFIX = "_transcription.ndjson"
+    # Transcription metadata and chunk details now share the sidecar
+    TRANSCRIPTION_METADATA_SUFFIX = TRANSCRIPTION_SIDECAR_SUFFIX
+    CHUNKS_DETAIL_SUFFIX = TRANSCRIPTION_SIDECAR_SUFFIX
 
 
 class DefaultPrompts:
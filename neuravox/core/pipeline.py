@@ -308,7 +308,7 @@ class AudioPipeline:
         if not keep_transcribed:
             # Remove all processed files
             removed_count = 0
-            for item in self.config.workspace.processed_path.iterdir():
+            for item in self.config.processed_path.iterdir():
                 if item.is_dir():
                     shutil.rmtree(item)
                     removed_count += 1
@@ -317,6 +317,9 @@ class AudioPipeline:
         # Clean empty directories
         from neuravox.shared.file_utils import cleanup_empty_directories
 
-        cleanup_empty_directories(self.config.workspace.base_path)
+        cleanup_empty_directories(self.config.workspace)
+        # Empty workspace subdirectories may be gone now, so the next
+        # ensure_workspace_dirs() must recreate them
+        self.config._workspace_ready = False
         self.logger.info("Workspace cleanup completed")
 
@@ -3,14 +3,62 @@ SQLite-based state management for pipeline processing
 """
 import sqlite3
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, NamedTuple, Optional
 from datetime import datetime
-import json
 from contextlib import contextmanager
 
+from neuravox.shared.file_utils import dump_json, load_json
+
+
+class StageRecord(NamedTuple):
+    """Processing stage history entry with lazily decoded metadata"""
+    stage: str
+    status: str
+    started_at: Optional[str]
+    completed_at: Optional[str]
+    error_message: Optional[str]
+    raw_metadata: Optional[str]
+    
+    @property
+    def metadata(self) -> Optional[Dict[str, Any]]:
+        """Decode stage metadata on access"""
+        return load_json(self.raw_metadata) if self.raw_metadata else None
+
+
 class StateManager:
     """SQLite-based state management"""
     
+    # Bumped whenever existing databases need a schema migration
+    SCHEMA_VERSION = 1
+    
+    # Child tables keyed to files(file_id); rows are removed with their file
+    _CHILD_TABLES = {
+        'processing_stages': '''
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_id TEXT REFERENCES files(file_id) ON DELETE CASCADE,
+                stage TEXT NOT NULL,
+                status TEXT NOT NULL,
+                started_at TIMESTAMP,
+                completed_at TIMESTAMP,
+                error_message TEXT,
+                metadata TEXT
+            )
+        ''',
+        'chunks': '''
+            CREATE TABLE IF NOT EXISTS {name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                file_id TEXT REFERENCES files(file_id) ON DELETE CASCADE,
+                chunk_index INTEGER,
+                audio_path TEXT,
+                transcript_path TEXT,
+                start_time REAL,
+                end_time REAL,
+                transcribed BOOLEAN DEFAULT FALSE
+            )
+        ''',
+    }
+    
     def __init__(self, workspace_path: Path):
         self.db_path = workspace_path / '.pipeline_state.db'
         self.workspace_path = workspace_path
@@ -29,41 +77,43 @@ class StateManager:
                 )
             ''')
             
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS processing_stages (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id TEXT REFERENCES files(file_id),
-                    stage TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    started_at TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    error_message TEXT,
-                    metadata TEXT
-                )
-            ''')
+            for table, ddl in self._CHILD_TABLES.items():
+                conn.execute(ddl.format(name=table))
             
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS chunks (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    file_id TEXT REFERENCES files(file_id),
-                    chunk_index INTEGER,
-                    audio_path TEXT,
-                    transcript_path TEXT,
-                    start_time REAL,
-                    end_time REAL,
-                    transcribed BOOLEAN DEFAULT FALSE
-                )
-            ''')
+            if conn.execute('PRAGMA user_version').fetchone()[0] < self.SCHEMA_VERSION:
+                self._migrate_cascade(conn)
+                conn.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
             
             # Create indices for better performance
             conn.execute('CREATE INDEX IF NOT EXISTS idx_files_status ON files(status)')
             conn.execute('CREATE INDEX IF NOT EXISTS idx_stages_file_id ON processing_stages(file_id)')
+            conn.execute('CREATE INDEX IF NOT EXISTS idx_chunks_file_id ON chunks(file_id)')
+    
+    def _migrate_cascade(self, conn: sqlite3.Connection):
+        """Rebuild child tables created before ON DELETE CASCADE was declared"""
+        for table, ddl in self._CHILD_TABLES.items():
+            foreign_keys = conn.execute(f'PRAGMA foreign_key_list({table})').fetchall()
+            if all(fk['on_delete'] == 'CASCADE' for fk in foreign_keys):
+                continue
+            
+            # SQLite cannot alter a foreign key in place; copy rows that still
+            # have a parent file into a fresh table and swap it in
+            conn.execute(ddl.format(name=f'{table}_new'))
+            conn.execute(f'''
+                INSERT INTO {table}_new
+                SELECT * FROM {table} t
+                WHERE EXISTS (SELECT 1 FROM files f WHERE f.file_id = t.file_id)
+            ''')
+            conn.execute(f'DROP TABLE {table}')
+            conn.execute(f'ALTER TABLE {table}_new RENAME TO {table}')
     
     @contextmanager
     def _get_connection(self):
         """Get database connection with proper cleanup"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # Foreign keys (and their cascades) are off by default per connection
+        conn.execute('PRAGMA foreign_keys = ON')
         try:
             yield conn
             conn.commit()
@@ -76,9 +126,16 @@ class StateManager:
     def start_processing(self, file_id: str, original_path: str):
         """Mark file as started processing"""
         with self._get_connection() as conn:
+            # Upsert rather than INSERT OR REPLACE: a REPLACE deletes the old
+            # row, which would cascade away the file's stage history
             conn.execute('''
-                INSERT OR REPLACE INTO files (file_id, original_path, status, updated_at)
+                INSERT INTO files (file_id, original_path, status, updated_at)
                 VALUES (?, ?, 'processing', datetime('now'))
+                ON CONFLICT(file_id) DO UPDATE SET
+                    original_path = excluded.original_path,
+                    status = excluded.status,
+                    created_at = CURRENT_TIMESTAMP,
+                    updated_at = excluded.updated_at
             ''', (file_id, original_path))
             
             conn.execute('''
@@ -97,7 +154,7 @@ class StateManager:
             ''', (file_id,))
             
             # Start new stage
-            metadata_json = json.dumps(metadata) if metadata else None
+            metadata_json = dump_json(metadata, indent=None).decode() if metadata else None
             conn.execute('''
                 INSERT INTO processing_stages (file_id, stage, status, started_at, metadata)
                 VALUES (?, ?, 'started', datetime('now'), ?)
@@ -161,7 +218,7 @@ class StateManager:
             
             return [dict(row) for row in rows]
     
-    def get_processing_history(self, file_id: str) -> List[Dict[str, Any]]:
+    def get_processing_history(self, file_id: str) -> List[StageRecord]:
         """Get processing history for a file"""
         with self._get_connection() as conn:
             rows = conn.execute('''
@@ -171,14 +228,7 @@ class StateManager:
                 ORDER BY started_at
             ''', (file_id,)).fetchall()
             
-            history = []
-            for row in rows:
-                item = dict(row)
-                if item['metadata']:
-                    item['metadata'] = json.loads(item['metadata'])
-                history.append(item)
-            
-            return history
+            return [StageRecord._make(row) for row in rows]
     
     def get_pipeline_summary(self) -> Dict[str, Any]:
         """Get overall pipeline summary"""
@@ -209,22 +259,10 @@ class StateManager:
             }
     
     def cleanup_old_records(self, days: int = 30):
-        """Clean up old records"""
+        """Clean up old records; stage and chunk rows cascade with their file"""
         with self._get_connection() as conn:
             conn.execute('''
                 DELETE FROM files
-                WHERE updated_at < datetime('now', '-{} days')
+                WHERE updated_at < datetime('now', ?)
                 AND status IN ('completed', 'failed')
-            '''.format(days))
-            
-            # Clean up orphaned stage records
-            conn.execute('''
-                DELETE FROM processing_stages
-                WHERE file_id NOT IN (SELECT file_id FROM files)
-            ''')
-            
-            # Clean up orphaned chunk records
-            conn.execute('''
-                DELETE FROM chunks
-                WHERE file_id NOT IN (SELECT file_id FROM files)
-            ''')
\ No newline at end of file
+            ''', (f'-{int(days)} days',))
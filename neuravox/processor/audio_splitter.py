@@ -19,7 +19,7 @@ import soundfile as sf
 from neuravox.processor.metadata_output import AudioMetadata, OutputManager, export_with_metadata
 
 # Import shared components for pipeline mode
-from neuravox.shared.metadata import ProcessingMetadata, ChunkMetadata
+from neuravox.shared.metadata import ProcessingMetadata
 from neuravox.shared.file_utils import create_file_id
 
 
@@ -218,8 +218,8 @@ class AudioProcessor:
         # Create audio chunks between silence gaps
         audio_chunks = self._create_chunks_simple(silence_segments, duration)
         
-        # Export chunks and collect metadata
-        chunk_metadata_list = []
+        # Export chunks and collect their files
+        chunk_files = []
         output_dir.mkdir(parents=True, exist_ok=True)
         
         # Set output format to FLAC for transcription optimization
@@ -260,17 +260,7 @@ class AudioProcessor:
             # Save chunk
             sf.write(str(chunk_file), y, sr, format='FLAC')
             
-            # Create chunk metadata
-            chunk_meta = ChunkMetadata(
-                chunk_index=idx,
-                total_chunks=len(audio_chunks),
-                start_time=start,
-                end_time=end,
-                duration=end - start,
-                file_path=chunk_file,
-                source_file=input_file
-            )
-            chunk_metadata_list.append(chunk_meta)
+            chunk_files.append(chunk_file)
         
         # Create processing metadata
         processing_params = {
@@ -281,12 +271,16 @@ class AudioProcessor:
             "output_format": self.output_format
         }
         
-        metadata = ProcessingMetadata(
+        # Chunk times and files are stored as parallel arrays
+        metadata = ProcessingMetadata.from_arrays(
+            [start for start, _ in audio_chunks],
+            [end for _, end in audio_chunks],
+            chunk_files,
+            input_file,
             file_id=file_id,
             original_file=input_file,
             processed_at=datetime.now(),
             processing_time=time.time() - start_time,
-            chunks=chunk_metadata_list,
             audio_info=audio_info,
             processing_params=processing_params
         )
@@ -2,9 +2,11 @@
 Unified configuration API for Neuravox
 """
 import os
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, Any, Optional, List
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
 
 # Import from new modular components
 from .config_loader import load_config_data, get_env_overrides
@@ -16,6 +18,38 @@ from .logging_setup import create_source_logger
 from neuravox.api.utils.exceptions import ConfigurationError
 
 
+# Built-in model templates, defined once at import. UnifiedConfig copies
+# them per instance because user config and env overrides mutate models.
+DEFAULT_MODELS = MappingProxyType({
+    "google-gemini": ModelConfig(
+        name="Google Gemini Flash",
+        provider="google",
+        model_id="gemini-2.0-flash-exp",
+        parameters={"temperature": 0.1}
+    ),
+    "openai-whisper": ModelConfig(
+        name="OpenAI Whisper",
+        provider="openai",
+        model_id="whisper-1",
+        parameters={"response_format": "text"}
+    ),
+    "whisper-base": ModelConfig(
+        name="Whisper Base (Local)",
+        provider="whisper-local",
+        model_id="base",
+        device=None,
+        parameters={"language": None}
+    ),
+    "whisper-turbo": ModelConfig(
+        name="Whisper Turbo (Local)",
+        provider="whisper-local",
+        model_id="turbo",
+        device=None,
+        parameters={"language": None}
+    )
+})
+
+
 @dataclass
 class TranscriptionConfig:
     """Transcription configuration with defaults"""
@@ -29,12 +63,16 @@ class TranscriptionConfig:
 class UnifiedConfig:
     """Configuration manager facade"""
     
-    def __init__(self, config_path: Optional[Path] = None, validate: bool = True):
+    # Cached workspace subdirectory properties, reset when workspace changes
+    _WORKSPACE_PATHS = ("input_path", "processed_path", "transcribed_path")
+    
+    def __init__(self, config_path: Optional[Path] = None, validate: bool = True,
+                 _raw_config: Optional[Dict[str, Any]] = None):
         self.validation_errors = []
         self.validation_warnings = []
         
         # Load configuration data
-        self._raw_config = load_config_data(config_path)
+        self._raw_config = load_config_data(config_path) if _raw_config is None else _raw_config
         self._env_overrides = get_env_overrides()
         
         # Store config path for reference
@@ -56,6 +94,11 @@ class UnifiedConfig:
         if validate:
             self._validate_configuration()
     
+    @classmethod
+    def from_mapping(cls, data: Dict[str, Any], validate: bool = True) -> "UnifiedConfig":
+        """Build configuration from already-parsed config data instead of a file"""
+        return cls(validate=validate, _raw_config=data)
+    
     @property
     def logger(self):
         """Lazy logger initialization"""
@@ -94,34 +137,10 @@ class UnifiedConfig:
         self.security = SecurityConfig()
     
     def _get_default_models(self) -> Dict[str, ModelConfig]:
-        """Get default model configurations"""
+        """Get default model configurations (fresh copies, safe to mutate)"""
         return {
-            "google-gemini": ModelConfig(
-                name="Google Gemini Flash",
-                provider="google",
-                model_id="gemini-2.0-flash-exp",
-                parameters={"temperature": 0.1}
-            ),
-            "openai-whisper": ModelConfig(
-                name="OpenAI Whisper",
-                provider="openai",
-                model_id="whisper-1",
-                parameters={"response_format": "text"}
-            ),
-            "whisper-base": ModelConfig(
-                name="Whisper Base (Local)",
-                provider="whisper-local",
-                model_id="base",
-                device=None,
-                parameters={"language": None}
-            ),
-            "whisper-turbo": ModelConfig(
-                name="Whisper Turbo (Local)",
-                provider="whisper-local",
-                model_id="turbo",
-                device=None,
-                parameters={"language": None}
-            )
+            key: replace(model, parameters=dict(model.parameters))
+            for key, model in DEFAULT_MODELS.items()
         }
     
     def _merge_user_config(self):
@@ -225,18 +244,31 @@ class UnifiedConfig:
                 if hasattr(self.api, key):
                     setattr(self.api, key, value)
     
-    # Convenience properties for backward compatibility
     @property
+    def workspace(self) -> Path:
+        """Get workspace root path"""
+        return self._workspace
+    
+    @workspace.setter
+    def workspace(self, value: Path):
+        """Set workspace root path and drop cached subdirectory paths"""
+        self._workspace = value
+        self._workspace_ready = False
+        for name in self._WORKSPACE_PATHS:
+            self.__dict__.pop(name, None)
+    
+    # Convenience properties for backward compatibility (cached per workspace)
+    @cached_property
     def input_path(self) -> Path:
         """Get input directory path"""
         return self.workspace / "input"
     
-    @property
+    @cached_property
     def processed_path(self) -> Path:
         """Get processed directory path"""
         return self.workspace / "processed"
     
-    @property
+    @cached_property
     def transcribed_path(self) -> Path:
         """Get transcribed directory path"""
         return self.workspace / "transcribed"
@@ -251,10 +283,16 @@ class UnifiedConfig:
     
     def ensure_workspace_dirs(self):
         """Create workspace directories if they don't exist"""
+        if self._workspace_ready:
+            return
+        
         try:
+            # Only the root needs a parent walk; subdirectories sit directly under it
+            self.workspace.mkdir(parents=True, exist_ok=True)
             for dir_path in [self.input_path, self.processed_path, self.transcribed_path]:
-                dir_path.mkdir(parents=True, exist_ok=True)
+                dir_path.mkdir(exist_ok=True)
                 self.logger.debug("workspace_dir_created", path=str(dir_path))
+            self._workspace_ready = True
         except Exception as e:
             error_msg = f"Failed to create workspace directories: {e}"
             self.logger.error("workspace_creation_failed", error=str(e), workspace=str(self.workspace))
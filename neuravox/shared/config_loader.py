@@ -4,6 +4,12 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Use libyaml's C scanner and emitter when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 def load_config_data(config_path: Optional[Path] = None) -> Dict[str, Any]:
     """Load raw configuration data from file or defaults"""
     # Determine config path
@@ -17,7 +23,7 @@ def load_config_data(config_path: Optional[Path] = None) -> Dict[str, Any]:
     # Load from file if exists
     if path.exists():
         with open(path) as f:
-            return yaml.safe_load(f) or {}
+            return yaml.load(f, Loader=SafeLoader) or {}
     return {}
 
 def get_env_overrides() -> Dict[str, Any]:
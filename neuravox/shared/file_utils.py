@@ -2,98 +2,391 @@
 Common file handling utilities
 """
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Iterator, List, Optional, Tuple, Union
+import errno
+import os
+import re
 import shutil
+from stat import S_ISREG
 import hashlib
+import mmap
 import json
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+import sqlite3
+import threading
+import time
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Read size for buffered hashing; large reads keep per-update overhead negligible
+_HASH_CHUNK = 1 << 20
+
+# Persistent digest cache, so unchanged files are never re-hashed
+_HASH_CACHE_PATH = Path.home() / ".neuravox" / "cache" / "hashes.sqlite"
+_HASH_CACHE_MAX_ENTRIES = 10000
+
+# Default get_audio_files suffixes, lowercase for str.endswith matching
+_AUDIO_EXTENSIONS = ('.mp3', '.wav', '.flac', '.m4a', '.ogg', '.opus', '.wma', '.aac')
 
 def ensure_directory(path: Path) -> Path:
     """Ensure directory exists, create if not"""
     path.mkdir(parents=True, exist_ok=True)
     return path
 
-def get_audio_files(directory: Path, extensions: Optional[List[str]] = None) -> List[Path]:
-    """Get all audio files in directory"""
+def _scan_audio_dir(directory, suffixes: Tuple[str, ...]) -> Tuple[List[Path], List[str]]:
+    """Return the audio files and subdirectory paths of one directory"""
+    files, subdirs = [], []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.name.lower().endswith(suffixes) and entry.is_file():
+                    files.append(Path(entry.path))
+    except OSError:
+        pass  # Missing or unreadable directories have no audio files
+    return files, subdirs
+
+def get_audio_files(directory: Path, extensions: Optional[List[str]] = None,
+                    recursive: bool = False, workers: int = 8) -> List[Path]:
+    """Get all audio files in directory (extensions match case-insensitively)"""
     if extensions is None:
-        extensions = ['.mp3', '.wav', '.flac', '.m4a', '.ogg', '.opus', '.wma', '.aac']
+        suffixes = _AUDIO_EXTENSIONS
+    else:
+        suffixes = tuple(ext.lower() for ext in extensions)
+    
+    # One scandir pass per directory instead of a glob per extension and case
+    if not recursive:
+        return sorted(_scan_audio_dir(directory, suffixes)[0])
     
+    # readdir releases the GIL, so subdirectories are listed concurrently
     audio_files = []
-    for ext in extensions:
-        audio_files.extend(directory.glob(f'*{ext}'))
-        audio_files.extend(directory.glob(f'*{ext.upper()}'))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        pending = {pool.submit(_scan_audio_dir, directory, suffixes)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                files, subdirs = future.result()
+                audio_files.extend(files)
+                pending.update(pool.submit(_scan_audio_dir, subdir, suffixes) for subdir in subdirs)
     
-    return sorted(set(audio_files))
+    return sorted(audio_files)
 
 def move_file_safely(src: Path, dst: Path) -> Path:
     """Move file safely, handling existing files"""
     if dst.exists():
-        # Add number suffix to avoid overwriting
+        # Add number suffix to avoid overwriting; one directory scan finds the
+        # highest counter in use instead of probing each candidate name
         base = dst.stem
         ext = dst.suffix
-        counter = 1
-        while dst.exists():
-            dst = dst.parent / f"{base}_{counter}{ext}"
-            counter += 1
+        taken = re.compile(rf"{re.escape(base)}_(\d+){re.escape(ext)}")
+        counter = 0
+        with os.scandir(dst.parent) as entries:
+            for entry in entries:
+                if match := taken.fullmatch(entry.name):
+                    counter = max(counter, int(match.group(1)))
+        dst = dst.parent / f"{base}_{counter + 1}{ext}"
     
-    shutil.move(str(src), str(dst))
+    try:
+        # Same filesystem: a metadata-only rename, no data copied
+        os.rename(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Across filesystems shutil copies in-kernel (sendfile) then unlinks
+        shutil.move(str(src), str(dst))
     return dst
 
-def calculate_file_hash(file_path: Path, chunk_size: int = 8192) -> str:
-    """Calculate SHA256 hash of file"""
-    sha256_hash = hashlib.sha256()
+def _new_hasher(algorithm: str):
+    """Create a hash object for algorithm ('blake3' or any hashlib name)"""
+    if algorithm == "blake3":
+        if blake3 is None:
+            raise ValueError("BLAKE3 hashing requires the 'blake3' package")
+        return blake3.blake3(max_threads=blake3.blake3.AUTO)
+    return hashlib.new(algorithm)
+
+def _open_hash_cache() -> sqlite3.Connection:
+    """Open the digest cache database, creating it on first use"""
+    _HASH_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(_HASH_CACHE_PATH, timeout=5)
+    # Entries are keyed by inode rather than path, so renamed or hardlinked
+    # files still hit; a changed size or mtime means the file was rewritten
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS file_hashes (
+            device INTEGER NOT NULL,
+            inode INTEGER NOT NULL,
+            algorithm TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            digest TEXT NOT NULL,
+            last_used REAL NOT NULL,
+            PRIMARY KEY (device, inode, algorithm)
+        )
+    ''')
+    return conn
+
+def _cached_hash(conn: sqlite3.Connection, stat, algorithm: str) -> Optional[str]:
+    """Return the cached digest if the file's inode, size and mtime are unchanged"""
+    key = (stat.st_dev, stat.st_ino, algorithm)
+    try:
+        with conn:
+            row = conn.execute(
+                'SELECT size, mtime_ns, digest FROM file_hashes '
+                'WHERE device = ? AND inode = ? AND algorithm = ?', key
+            ).fetchone()
+            if row is None or (row[0], row[1]) != (stat.st_size, stat.st_mtime_ns):
+                return None
+            conn.execute(
+                'UPDATE file_hashes SET last_used = ? WHERE device = ? AND inode = ? AND algorithm = ?',
+                (time.time(), *key)
+            )
+            return row[2]
+    except sqlite3.Error:
+        return None
+
+def _store_hash(conn: sqlite3.Connection, stat, algorithm: str, digest: str):
+    """Record a digest, evicting the least recently used entries over the limit"""
+    try:
+        with conn:
+            conn.execute(
+                'INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (stat.st_dev, stat.st_ino, algorithm, stat.st_size, stat.st_mtime_ns, digest, time.time())
+            )
+            excess = conn.execute('SELECT COUNT(*) FROM file_hashes').fetchone()[0] - _HASH_CACHE_MAX_ENTRIES
+            if excess > 0:
+                conn.execute(
+                    'DELETE FROM file_hashes WHERE rowid IN '
+                    '(SELECT rowid FROM file_hashes ORDER BY last_used LIMIT ?)', (excess,)
+                )
+    except sqlite3.Error:
+        pass  # The cache is an optimization only
+
+def calculate_file_hash(file_path: Path, chunk_size: int = _HASH_CHUNK, algorithm: str = "sha256",
+                        use_cache: bool = False) -> str:
+    """Calculate hash of file (SHA256 unless another algorithm is requested)
+    
+    With use_cache, digests are remembered in a SQLite database under
+    ~/.neuravox/cache, so a file that is unchanged since it was last hashed
+    is not read again.
+    """
+    if not use_cache:
+        return _hash_file(file_path, chunk_size, algorithm)
+    
+    stat = os.stat(file_path)
+    try:
+        conn = _open_hash_cache()
+    except (sqlite3.Error, OSError):
+        return _hash_file(file_path, chunk_size, algorithm)  # The cache is an optimization only
+    
+    # One connection serves both the lookup and the store
+    try:
+        digest = _cached_hash(conn, stat, algorithm)
+        if digest is None:
+            digest = _hash_file(file_path, chunk_size, algorithm)
+            _store_hash(conn, stat, algorithm, digest)
+        return digest
+    finally:
+        conn.close()
+
+def _hash_file(file_path: Path, chunk_size: int, algorithm: str) -> str:
+    """Hash a file's content"""
+    # SHA256 stays the default: digests are persisted in file IDs and caches
+    hasher = _new_hasher(algorithm)
     with open(file_path, "rb") as f:
-        while chunk := f.read(chunk_size):
-            sha256_hash.update(chunk)
-    return sha256_hash.hexdigest()
+        # Empty files can't be mapped, and their digest needs no reads
+        file_stat = os.fstat(f.fileno())
+        if file_stat.st_size or not S_ISREG(file_stat.st_mode):
+            try:
+                # Hash the mapped file in one call: no Python-level copies, and
+                # OpenSSL uses SHA extensions where the CPU has them
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    # A single front-to-back pass: ask for aggressive read-ahead.
+                    # Pages are kept cached, since the pipeline decodes the
+                    # file right after hashing it for its ID
+                    if hasattr(mapped, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mapped.madvise(mmap.MADV_SEQUENTIAL)
+                    hasher.update(mapped)
+            except (ValueError, OSError):
+                # Unmappable streams fall back to buffered reads into one
+                # reusable buffer
+                if hasattr(os, "posix_fadvise") and S_ISREG(file_stat.st_mode):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                buffer = bytearray(chunk_size)
+                view = memoryview(buffer)
+                while size := f.readinto(buffer):
+                    hasher.update(view[:size])
+    return hasher.hexdigest()
 
-def create_file_id(file_path: Path) -> str:
-    """Create unique file ID from path"""
-    # Use first 8 chars of hash + filename stem
-    file_hash = calculate_file_hash(file_path)[:8]
-    return f"{file_path.stem}_{file_hash}"
+def iter_audio_with_hashes(directory: Path, extensions: Optional[List[str]] = None,
+                           recursive: bool = False,
+                           workers: Optional[int] = None) -> Iterator[Tuple[Path, str]]:
+    """Yield (audio file, content hash) pairs in completion order"""
+    # hashlib releases the GIL while digesting, so threads hash files in parallel
+    pool = ThreadPoolExecutor(max_workers=workers or os.cpu_count())
+    try:
+        futures = {
+            pool.submit(calculate_file_hash, path): path
+            for path in get_audio_files(directory, extensions, recursive=recursive)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        # Don't hash the rest if the caller stops early
+        pool.shutdown(cancel_futures=True)
+
+class FileId(str):
+    """File ID string ('<stem>_<digest>') that exposes its two parts
+    
+    Still a plain string to callers: path component, database key, JSON value.
+    """
+    __slots__ = ()
+    
+    def __new__(cls, stem: str, digest: str):
+        return super().__new__(cls, f"{stem}_{digest}")
+    
+    def __getnewargs__(self):
+        return (self.stem, self.digest)
+    
+    @property
+    def stem(self) -> str:
+        return self.rpartition('_')[0]
+    
+    @property
+    def digest(self) -> str:
+        return self.rpartition('_')[2]
+
+def create_file_id(file_path: Path, sample_size: Optional[int] = None) -> FileId:
+    """Create unique file ID from path
+    
+    With sample_size, only the file size and its first and last sample_size
+    bytes are hashed. That is O(1) for large files, but files that differ
+    only in the middle (e.g. equal-length recordings with silent edges) get
+    the same ID, so the full content hash stays the default.
+    """
+    if sample_size is None:
+        # Use first 8 chars of hash + filename stem
+        file_hash = calculate_file_hash(file_path)[:8]
+        return FileId(file_path.stem, file_hash)
+    
+    hasher = hashlib.blake2b(digest_size=4)
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        hasher.update(size.to_bytes(8, "little"))
+        hasher.update(f.read(sample_size))
+        if size > sample_size:
+            f.seek(max(sample_size, size - sample_size))
+            hasher.update(f.read(sample_size))
+    return FileId(file_path.stem, hasher.hexdigest())
 
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to human readable string"""
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    secs = int(seconds % 60)
+    # Truncate once, then stay in integer arithmetic
+    hours, remainder = divmod(int(seconds), 3600)
+    minutes, secs = divmod(remainder, 60)
     
-    if hours > 0:
+    if hours:
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    else:
-        return f"{minutes:02d}:{secs:02d}"
+    return f"{minutes:02d}:{secs:02d}"
+
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
 
 def format_file_size(size_bytes: int) -> str:
     """Format file size to human readable string"""
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.1f} TB"
+    magnitude = int(abs(size_bytes))
+    if magnitude < 1024:
+        return f"{size_bytes} B"
+    # Each unit is 2**10 of the previous one, so the bit length picks it directly
+    unit = min((magnitude.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
+
+def dump_json(data: Any, indent: Optional[int] = 2) -> bytes:
+    """Serialize to UTF-8 JSON (one line when indent is None), with orjson when it is installed
+    
+    Unknown types (paths, datetimes) are written as their str().
+    """
+    # orjson only indents by two spaces; other widths use the stdlib encoder
+    if orjson is not None and indent in (2, None):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=str, option=options)
+    return json.dumps(data, indent=indent, default=str).encode()
+
+def load_json(data: Union[bytes, str]) -> Any:
+    """Parse JSON text, with orjson when it is installed"""
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
 
 def load_json_file(path: Path) -> dict:
     """Load JSON file with error handling"""
     try:
-        with open(path, 'r') as f:
-            return json.load(f)
+        return load_json(Path(path).read_bytes())
     except (json.JSONDecodeError, FileNotFoundError) as e:
         raise ValueError(f"Error loading JSON from {path}: {e}")
 
-def save_json_file(data: dict, path: Path, indent: int = 2):
-    """Save data to JSON file"""
+def save_json_file(data: dict, path: Path, indent: int = 2, durable: bool = False):
+    """Save data to JSON file atomically (fsynced only when durable)"""
     ensure_directory(path.parent)
-    with open(path, 'w') as f:
-        json.dump(data, f, indent=indent, default=str)
+    payload = dump_json(data, indent)
+    
+    # Write beside the target and swap it in, so readers never see a partial file
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
 
 def get_relative_path(path: Path, base: Path) -> Path:
     """Get relative path from base, handling when path is not relative to base"""
-    try:
-        return path.relative_to(base)
-    except ValueError:
-        return path
+    # Same lexical prefix test as Path.relative_to, without raising on a miss
+    base_parts = base.parts
+    if path.parts[:len(base_parts)] == base_parts:
+        return Path(*path.parts[len(base_parts):])
+    return path
 
 def cleanup_empty_directories(base_path: Path):
     """Remove empty directories recursively"""
-    for dirpath in sorted(base_path.rglob('*'), reverse=True):
-        if dirpath.is_dir() and not any(dirpath.iterdir()):
-            dirpath.rmdir()
\ No newline at end of file
+    if not hasattr(os, "fwalk") or os.rmdir not in os.supports_dir_fd:
+        # Bottom-up walk: children are visited (and removed) before their
+        # parents, so a chain of empty directories collapses in a single pass
+        for dirpath, _, filenames in os.walk(base_path, topdown=False):
+            if filenames or dirpath == str(base_path):
+                continue
+            try:
+                os.rmdir(dirpath)
+            except OSError:
+                pass  # Still holds subdirectories (or vanished meanwhile)
+        return
+    
+    # Each directory removes its empty children through its own descriptor,
+    # so every rmdir resolves one path component; directories known to hold
+    # something are skipped without a syscall
+    occupied = set()
+    for dirpath, dirnames, filenames, dirfd in os.fwalk(base_path, topdown=False):
+        keep = bool(filenames)
+        for name in dirnames:
+            if os.path.join(dirpath, name) in occupied:
+                keep = True
+                continue
+            try:
+                os.rmdir(name, dir_fd=dirfd)
+            except OSError:
+                keep = True
+        if keep:
+            occupied.add(dirpath)
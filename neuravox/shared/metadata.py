@@ -1,15 +1,25 @@
 """
 Unified metadata handling for audio processing and transcription
 """
-from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from collections.abc import Sequence
+from dataclasses import dataclass, asdict, replace
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Union
 from pathlib import Path
-import json
 from datetime import datetime
 
-@dataclass
+import numpy as np
+
+from neuravox.shared.file_utils import dump_json, load_json
+
+
+@dataclass(slots=True)
 class ChunkMetadata:
-    """Metadata for audio chunks"""
+    """Metadata for audio chunks
+    
+    Slotted (no per-instance __dict__); chunks of one file should share a
+    single source_file Path rather than each holding a copy.
+    """
     chunk_index: int
     total_chunks: int
     start_time: float
@@ -30,6 +40,80 @@ class ChunkMetadata:
             "source_file": str(self.source_file)
         }
 
+class ChunkArrays(Sequence):
+    """Chunk metadata stored as parallel arrays
+    
+    Behaves like a read-only list of ChunkMetadata, built on access, so
+    files with thousands of chunks don't carry one object per chunk. The
+    arrays are immutable, so the serialized chunk dicts are built once and
+    shared by every to_dicts() call (save, manifest, ...).
+    """
+    
+    def __init__(self, start_times, end_times, file_paths, source_file: Path):
+        start = np.asarray(start_times, dtype=np.float64)
+        end = np.asarray(end_times, dtype=np.float64)
+        if start.shape != end.shape or len(start) != len(file_paths):
+            raise ValueError("start_times, end_times and file_paths must have the same length")
+        
+        # Rows: start, end, duration
+        self.times = np.stack([start, end, end - start])
+        self.times.flags.writeable = False
+        self.file_paths = tuple(str(path) for path in file_paths)
+        self.source_file = Path(source_file)
+    
+    def __len__(self) -> int:
+        return len(self.file_paths)
+    
+    def __getitem__(self, index: Union[int, slice]) -> Union[ChunkMetadata, List[ChunkMetadata]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(len(self))[index]]
+        
+        index = range(len(self))[index]
+        start, end, duration = self.times[:, index].tolist()
+        return ChunkMetadata(
+            chunk_index=index,
+            total_chunks=len(self),
+            start_time=start,
+            end_time=end,
+            duration=duration,
+            file_path=Path(self.file_paths[index]),
+            source_file=self.source_file
+        )
+    
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """Convert all chunks to dictionaries without building ChunkMetadata
+        
+        The dictionaries are cached and shared between calls; treat them as
+        read-only.
+        """
+        return list(self._serialized)
+    
+    @cached_property
+    def _serialized(self) -> tuple:
+        """Chunk dictionaries, built on first use"""
+        starts, ends, durations = self.times.tolist()
+        total_chunks = len(self)
+        source_file = str(self.source_file)
+        return tuple(
+            {
+                "chunk_index": index,
+                "total_chunks": total_chunks,
+                "start_time": start,
+                "end_time": end,
+                "duration": duration,
+                "file_path": file_path,
+                "source_file": source_file
+            }
+            for index, (start, end, duration, file_path)
+            in enumerate(zip(starts, ends, durations, self.file_paths))
+        )
+
+def _chunk_dicts(chunks: Union[List[ChunkMetadata], ChunkArrays]) -> List[Dict[str, Any]]:
+    """Convert a chunk list or ChunkArrays to dictionaries"""
+    if isinstance(chunks, ChunkArrays):
+        return chunks.to_dicts()
+    return [chunk.to_dict() for chunk in chunks]
+
 @dataclass
 class ProcessingMetadata:
     """Unified processing metadata"""
@@ -37,32 +121,53 @@ class ProcessingMetadata:
     original_file: Path
     processed_at: datetime
     processing_time: float
-    chunks: List[ChunkMetadata]
+    chunks: Union[List[ChunkMetadata], ChunkArrays]
     audio_info: Dict[str, Any]
     processing_params: Dict[str, Any]
     
+    @classmethod
+    def from_arrays(
+        cls,
+        start_times,
+        end_times,
+        file_paths: List[Path],
+        source_file: Path,
+        **fields
+    ) -> 'ProcessingMetadata':
+        """Create metadata whose chunks are stored as parallel arrays
+        
+        Args:
+            start_times: Chunk start times in seconds
+            end_times: Chunk end times in seconds
+            file_paths: Chunk audio files, in chunk order
+            source_file: File the chunks were cut from
+            **fields: Remaining ProcessingMetadata fields
+        """
+        chunks = ChunkArrays(start_times, end_times, file_paths, source_file)
+        return cls(chunks=chunks, **fields)
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization"""
-        data = asdict(self)
+        data = asdict(replace(self, chunks=[]))
         data['processed_at'] = self.processed_at.isoformat()
         data['original_file'] = str(self.original_file)
-        data['chunks'] = [chunk.to_dict() for chunk in self.chunks]
+        data['chunks'] = _chunk_dicts(self.chunks)
         return data
     
     def save(self, path: Path):
         """Save metadata to JSON file"""
-        with open(path, 'w') as f:
-            json.dump(self.to_dict(), f, indent=2)
+        Path(path).write_bytes(dump_json(self.to_dict()))
     
     @classmethod
     def load(cls, path: Path) -> 'ProcessingMetadata':
         """Load metadata from JSON file"""
-        with open(path) as f:
-            data = json.load(f)
+        data = load_json(Path(path).read_bytes())
         
-        # Convert back to proper types
+        # Convert back to proper types; chunks share one Path per source file
         data['processed_at'] = datetime.fromisoformat(data['processed_at'])
         data['original_file'] = Path(data['original_file'])
+        source_files = {chunk['source_file'] for chunk in data['chunks']}
+        source_paths = {source: Path(source) for source in source_files}
         data['chunks'] = [
             ChunkMetadata(
                 chunk_index=chunk['chunk_index'],
@@ -71,7 +176,7 @@ class ProcessingMetadata:
                 end_time=chunk['end_time'],
                 duration=chunk['duration'],
                 file_path=Path(chunk['file_path']),
-                source_file=Path(chunk['source_file'])
+                source_file=source_paths[chunk['source_file']]
             )
             for chunk in data['chunks']
         ]
@@ -116,17 +221,15 @@ class MetadataManager:
             "original_file": str(processing_metadata.original_file),
             "total_chunks": len(processing_metadata.chunks),
             "audio_info": processing_metadata.audio_info,
-            "chunks": [chunk.to_dict() for chunk in processing_metadata.chunks]
+            "chunks": _chunk_dicts(processing_metadata.chunks)
         }
         
         manifest_path = output_dir / f"{processing_metadata.file_id}_manifest.json"
-        with open(manifest_path, 'w') as f:
-            json.dump(manifest, f, indent=2)
+        manifest_path.write_bytes(dump_json(manifest))
         
         return manifest_path
     
     @staticmethod
     def load_manifest(manifest_path: Path) -> Dict[str, Any]:
         """Load manifest file"""
-        with open(manifest_path) as f:
-            return json.load(f)
\ No newline at end of file
+        return load_json(manifest_path.read_bytes())
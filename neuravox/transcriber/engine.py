@@ -1,17 +1,193 @@
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple
 import asyncio
 import datetime
+import functools
+import importlib
+import itertools
 import json
-import librosa
+import re
+import threading
+import time
+import soundfile as sf
+
+try:
+    import mutagen
+except ImportError:
+    mutagen = None
 
 from neuravox.shared.config import UnifiedConfig
+from neuravox.shared.file_utils import dump_json
 from neuravox.shared.logging_config import get_engine_logger
-from neuravox.transcriber.models.google_ai import GoogleAIModel
-from neuravox.transcriber.models.openai import OpenAIModel
-from neuravox.transcriber.models.whisper_local import LocalWhisperModel
+from neuravox.transcriber.models.base import AudioTranscriptionModel
 from neuravox.shared.metadata import ProcessingMetadata, TranscriptionMetadata
 
+# Backend classes by provider, imported on first use so only the selected SDK loads
+_PROVIDERS = {
+    "google": ("neuravox.transcriber.models.google_ai", "GoogleAIModel"),
+    "openai": ("neuravox.transcriber.models.openai", "OpenAIModel"),
+    "whisper-local": ("neuravox.transcriber.models.whisper_local", "LocalWhisperModel"),
+}
+
+# Model instances shared by all transcribers, keyed by
+# (provider, model_id, device, parameters)
+_MODEL_CACHE: Dict[tuple, Any] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+
+_TRANSCRIPT_TEMPLATE = """# Transcription: {name}
+
+**Source File:** `{name}`  
+**Model:** {model_name} (`{model_key}`)  
+**Audio Duration:** {duration}  
+**File Size:** {size}  
+**Sample Rate:** {sample_rate} Hz  
+**Format:** {file_format}  
+**Transcribed:** {transcribed}  
+**Processing Time:** {processing_time}  
+
+---
+
+## Transcription
+
+{text}
+
+---
+
+*Generated by Audio Transcriber using {model_name}*  
+*Processing completed in {processing_time} on {completed}*
+"""
+
+_CHUNKS_TEMPLATE = """# Transcription: {name}
+
+**Source File:** `{name}`  
+**File ID:** `{file_id}`  
+**Model:** {model_name} (`{model_key}`)  
+**Audio Duration:** {duration}  
+**File Size:** {size}  
+**Sample Rate:** {sample_rate} Hz  
+**Format:** {file_format}  
+**Chunks Processed:** {chunk_count}  
+**Transcribed:** {transcribed}  
+**Processing Time:** {processing_time}  
+
+---
+
+## Processing Information
+
+**Silence Detection Threshold:** {silence_threshold}  
+**Minimum Silence Duration:** {min_silence_duration}s  
+**Audio Processing Time:** {audio_processing_time:.1f}s  
+
+---
+
+## Combined Transcription
+
+{text}
+
+---
+
+## Chunk Details
+
+{chunk_sections}
+---
+
+*Generated by Audio Workflow Platform using {model_name}*  
+*Processing completed in {processing_time} on {completed}*
+"""
+
+_CHUNK_SECTION_TEMPLATE = "\n### Chunk {number} ({start:.1f}m - {end:.1f}m)\n\n{text}\n"
+
+
+def _human_duration(seconds: float) -> str:
+    """Format a duration in the largest fitting unit"""
+    if seconds > 3600:
+        return f"{seconds / 3600:.1f} hours"
+    if seconds > 60:
+        return f"{seconds / 60:.1f} minutes"
+    return f"{seconds:.1f} seconds"
+
+
+def _human_size(size: int) -> str:
+    """Format a byte count as MB, KB or bytes"""
+    if size > 1024 * 1024:
+        return f"{size / (1024 * 1024):.1f} MB"
+    if size > 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size} bytes"
+
+
+# Whitespace-separated words, as str.split() sees them
+_WORD_RE = re.compile(r"\S+")
+
+
+def _count_words(text: str) -> int:
+    """Count words without building the list str.split() would return"""
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_audio_info(path: str, mtime_ns: int, size: int) -> Tuple[float, int, int]:
+    """
+    Read (duration, sample_rate, channels) for an audio file.
+    
+    Tries mutagen (if installed), then libsndfile, then decoding with librosa.
+    Cached per path; mtime and size are part of the key so a changed file
+    is read again.
+    """
+    if mutagen is not None:
+        # Container headers give the length of mp3/m4a/ogg without any decoding
+        try:
+            audio = mutagen.File(path)
+        except Exception:
+            audio = None
+        info = getattr(audio, "info", None)
+        if info is not None and getattr(info, "sample_rate", None):
+            return float(info.length), int(info.sample_rate), getattr(info, "channels", 1)
+    
+    try:
+        # libsndfile formats: everything is in the header, no samples decoded
+        info = sf.info(path)
+        return float(info.duration), int(info.samplerate), info.channels
+    except RuntimeError:
+        # Formats libsndfile can't open go through librosa's decoders
+        import librosa
+        duration = librosa.get_duration(path=path)
+        y, sr = librosa.load(path, sr=None, mono=False, duration=1.0)
+        return float(duration), int(sr), 1 if y.ndim == 1 else y.shape[0]
+
+
+def _group_chunks(chunks: list, batch_size: int) -> List[list]:
+    """
+    Order chunks longest first and split them into batches.
+    
+    Starting the longest chunks first keeps a slow straggler from finishing
+    last; batches never mix power-of-two duration buckets, so batched
+    backends pad every clip in a batch to a similar length.
+    """
+    ordered = sorted(chunks, key=lambda c: c.end_time - c.start_time, reverse=True)
+    if batch_size == 1:
+        return [[chunk] for chunk in ordered]
+    
+    groups = []
+    buckets = itertools.groupby(ordered, key=lambda c: int(c.end_time - c.start_time).bit_length())
+    for _, bucket in buckets:
+        bucket = list(bucket)
+        groups.extend(bucket[i:i + batch_size] for i in range(0, len(bucket), batch_size))
+    return groups
+
+
+def _write_outputs(outputs: List[Tuple[Path, Any]]) -> None:
+    """Write text outputs, serializing anything else as JSON; run off the event loop"""
+    for path, content in outputs:
+        payload = content.encode("utf-8") if isinstance(content, str) else dump_json(content)
+        path.write_bytes(payload)
+
+
+def _append_records(sidecar, records: List[Dict[str, Any]]) -> None:
+    """Append NDJSON records to an open sidecar file; run off the event loop"""
+    sidecar.write(b"".join(dump_json(record, indent=None) + b"\n" for record in records))
+
 
 class AudioTranscriber:
     """Core audio transcription engine."""
@@ -23,6 +199,12 @@ class AudioTranscriber:
         
         self.logger.info("Transcription engine initialized")
     
+    @staticmethod
+    def clear_model_cache():
+        """Drop the shared model instances (transcribers keep their own reference)."""
+        with _MODEL_CACHE_LOCK:
+            _MODEL_CACHE.clear()
+    
     def get_model(self, model_key: str):
         """Get or create a model instance."""
         if model_key not in self._models:
@@ -38,47 +220,61 @@ class AudioTranscriber:
             if model_config.system_prompt:
                 model_kwargs['system_prompt'] = model_config.system_prompt
             
-            # Create model instance based on provider
-            # API keys are now handled by the model classes directly from environment
-            try:
-                if model_config.provider == "google":
-                    self._models[model_key] = GoogleAIModel(
-                        model_id=model_config.model_id,
-                        **model_kwargs
-                    )
-                elif model_config.provider == "openai":
-                    self._models[model_key] = OpenAIModel(
-                        model_id=model_config.model_id,
-                        **model_kwargs
-                    )
-                elif model_config.provider == "whisper-local":
-                    self._models[model_key] = LocalWhisperModel(
-                        model_id=model_config.model_id,
-                        device=model_config.device,
-                        **model_kwargs
-                    )
-                else:
-                    error_msg = f"Unsupported provider: {model_config.provider}"
-                    self.logger.error(error_msg, provider=model_config.provider, model_key=model_key)
-                    raise ValueError(error_msg)
-                
-                self.logger.info(
-                    f"Model loaded successfully",
-                    model_key=model_key,
-                    provider=model_config.provider,
-                    model_id=model_config.model_id
+            # Reuse an instance another transcriber already created with the same settings
+            cache_key = (
+                model_config.provider,
+                model_config.model_id,
+                model_config.device,
+                json.dumps(model_kwargs, sort_keys=True, default=str)
+            )
+            with _MODEL_CACHE_LOCK:
+                if cache_key not in _MODEL_CACHE:
+                    _MODEL_CACHE[cache_key] = self._create_model(model_key, model_config, model_kwargs)
+                self._models[model_key] = _MODEL_CACHE[cache_key]
+        
+        return self._models[model_key]
+    
+    def _create_model(self, model_key: str, model_config, model_kwargs: Dict[str, Any]):
+        """Create a model instance for the configured provider."""
+        # Create model instance based on provider
+        # API keys are now handled by the model classes directly from environment
+        try:
+            if model_config.provider not in _PROVIDERS:
+                error_msg = f"Unsupported provider: {model_config.provider}"
+                self.logger.error(error_msg, provider=model_config.provider, model_key=model_key)
+                raise ValueError(error_msg)
+            
+            module_name, class_name = _PROVIDERS[model_config.provider]
+            model_class = getattr(importlib.import_module(module_name), class_name)
+            if model_config.provider == "whisper-local":
+                model = model_class(
+                    model_id=model_config.model_id,
+                    device=model_config.device,
+                    **model_kwargs
                 )
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to load model {model_key}",
-                    model_key=model_key,
-                    provider=model_config.provider,
-                    error=str(e),
-                    exc_info=True
+            else:
+                model = model_class(
+                    model_id=model_config.model_id,
+                    **model_kwargs
                 )
-                raise
+            
+            self.logger.info(
+                f"Model loaded successfully",
+                model_key=model_key,
+                provider=model_config.provider,
+                model_id=model_config.model_id
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Failed to load model {model_key}",
+                model_key=model_key,
+                provider=model_config.provider,
+                error=str(e),
+                exc_info=True
+            )
+            raise
         
-        return self._models[model_key]
+        return model
     
     async def transcribe_file(
         self, 
@@ -113,19 +309,17 @@ class AudioTranscriber:
             self.logger.error(error_msg, model_key=model_key)
             raise RuntimeError(error_msg)
         
-        # Get audio metadata using librosa
+        # Get audio metadata from the file header
         audio_metadata = self._get_audio_metadata(audio_path)
         
-        # Record start time
+        # Record start time; the monotonic clock measures, the wall clock labels
         start_time = datetime.datetime.now()
+        started = time.perf_counter()
         
         try:
             # Perform transcription
             transcription = await model.transcribe(audio_path)
-            
-            # Record end time
-            end_time = datetime.datetime.now()
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - started
             
             # Only create output directory after successful transcription
             output_dir.mkdir(parents=True, exist_ok=True)
@@ -145,10 +339,6 @@ class AudioTranscriber:
                 audio_metadata=audio_metadata
             )
             
-            # Save transcription
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
-            
             # Prepare metadata
             metadata = {
                 "source_file": str(audio_path),
@@ -159,13 +349,15 @@ class AudioTranscriber:
                 "timestamp": start_time.isoformat(),
                 "audio_metadata": audio_metadata,
                 "character_count": len(transcription),
-                "word_count": len(transcription.split())
+                "word_count": _count_words(transcription)
             }
             
-            # Save metadata
+            # Save transcription and metadata in one worker thread hop
             metadata_file = output_dir / f"{audio_path.stem}_metadata.json"
-            with open(metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(metadata, f, indent=2)
+            await asyncio.to_thread(_write_outputs, [
+                (output_file, markdown_content),
+                (metadata_file, metadata)
+            ])
             
             return {
                 "success": True,
@@ -180,23 +372,17 @@ class AudioTranscriber:
             raise RuntimeError(f"Transcription failed: {e}")
     
     def _get_audio_metadata(self, audio_path: Path) -> Dict[str, Any]:
-        """Extract metadata from audio file using librosa."""
+        """Extract metadata from the audio file header, decoding only as a fallback."""
         try:
-            # Get duration without loading full audio
-            duration = librosa.get_duration(path=str(audio_path))
-            
-            # Load a small sample to get sample rate
-            y, sr = librosa.load(str(audio_path), sr=None, duration=1.0)
-            
-            # Get file size
-            file_size = audio_path.stat().st_size
+            stat = audio_path.stat()
+            duration, sr, channels = _read_audio_info(str(audio_path), stat.st_mtime_ns, stat.st_size)
             
             return {
-                "duration_seconds": float(duration),
-                "sample_rate": int(sr),
-                "file_size_bytes": file_size,
+                "duration_seconds": duration,
+                "sample_rate": sr,
+                "file_size_bytes": stat.st_size,
                 "file_format": audio_path.suffix.lower(),
-                "channels": 1 if y.ndim == 1 else y.shape[0]
+                "channels": channels
             }
             
         except Exception as e:
@@ -238,22 +424,9 @@ class AudioTranscriber:
                         "error": str(e)
                     }
         
-        # Run transcriptions concurrently
+        # Run transcriptions concurrently; failures already come back as result dicts
         tasks = [transcribe_with_semaphore(audio_file) for audio_file in audio_files]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-        
-        # Handle any exceptions
-        processed_results = []
-        for result in results:
-            if isinstance(result, Exception):
-                processed_results.append({
-                    "success": False,
-                    "error": str(result)
-                })
-            else:
-                processed_results.append(result)
-        
-        return processed_results
+        return await asyncio.gather(*tasks)
     
     def validate_model(self, model_key: str) -> bool:
         """Validate that a model is properly configured and available."""
@@ -299,63 +472,27 @@ class AudioTranscriber:
         audio_metadata: Dict[str, Any]
     ) -> str:
         """Format transcription content as Markdown."""
-        
-        # Format duration nicely
-        audio_duration = audio_metadata.get("duration_seconds", 0)
-        if audio_duration > 3600:
-            duration_str = f"{audio_duration / 3600:.1f} hours"
-        elif audio_duration > 60:
-            duration_str = f"{audio_duration / 60:.1f} minutes"
-        else:
-            duration_str = f"{audio_duration:.1f} seconds"
-        
-        # Format transcription time
-        if duration > 60:
-            transcription_time_str = f"{duration / 60:.1f} minutes"
-        else:
-            transcription_time_str = f"{duration:.1f} seconds"
-        
-        # Format file size
-        file_size = audio_metadata.get("file_size_bytes", 0)
-        if file_size > 1024 * 1024:
-            size_str = f"{file_size / (1024 * 1024):.1f} MB"
-        elif file_size > 1024:
-            size_str = f"{file_size / 1024:.1f} KB"
-        else:
-            size_str = f"{file_size} bytes"
-        
-        # Build Markdown content
-        markdown_content = f"""# Transcription: {audio_path.name}
-
-**Source File:** `{audio_path.name}`  
-**Model:** {model_name} (`{model_key}`)  
-**Audio Duration:** {duration_str}  
-**File Size:** {size_str}  
-**Sample Rate:** {audio_metadata.get("sample_rate", "Unknown")} Hz  
-**Format:** {audio_metadata.get("file_format", "Unknown")}  
-**Transcribed:** {start_time.strftime("%Y-%m-%d %H:%M:%S")}  
-**Processing Time:** {transcription_time_str}  
-
----
-
-## Transcription
-
-{transcription.strip()}
-
----
-
-*Generated by Audio Transcriber using {model_name}*  
-*Processing completed in {transcription_time_str} on {start_time.strftime("%B %d, %Y at %H:%M:%S")}*
-"""
-        
-        return markdown_content
+        return _TRANSCRIPT_TEMPLATE.format_map({
+            "name": audio_path.name,
+            "model_name": model_name,
+            "model_key": model_key,
+            "duration": _human_duration(audio_metadata.get("duration_seconds", 0)),
+            "size": _human_size(audio_metadata.get("file_size_bytes", 0)),
+            "sample_rate": audio_metadata.get("sample_rate", "Unknown"),
+            "file_format": audio_metadata.get("file_format", "Unknown"),
+            "transcribed": start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "processing_time": _human_duration(duration),
+            "completed": start_time.strftime("%B %d, %Y at %H:%M:%S"),
+            "text": transcription.strip()
+        })
     
     async def transcribe_chunks(
         self,
         processing_metadata: ProcessingMetadata,
         model_key: str,
         output_dir: Path,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        max_concurrent: Optional[int] = None
     ) -> Dict[str, Any]:
         """
         Transcribe audio chunks based on processing metadata
@@ -365,6 +502,8 @@ class AudioTranscriber:
             model_key: Key of the model to use
             output_dir: Directory to save transcriptions
             progress_callback: Optional callback for progress updates
+            max_concurrent: Maximum number of chunks in flight (defaults to
+                the transcription.max_concurrent setting)
             
         Returns:
             Dictionary with combined transcription and metadata
@@ -377,92 +516,156 @@ class AudioTranscriber:
         # Create output directory
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Transcribe each chunk
-        chunk_transcriptions = []
-        start_time = datetime.datetime.now()
-        
+        # Fail before any request is made if a chunk is missing
         for chunk in processing_metadata.chunks:
             if not chunk.file_path.exists():
                 raise FileNotFoundError(f"Chunk file not found: {chunk.file_path}")
+        
+        start_time = datetime.datetime.now()
+        started = time.perf_counter()
+        concurrency = max_concurrent or self.config.transcription.max_concurrent
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        # Models that override transcribe_batch take several chunks per call
+        base_batch = AudioTranscriptionModel.transcribe_batch
+        batches = getattr(type(model), "transcribe_batch", base_batch) is not base_batch
+        batch_size = model.config.get("batch_size", 8) if batches else 1
+        groups = _group_chunks(processing_metadata.chunks, batch_size)
+        
+        # Results land in their chunk's slot, so they come out in chunk order
+        # whatever order they finish in
+        chunk_transcriptions: List[Optional[Dict[str, Any]]] = [None] * len(processing_metadata.chunks)
+        slots = {chunk.chunk_index: i for i, chunk in enumerate(processing_metadata.chunks)}
+        
+        # Models that upload audio upload a window of groups ahead of the
+        # running ones, so no request waits on its upload. The uploads belong
+        # to this call, since the model instance is shared
+        prefetch = hasattr(model, "prefetch")
+        prefetched = {}
+        upload_args = (prefetched,) if prefetch else ()
+        upcoming = iter(groups)
+        
+        def prefetch_next(count: int):
+            if prefetch:
+                paths = [chunk.file_path for group in itertools.islice(upcoming, count) for chunk in group]
+                model.prefetch(paths, prefetched)
+        
+        async def transcribe_group(group):
+            async with semaphore:
+                prefetch_next(1)
+                try:
+                    if batch_size > 1:
+                        paths = [chunk.file_path for chunk in group]
+                        transcriptions = await model.transcribe_batch(paths, *upload_args)
+                    else:
+                        transcriptions = [await model.transcribe(group[0].file_path, *upload_args)]
+                    
+                    records = [
+                        {
+                            "chunk_index": chunk.chunk_index,
+                            "start_time": chunk.start_time,
+                            "end_time": chunk.end_time,
+                            "text": transcription
+                        }
+                        for chunk, transcription in zip(group, transcriptions)
+                    ]
+                    
+                    # Save individual chunk transcriptions and stream their sidecar records
+                    await asyncio.to_thread(_write_outputs, [
+                        (output_dir / f"chunk_{record['chunk_index']:03d}_transcript.txt", record["text"])
+                        for record in records
+                    ])
+                    await asyncio.to_thread(_append_records, sidecar, [
+                        {"type": "chunk", **record} for record in records
+                    ])
+                except Exception as e:
+                    indices = ", ".join(str(chunk.chunk_index) for chunk in group)
+                    raise RuntimeError(f"Failed to transcribe chunk {indices}: {e}")
             
-            try:
-                # Transcribe chunk
-                transcription = await model.transcribe(chunk.file_path)
-                
-                chunk_transcriptions.append({
-                    "chunk_index": chunk.chunk_index,
-                    "start_time": chunk.start_time,
-                    "end_time": chunk.end_time,
-                    "text": transcription
-                })
-                
-                # Save individual chunk transcription
-                chunk_output = output_dir / f"chunk_{chunk.chunk_index:03d}_transcript.txt"
-                with open(chunk_output, 'w', encoding='utf-8') as f:
-                    f.write(transcription)
-                
-                # Update progress
-                if progress_callback:
+            # Update progress
+            if progress_callback:
+                for _ in group:
                     progress_callback()
-                    
-            except Exception as e:
-                raise RuntimeError(f"Failed to transcribe chunk {chunk.chunk_index}: {e}")
-        
-        # Combine transcriptions
-        combined_text = "\n\n".join([
-            chunk["text"] for chunk in sorted(chunk_transcriptions, key=lambda x: x["chunk_index"])
-        ])
-        
-        # Calculate statistics
-        end_time = datetime.datetime.now()
-        transcription_time = (end_time - start_time).total_seconds()
-        word_count = len(combined_text.split())
-        char_count = len(combined_text)
-        
-        # Save combined transcription as markdown
-        combined_output = output_dir / f"{processing_metadata.file_id}_transcript.md"
-        
-        # Format combined transcription with metadata
-        markdown_content = self._format_chunks_transcription_as_markdown(
-            processing_metadata=processing_metadata,
-            chunk_transcriptions=chunk_transcriptions,
-            combined_text=combined_text,
-            model_name=model.name,
-            model_key=model_key,
-            start_time=start_time,
-            transcription_time=transcription_time
-        )
-        
-        with open(combined_output, 'w', encoding='utf-8') as f:
-            f.write(markdown_content)
-        
-        # Save transcription metadata
-        transcription_metadata = TranscriptionMetadata(
-            file_id=processing_metadata.file_id,
-            model_used=model_key,
-            transcribed_at=start_time,
-            transcription_time=transcription_time,
-            word_count=word_count,
-            char_count=char_count,
-            chunks_transcribed=len(processing_metadata.chunks),
-            combined=True
-        )
+            
+            for record in records:
+                chunk_transcriptions[slots[record["chunk_index"]]] = record
         
-        metadata_file = output_dir / f"{processing_metadata.file_id}_transcription_metadata.json"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            json.dump(transcription_metadata.to_dict(), f, indent=2)
+        # One NDJSON sidecar holds a record per chunk as it completes, then the summary
+        sidecar_file = output_dir / f"{processing_metadata.file_id}_transcription.ndjson"
+        sidecar = await asyncio.to_thread(open, sidecar_file, "wb")
         
-        # Save chunk details
-        chunks_file = output_dir / f"{processing_metadata.file_id}_chunks.json"
-        with open(chunks_file, 'w', encoding='utf-8') as f:
-            json.dump(chunk_transcriptions, f, indent=2)
+        try:
+            prefetch_next(2 * concurrency)
+            
+            # Transcribe chunks concurrently; requests are latency bound
+            tasks = [asyncio.create_task(transcribe_group(group)) for group in groups]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                # Fail fast: the first failure cancels the groups still running
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            finally:
+                if prefetch:
+                    await model.release_prefetched(prefetched)
+            
+            # Combine transcriptions
+            combined_text = "\n\n".join(chunk["text"] for chunk in chunk_transcriptions)
+            
+            # Calculate statistics
+            transcription_time = time.perf_counter() - started
+            word_count = _count_words(combined_text)
+            char_count = len(combined_text)
+            
+            # Save combined transcription as markdown
+            combined_output = output_dir / f"{processing_metadata.file_id}_transcript.md"
+            
+            # Format combined transcription with metadata
+            markdown_content = self._format_chunks_transcription_as_markdown(
+                processing_metadata=processing_metadata,
+                chunk_transcriptions=chunk_transcriptions,
+                combined_text=combined_text,
+                model_name=model.name,
+                model_key=model_key,
+                start_time=start_time,
+                transcription_time=transcription_time
+            )
+            
+            # Save transcription metadata
+            transcription_metadata = TranscriptionMetadata(
+                file_id=processing_metadata.file_id,
+                model_used=model_key,
+                transcribed_at=start_time,
+                transcription_time=transcription_time,
+                word_count=word_count,
+                char_count=char_count,
+                chunks_transcribed=len(processing_metadata.chunks),
+                combined=True
+            )
+            
+            def finish():
+                # Write the transcript and close the sidecar with its summary in one worker thread hop
+                _write_outputs([(combined_output, markdown_content)])
+                with sidecar:
+                    _append_records(sidecar, [{"type": "summary", **transcription_metadata.to_dict()}])
+            
+            await asyncio.to_thread(finish)
+        finally:
+            # Completed chunks stay in the sidecar if a group failed
+            if not sidecar.closed:
+                await asyncio.to_thread(sidecar.close)
         
         return {
             "success": True,
             "transcription": combined_text,
             "output_file": combined_output,
-            "metadata_file": metadata_file,
-            "chunks_file": chunks_file,
+            # One NDJSON file: a record per chunk, then the summary metadata.
+            # metadata_file and chunks_file are kept for existing callers
+            "sidecar_file": sidecar_file,
+            "metadata_file": sidecar_file,
+            "chunks_file": sidecar_file,
             "metadata": transcription_metadata.to_dict(),
             "chunks": chunk_transcriptions
         }
@@ -478,77 +681,34 @@ class AudioTranscriber:
         transcription_time: float
     ) -> str:
         """Format chunk-based transcription as Markdown."""
+        audio_info = processing_metadata.audio_info
+        params = processing_metadata.processing_params
+        chunk_sections = "".join(
+            _CHUNK_SECTION_TEMPLATE.format(
+                number=chunk["chunk_index"] + 1,
+                start=chunk["start_time"] / 60,
+                end=chunk["end_time"] / 60,
+                text=chunk["text"].strip()
+            )
+            for chunk in chunk_transcriptions
+        )
         
-        # Format duration
-        audio_duration = processing_metadata.audio_info.get("duration", 0)
-        if audio_duration > 3600:
-            duration_str = f"{audio_duration / 3600:.1f} hours"
-        elif audio_duration > 60:
-            duration_str = f"{audio_duration / 60:.1f} minutes"
-        else:
-            duration_str = f"{audio_duration:.1f} seconds"
-        
-        # Format transcription time
-        if transcription_time > 60:
-            transcription_time_str = f"{transcription_time / 60:.1f} minutes"
-        else:
-            transcription_time_str = f"{transcription_time:.1f} seconds"
-        
-        # Format file size
-        file_size = processing_metadata.audio_info.get("file_size", 0)
-        if file_size > 1024 * 1024:
-            size_str = f"{file_size / (1024 * 1024):.1f} MB"
-        elif file_size > 1024:
-            size_str = f"{file_size / 1024:.1f} KB"
-        else:
-            size_str = f"{file_size} bytes"
-        
-        # Build Markdown content
-        markdown_content = f"""# Transcription: {processing_metadata.original_file.name}
-
-**Source File:** `{processing_metadata.original_file.name}`  
-**File ID:** `{processing_metadata.file_id}`  
-**Model:** {model_name} (`{model_key}`)  
-**Audio Duration:** {duration_str}  
-**File Size:** {size_str}  
-**Sample Rate:** {processing_metadata.audio_info.get("sample_rate", "Unknown")} Hz  
-**Format:** {processing_metadata.audio_info.get("format", "Unknown")}  
-**Chunks Processed:** {len(processing_metadata.chunks)}  
-**Transcribed:** {start_time.strftime("%Y-%m-%d %H:%M:%S")}  
-**Processing Time:** {transcription_time_str}  
-
----
-
-## Processing Information
-
-**Silence Detection Threshold:** {processing_metadata.processing_params.get("silence_threshold", "N/A")}  
-**Minimum Silence Duration:** {processing_metadata.processing_params.get("min_silence_duration", "N/A")}s  
-**Audio Processing Time:** {processing_metadata.processing_time:.1f}s  
-
----
-
-## Combined Transcription
-
-{combined_text.strip()}
-
----
-
-## Chunk Details
-
-"""
-        
-        # Add chunk breakdown
-        for chunk in chunk_transcriptions:
-            start_min = chunk["start_time"] / 60
-            end_min = chunk["end_time"] / 60
-            markdown_content += f"\n### Chunk {chunk['chunk_index'] + 1} ({start_min:.1f}m - {end_min:.1f}m)\n\n"
-            markdown_content += f"{chunk['text'].strip()}\n"
-        
-        markdown_content += f"""
----
-
-*Generated by Audio Workflow Platform using {model_name}*  
-*Processing completed in {transcription_time_str} on {start_time.strftime("%B %d, %Y at %H:%M:%S")}*
-"""
-        
-        return markdown_content
\ No newline at end of file
+        return _CHUNKS_TEMPLATE.format_map({
+            "name": processing_metadata.original_file.name,
+            "file_id": processing_metadata.file_id,
+            "model_name": model_name,
+            "model_key": model_key,
+            "duration": _human_duration(audio_info.get("duration", 0)),
+            "size": _human_size(audio_info.get("file_size", 0)),
+            "sample_rate": audio_info.get("sample_rate", "Unknown"),
+            "file_format": audio_info.get("format", "Unknown"),
+            "chunk_count": len(processing_metadata.chunks),
+            "transcribed": start_time.strftime("%Y-%m-%d %H:%M:%S"),
+            "processing_time": _human_duration(transcription_time),
+            "silence_threshold": params.get("silence_threshold", "N/A"),
+            "min_silence_duration": params.get("min_silence_duration", "N/A"),
+            "audio_processing_time": processing_metadata.processing_time,
+            "completed": start_time.strftime("%B %d, %Y at %H:%M:%S"),
+            "text": combined_text.strip(),
+            "chunk_sections": chunk_sections
+        })
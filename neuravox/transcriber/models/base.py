@@ -1,8 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import AsyncIterator, Dict, Any, List, Optional
 from pathlib import Path
-import librosa
 import numpy as np
+import soundfile as sf
+from dotenv import load_dotenv
+
+# Load environment variables (API keys) for every backend; config validation
+# reads them too, so this stays at import time.
+# First try to load from ~/.neuravox/.env (production)
+neuravox_env = Path.home() / ".neuravox" / ".env"
+if neuravox_env.exists():
+    load_dotenv(neuravox_env)
+else:
+    # Fall back to local .env for development
+    load_dotenv()
 
 
 class AudioTranscriptionModel(ABC):
@@ -25,6 +36,35 @@ class AudioTranscriptionModel(ABC):
         """
         pass
     
+    async def stream_transcribe(self, audio_path: Path) -> AsyncIterator[str]:
+        """
+        Transcribe audio file, yielding text as it is finalized.
+        
+        Models that cannot produce partial results yield the full transcript once.
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Yields:
+            Consecutive pieces of the transcript
+        """
+        yield await self.transcribe(audio_path)
+    
+    async def transcribe_batch(self, audio_paths: List[Path]) -> List[str]:
+        """
+        Transcribe several audio files.
+        
+        Models that can share work across files override this; the default
+        transcribes them one at a time.
+        
+        Args:
+            audio_paths: Paths to the audio files
+            
+        Returns:
+            Transcribed text for each file, in order
+        """
+        return [await self.transcribe(audio_path) for audio_path in audio_paths]
+    
     @abstractmethod
     def is_available(self) -> bool:
         """Check if the model is available and properly configured."""
@@ -32,7 +72,9 @@ class AudioTranscriptionModel(ABC):
     
     def preprocess_audio(self, audio_path: Path) -> tuple[np.ndarray, int]:
         """
-        Load and preprocess audio file using librosa.
+        Load and preprocess audio file as mono float32 at its native rate.
+        
+        Formats libsndfile can read are decoded directly; others go through librosa.
         
         Args:
             audio_path: Path to the audio file
@@ -41,7 +83,14 @@ class AudioTranscriptionModel(ABC):
             Tuple of (audio_data, sample_rate)
         """
         try:
-            audio_data, sample_rate = librosa.load(str(audio_path), sr=None)
+            try:
+                audio_data, sample_rate = sf.read(str(audio_path), dtype="float32", always_2d=False)
+            except RuntimeError:
+                import librosa
+                return librosa.load(str(audio_path), sr=None)
+            if audio_data.ndim > 1:
+                # Downmix the same way librosa does
+                audio_data = audio_data.mean(axis=1, dtype=np.float32)
             return audio_data, sample_rate
         except Exception as e:
             raise ValueError(f"Failed to load audio file {audio_path}: {e}")
@@ -49,6 +98,7 @@ class AudioTranscriptionModel(ABC):
     def get_audio_duration(self, audio_path: Path) -> float:
         """Get audio duration in seconds."""
         try:
+            import librosa
             duration = librosa.get_duration(path=str(audio_path))
             return duration
         except Exception as e:
@@ -60,7 +110,14 @@ class AudioTranscriptionModel(ABC):
             return False
         
         try:
-            # Try to load first few seconds to validate format
+            # A readable header with samples is enough for libsndfile formats
+            return sf.info(str(audio_path)).frames > 0
+        except RuntimeError:
+            pass
+        
+        try:
+            # Other formats: try to decode the first second
+            import librosa
             librosa.load(str(audio_path), sr=None, duration=1.0)
             return True
         except Exception:
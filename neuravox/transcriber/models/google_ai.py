@@ -1,20 +1,127 @@
-import google.genai as genai
 from pathlib import Path
-import tempfile
+import asyncio
+import hashlib
+import importlib.util
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import threading
+import time
+from typing import AsyncIterator, List, Optional, Dict, Any
 
 from neuravox.transcriber.models.base import AudioTranscriptionModel
+from neuravox.shared.file_utils import calculate_file_hash, dump_json, load_json
 
-# Load environment variables from .env file
-# First try to load from ~/.neuravox/.env (production)
-neuravox_env = Path.home() / ".neuravox" / ".env"
-if neuravox_env.exists():
-    load_dotenv(neuravox_env)
-else:
-    # Fall back to local .env for development
-    load_dotenv()
+
+# Used when no system prompt is configured
+_DEFAULT_PROMPT = """Please transcribe the audio in this file. Provide only the transcribed text without any additional commentary, explanations, or formatting. 
+If there are multiple speakers, indicate speaker changes with [Speaker 1], [Speaker 2], etc.
+Ensure the transcription is accurate and includes proper punctuation."""
+
+# Separates per-file transcripts when several files share one request
+_BATCH_DELIMITER = "=====NEXT AUDIO FILE====="
+_BATCH_INSTRUCTIONS = """
+
+You will receive {count} audio files. Transcribe each one separately, in the order given.
+Output the transcripts in that order, separated by a line containing only {delimiter}"""
+
+
+class _TranscriptCache:
+    """On-disk transcript cache keyed by audio content hash.
+    
+    One JSON record per hash holds the transcript (per model and prompt) and
+    the name of the last uploaded Google file, so retries after a failed
+    generation can reuse the upload. Least recently used records are evicted
+    once the store grows a tenth past max_entries.
+    
+    The public methods are coroutines; file I/O runs in worker threads.
+    """
+    
+    def __init__(self, cache_dir: Path, max_entries: int = 256, upload_ttl: float = 3600.0):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.upload_ttl = upload_ttl
+        # Serializes read-modify-write updates; the record count is only
+        # taken from disk once, then tracked as records are added
+        self._lock = threading.Lock()
+        self._entries: Optional[int] = None
+    
+    @staticmethod
+    def transcript_key(model_id: str, prompt: str) -> str:
+        """Key transcripts by model and prompt so config changes miss the cache"""
+        prompt_digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:16]
+        return f"{model_id}:{prompt_digest}"
+    
+    def _record_path(self, sha: str) -> Path:
+        return self.cache_dir / f"{sha}.json"
+    
+    def _load(self, sha: str) -> Dict[str, Any]:
+        try:
+            return load_json(self._record_path(sha).read_bytes())
+        except (OSError, ValueError):
+            return {"sha": sha, "transcripts": {}}
+    
+    def _store(self, record: Dict[str, Any]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._record_path(record["sha"])
+        is_new = not path.exists()
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_bytes(dump_json(record, indent=None))
+        os.replace(tmp_path, path)
+        
+        if self._entries is None:
+            self._entries = sum(1 for _ in self.cache_dir.glob("*.json"))
+        elif is_new:
+            self._entries += 1
+        if self._entries > self.max_entries * 1.1:
+            self._evict()
+    
+    def _evict(self):
+        records = sorted(self.cache_dir.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        for path in records[:max(0, len(records) - self.max_entries)]:
+            path.unlink(missing_ok=True)
+        self._entries = min(len(records), self.max_entries)
+    
+    def _get_text(self, sha: str, key: str) -> Optional[str]:
+        text = self._load(sha)["transcripts"].get(key)
+        if text is not None:
+            try:
+                os.utime(self._record_path(sha))
+            except OSError:
+                pass  # Evicted meanwhile
+        return text
+    
+    def _get_upload(self, sha: str) -> Optional[str]:
+        record = self._load(sha)
+        uploaded_at = record.get("uploaded_at")
+        if record.get("google_file_name") and uploaded_at and time.time() - uploaded_at < self.upload_ttl:
+            return record["google_file_name"]
+        return None
+    
+    def _put_upload(self, sha: str, google_file_name: str):
+        with self._lock:
+            record = self._load(sha)
+            record.update(google_file_name=google_file_name, uploaded_at=time.time())
+            self._store(record)
+    
+    def _put_text(self, sha: str, key: str, text: str):
+        with self._lock:
+            record = self._load(sha)
+            record["transcripts"][key] = text
+            record.update(google_file_name=None, uploaded_at=None, created_at=time.time())
+            self._store(record)
+    
+    async def get_text(self, sha: str, key: str) -> Optional[str]:
+        """Return a cached transcript, refreshing the record's LRU position"""
+        return await asyncio.to_thread(self._get_text, sha, key)
+    
+    async def get_upload(self, sha: str) -> Optional[str]:
+        """Return the uploaded file name if it is still within the reuse window"""
+        return await asyncio.to_thread(self._get_upload, sha)
+    
+    async def put_upload(self, sha: str, google_file_name: str):
+        await asyncio.to_thread(self._put_upload, sha, google_file_name)
+    
+    async def put_text(self, sha: str, key: str, text: str):
+        await asyncio.to_thread(self._put_text, sha, key, text)
 
 
 class GoogleAIModel(AudioTranscriptionModel):
@@ -32,19 +139,44 @@ class GoogleAIModel(AudioTranscriptionModel):
                 "Please set the GOOGLE_API_KEY environment variable."
             )
         
-        self.client = genai.Client(api_key=self.api_key)
+        # Resolved once; config prompts are already merged in by UnifiedConfig
+        self.prompt = self.config.get("system_prompt") or _DEFAULT_PROMPT
+        self._transcript_key = _TranscriptCache.transcript_key(self.model_id, self.prompt)
+        
+        # Imported here so only the selected backend's SDK is loaded
+        import google.genai as genai
+        
+        # One client (and connection pool) per model; models are shared process-wide
+        http_options = {}
+        if self.config.get("timeout"):
+            http_options["timeout"] = int(self.config["timeout"] * 1000)
+        if importlib.util.find_spec("h2") is not None:
+            # Concurrent uploads and requests multiplex over a single HTTP/2 connection
+            http_options.update(client_args={"http2": True}, async_client_args={"http2": True})
+        self.client = genai.Client(api_key=self.api_key, http_options=http_options or None)
         self.model = self.client.models
+        
+        # Opt-in transcript cache: identical audio skips both upload and generation
+        self._cache = None
+        if self.config.get("use_cache", False):
+            cache_dir = self.config.get("cache_dir") or Path.home() / ".neuravox" / "cache" / "google"
+            self._cache = _TranscriptCache(
+                Path(cache_dir).expanduser(),
+                max_entries=self.config.get("cache_max_entries", 256),
+                upload_ttl=self.config.get("cache_upload_ttl", 3600.0)
+            )
     
     def is_available(self) -> bool:
         """Check if the model is available and properly configured."""
         return True  # If we got here, we have an API key
     
-    async def transcribe(self, audio_path: Path) -> str:
+    async def transcribe(self, audio_path: Path, prefetched: Optional[Dict[Path, asyncio.Task]] = None) -> str:
         """
         Transcribe audio file using Google AI Studio.
         
         Args:
             audio_path: Path to the audio file
+            prefetched: Uploads started by prefetch, used instead of uploading again
             
         Returns:
             Transcribed text
@@ -52,39 +184,255 @@ class GoogleAIModel(AudioTranscriptionModel):
         if not self.is_available():
             raise ValueError("Google AI model is not properly configured. Please set GOOGLE_API_KEY.")
         
-        if not self.validate_audio_file(audio_path):
-            raise ValueError(f"Invalid audio file: {audio_path}")
-        
         try:
-            # Upload the audio file
-            audio_file = self.client.files.upload(file=str(audio_path))
+            sha, cached_text, audio_file = await self._validate_and_upload(audio_path, prefetched)
+            if cached_text is not None:
+                return cached_text
             
-            # Get system prompt from configuration
-            prompt = self.config.get("system_prompt")
+            # Generate transcription
+            response = await self._generate_async(self.prompt, audio_file)
+            text = response.text.strip()
             
-            # If no configured prompt, use default hardcoded prompt
-            if not prompt:
-                prompt = """Please transcribe the audio in this file. Provide only the transcribed text without any additional commentary, explanations, or formatting. 
-If there are multiple speakers, indicate speaker changes with [Speaker 1], [Speaker 2], etc.
-Ensure the transcription is accurate and includes proper punctuation."""
+            if self._cache:
+                await self._cache.put_text(sha, self._transcript_key, text)
             
-            # Generate transcription
-            response = await self._generate_async(prompt, audio_file)
+            # Clean up uploaded file
+            await asyncio.to_thread(self.client.files.delete, name=audio_file.name)
+            
+            return text
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Google AI transcription failed: {e}")
+    
+    async def stream_transcribe(self, audio_path: Path) -> AsyncIterator[str]:
+        """
+        Transcribe audio file using Google AI Studio, yielding text as it is generated.
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Yields:
+            Consecutive pieces of the transcript
+        """
+        if not self.is_available():
+            raise ValueError("Google AI model is not properly configured. Please set GOOGLE_API_KEY.")
+        
+        try:
+            sha, cached_text, audio_file = await self._validate_and_upload(audio_path)
+            if cached_text is not None:
+                yield cached_text
+                return
+            
+            parts = []
+            stream = await self.client.aio.models.generate_content_stream(
+                model=self.model_id,
+                contents=[self.prompt, audio_file]
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    parts.append(chunk.text)
+                    yield chunk.text
+            
+            if self._cache:
+                await self._cache.put_text(sha, self._transcript_key, "".join(parts).strip())
             
             # Clean up uploaded file
-            self.client.files.delete(name=audio_file.name)
+            await asyncio.to_thread(self.client.files.delete, name=audio_file.name)
+            
+        except ValueError:
+            raise
+        except Exception as e:
+            raise RuntimeError(f"Google AI transcription failed: {e}")
+    
+    async def transcribe_batch(
+        self,
+        audio_paths: List[Path],
+        prefetched: Optional[Dict[Path, asyncio.Task]] = None
+    ) -> List[str]:
+        """
+        Transcribe several files with a single generate_content request.
+        
+        Cached files are skipped; if the response can't be split into one
+        transcript per file, the files are transcribed one by one instead.
+        
+        Args:
+            audio_paths: Paths to the audio files
+            prefetched: Uploads started by prefetch, used instead of uploading again
+            
+        Returns:
+            Transcribed text for each file, in order
+        """
+        if len(audio_paths) == 1:
+            return [await self.transcribe(audio_paths[0], prefetched)]
+        
+        if not self.is_available():
+            raise ValueError("Google AI model is not properly configured. Please set GOOGLE_API_KEY.")
+        
+        valid = await asyncio.gather(*(asyncio.to_thread(self.validate_audio_file, p) for p in audio_paths))
+        for audio_path, ok in zip(audio_paths, valid):
+            if not ok:
+                raise ValueError(f"Invalid audio file: {audio_path}")
+        
+        texts: List[Optional[str]] = [None] * len(audio_paths)
+        shas: List[Optional[str]] = [None] * len(audio_paths)
+        try:
+            if self._cache:
+                shas = await asyncio.gather(*(asyncio.to_thread(calculate_file_hash, p) for p in audio_paths))
+                texts = await asyncio.gather(*(self._cache.get_text(sha, self._transcript_key) for sha in shas))
+            pending = [i for i, text in enumerate(texts) if text is None]
+            if not pending:
+                return texts
+            
+            audio_files = await asyncio.gather(
+                *(self._take_upload(audio_paths[i], shas[i], prefetched) for i in pending)
+            )
+            prompt = self.prompt + _BATCH_INSTRUCTIONS.format(count=len(pending), delimiter=_BATCH_DELIMITER)
+            response = await asyncio.to_thread(
+                self.client.models.generate_content,
+                model=self.model_id,
+                contents=[prompt, *audio_files]
+            )
+            parts = [part.strip() for part in response.text.split(_BATCH_DELIMITER)]
+            if len(parts) != len(pending):
+                # The model merged or split transcripts; cached uploads are reused by the retry
+                if not self._cache:
+                    await self._delete_uploads(audio_files)
+                return [text if text is not None else await self.transcribe(audio_paths[i])
+                        for i, text in enumerate(texts)]
             
-            return response.text.strip()
+            for i, text in zip(pending, parts):
+                texts[i] = text
+                if self._cache:
+                    await self._cache.put_text(shas[i], self._transcript_key, text)
             
+            # Clean up uploaded files
+            await self._delete_uploads(audio_files)
+            return texts
+            
+        except ValueError:
+            raise
         except Exception as e:
             raise RuntimeError(f"Google AI transcription failed: {e}")
     
+    async def _delete_uploads(self, audio_files):
+        """Delete uploaded files in parallel, ignoring ones already gone"""
+        await asyncio.gather(
+            *(asyncio.to_thread(self.client.files.delete, name=f.name) for f in audio_files),
+            return_exceptions=True
+        )
+    
+    async def _validate_and_upload(self, audio_path: Path, prefetched: Optional[Dict[Path, asyncio.Task]] = None):
+        """
+        Validate the audio file while hashing and uploading it.
+        
+        Validation decodes the file locally, so it runs in a worker thread
+        alongside the cache lookup and the (network-bound) upload.
+        
+        Returns:
+            Tuple of (content hash, cached transcript, uploaded file); the
+            uploaded file is None on a cache hit
+        """
+        validation = asyncio.create_task(asyncio.to_thread(self.validate_audio_file, audio_path))
+        sha = cached_text = upload = None
+        try:
+            if self._cache:
+                sha = await asyncio.to_thread(calculate_file_hash, audio_path)
+                cached_text = await self._cache.get_text(sha, self._transcript_key)
+            if cached_text is None:
+                # Upload the audio file, reusing a recent upload left by a failed attempt
+                upload = asyncio.create_task(self._take_upload(audio_path, sha, prefetched))
+        except Exception:
+            # A missing or unreadable file fails hashing too; report it as invalid
+            if not await validation:
+                raise ValueError(f"Invalid audio file: {audio_path}")
+            raise
+        
+        if not await validation:
+            if upload:
+                # Don't leave the speculative upload behind
+                try:
+                    audio_file = await upload
+                    await asyncio.to_thread(self.client.files.delete, name=audio_file.name)
+                except Exception:
+                    pass
+            raise ValueError(f"Invalid audio file: {audio_path}")
+        
+        return sha, cached_text, await upload if upload else None
+    
+    def prefetch(self, audio_paths: List[Path], prefetched: Dict[Path, asyncio.Task]):
+        """
+        Start uploading files in the background, so a later transcribe call
+        only waits on generation.
+        
+        Upload tasks are added to the caller's prefetched map, keyed by path,
+        which is then passed to transcribe or transcribe_batch. The map
+        belongs to one caller, so concurrent callers sharing this model never
+        take or cancel each other's uploads.
+        
+        Uploads run in order, at most max_parallel_uploads at a time; files
+        whose transcript is already cached are skipped.
+        """
+        semaphore = asyncio.Semaphore(self.config.get("max_parallel_uploads", 2))
+        
+        async def upload(audio_path: Path):
+            async with semaphore:
+                sha = None
+                if self._cache:
+                    sha = await asyncio.to_thread(calculate_file_hash, audio_path)
+                    if await self._cache.get_text(sha, self._transcript_key) is not None:
+                        return None
+                return await self._get_or_upload(audio_path, sha)
+        
+        for audio_path in audio_paths:
+            if audio_path not in prefetched:
+                prefetched[audio_path] = asyncio.create_task(upload(audio_path))
+    
+    async def release_prefetched(self, prefetched: Dict[Path, asyncio.Task]):
+        """Cancel prefetches that were never used and delete their uploads"""
+        tasks = list(prefetched.values())
+        prefetched.clear()
+        for task in tasks:
+            task.cancel()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if not self._cache:
+            # Without the cache nothing would ever reuse these uploads
+            await self._delete_uploads([f for f in results if f is not None and not isinstance(f, BaseException)])
+    
+    async def _take_upload(
+        self,
+        audio_path: Path,
+        sha: Optional[str],
+        prefetched: Optional[Dict[Path, asyncio.Task]] = None
+    ):
+        """Use the prefetched upload for a file if there is one, otherwise upload now"""
+        task = prefetched.pop(audio_path, None) if prefetched else None
+        if task is not None:
+            try:
+                audio_file = await task
+                if audio_file is not None:
+                    return audio_file
+            except Exception:
+                pass  # Retry the upload below
+        return await self._get_or_upload(audio_path, sha)
+    
+    async def _get_or_upload(self, audio_path: Path, sha: Optional[str]):
+        """Fetch a still-valid cached upload, or upload the file and record it"""
+        if sha and (file_name := await self._cache.get_upload(sha)):
+            try:
+                return await asyncio.to_thread(self.client.files.get, name=file_name)
+            except Exception:
+                pass  # Remote file expired or was deleted; upload again
+        
+        audio_file = await asyncio.to_thread(self.client.files.upload, file=str(audio_path))
+        if sha:
+            await self._cache.put_upload(sha, audio_file.name)
+        return audio_file
+    
     async def _generate_async(self, prompt: str, audio_file):
         """Generate response asynchronously."""
         try:
-            # Note: google-genai doesn't have async support yet, so we'll use sync
-            # In a real implementation, you might want to use asyncio.to_thread
-            import asyncio
             return await asyncio.to_thread(
                 self.client.models.generate_content,
                 model=self.model_id,
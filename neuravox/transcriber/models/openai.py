@@ -1,20 +1,36 @@
-from openai import AsyncOpenAI
 from pathlib import Path
+import asyncio
 import os
-from typing import Optional
-from dotenv import load_dotenv
+import weakref
+from typing import Any, AsyncIterator, Dict, Optional
 
 from neuravox.transcriber.models.base import AudioTranscriptionModel
 
-# Load environment variables from .env file
-# First try to load from ~/.neuravox/.env (production)
-from pathlib import Path as PathLib
-neuravox_env = PathLib.home() / ".neuravox" / ".env"
-if neuravox_env.exists():
-    load_dotenv(neuravox_env)
-else:
-    # Fall back to local .env for development
-    load_dotenv()
+
+# Shared clients keyed by event loop, then API key. Model instances reuse one
+# connection pool (and its keep-alive TLS connections) per key, while never
+# carrying an httpx pool over to a different event loop.
+_CLIENTS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_client(api_key: str):
+    """Get the shared AsyncOpenAI client for this API key on the running loop"""
+    clients = _CLIENTS.setdefault(asyncio.get_running_loop(), {})
+    if api_key not in clients:
+        # Imported here so only the selected backend's SDK is loaded
+        import httpx
+        from openai import AsyncOpenAI
+        
+        clients[api_key] = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=2,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32)
+            )
+        )
+    return clients[api_key]
 
 
 class OpenAIModel(AudioTranscriptionModel):
@@ -31,8 +47,11 @@ class OpenAIModel(AudioTranscriptionModel):
                 "OpenAI API key not found. "
                 "Please set the OPENAI_API_KEY environment variable."
             )
-        
-        self.client = AsyncOpenAI(api_key=self.api_key)
+
+    @property
+    def client(self):
+        """Shared AsyncOpenAI client (must be accessed from a running event loop)"""
+        return _get_client(self.api_key)
     
     def is_available(self) -> bool:
         """Check if the model is available and properly configured."""
@@ -51,31 +70,19 @@ class OpenAIModel(AudioTranscriptionModel):
         if not self.is_available():
             raise ValueError("OpenAI model is not properly configured. Please set OPENAI_API_KEY.")
         
-        if not self.validate_audio_file(audio_path):
+        # Validation stats and decodes the file; keep it off the event loop
+        if not await asyncio.to_thread(self.validate_audio_file, audio_path):
             raise ValueError(f"Invalid audio file: {audio_path}")
         
         try:
-            # Get system prompt from configuration
-            whisper_prompt = self.config.get("system_prompt")
-            
-            # Prepare parameters from config
-            params = {
-                "model": self.model_id,
-                "response_format": self.config.get("response_format", "text"),
-                "language": self.config.get("language"),  # Optional: specify language
-                "prompt": whisper_prompt if whisper_prompt else None,  # Optional: guide the model
-                "temperature": self.config.get("temperature", 0.0)  # Deterministic by default
-            }
+            params = self._request_params()
             
-            # Remove None values
-            params = {k: v for k, v in params.items() if v is not None}
-            
-            # Open and transcribe the audio file
-            with open(audio_path, "rb") as audio_file:
-                transcript = await self.client.audio.transcriptions.create(
-                    file=audio_file,
-                    **params
-                )
+            # Read the audio in a worker thread, then upload it as (name, bytes)
+            audio_bytes = await asyncio.to_thread(audio_path.read_bytes)
+            transcript = await self.client.audio.transcriptions.create(
+                file=(audio_path.name, audio_bytes),
+                **params
+            )
             
             # Handle different response formats
             if isinstance(transcript, str):
@@ -86,6 +93,66 @@ class OpenAIModel(AudioTranscriptionModel):
         except Exception as e:
             raise RuntimeError(f"OpenAI transcription failed: {e}")
     
+    async def stream_transcribe(self, audio_path: Path) -> AsyncIterator[str]:
+        """
+        Transcribe audio file using OpenAI, yielding text as it arrives.
+        
+        gpt-4o transcription models stream text deltas; whisper-1 cannot
+        stream, so its transcript is yielded segment by segment.
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Yields:
+            Consecutive pieces of the transcript
+        """
+        if not self.is_available():
+            raise ValueError("OpenAI model is not properly configured. Please set OPENAI_API_KEY.")
+        
+        if not await asyncio.to_thread(self.validate_audio_file, audio_path):
+            raise ValueError(f"Invalid audio file: {audio_path}")
+        
+        try:
+            params = self._request_params()
+            audio_bytes = await asyncio.to_thread(audio_path.read_bytes)
+            
+            if self.model_id.startswith("whisper"):
+                params["response_format"] = "verbose_json"
+                transcript = await self.client.audio.transcriptions.create(
+                    file=(audio_path.name, audio_bytes),
+                    **params
+                )
+                for segment in transcript.segments or []:
+                    yield segment.text
+            else:
+                stream = await self.client.audio.transcriptions.create(
+                    file=(audio_path.name, audio_bytes),
+                    stream=True,
+                    **params
+                )
+                async for event in stream:
+                    if event.type == "transcript.text.delta":
+                        yield event.delta
+                        
+        except Exception as e:
+            raise RuntimeError(f"OpenAI transcription failed: {e}")
+    
+    def _request_params(self) -> Dict[str, Any]:
+        """Build transcription request parameters from the model config."""
+        # Get system prompt from configuration
+        whisper_prompt = self.config.get("system_prompt")
+        
+        params = {
+            "model": self.model_id,
+            "response_format": self.config.get("response_format", "text"),
+            "language": self.config.get("language"),  # Optional: specify language
+            "prompt": whisper_prompt if whisper_prompt else None,  # Optional: guide the model
+            "temperature": self.config.get("temperature", 0.0)  # Deterministic by default
+        }
+        
+        # Remove None values
+        return {k: v for k, v in params.items() if v is not None}
+    
     def get_supported_formats(self) -> list[str]:
         """Get list of supported audio formats for OpenAI Whisper."""
         return [
@@ -1,9 +1,14 @@
-import whisper
 from pathlib import Path
-from typing import Optional, Dict, Any
-import torch
+from typing import Optional, Dict, Any, AsyncIterator, Iterator, List
+import asyncio
+import importlib.util
+import math
+import re
+import shutil
+import threading
 import warnings
 import os
+import numpy as np
 from dotenv import load_dotenv
 
 from neuravox.transcriber.models.base import AudioTranscriptionModel
@@ -11,6 +16,98 @@ from neuravox.transcriber.models.base import AudioTranscriptionModel
 # Load environment variables from .env file
 load_dotenv()
 
+# Whisper models consume 16 kHz mono audio in 30-second windows
+SAMPLE_RATE = 16000
+
+# Loaded models shared by all instances, keyed by
+# (backend, model_id, device, precision, compute_type, compile); each entry
+# is (model, lock), and the lock serializes inference on that model
+_MODEL_CACHE: Dict[tuple, tuple] = {}
+_MODEL_CACHE_LOCK = threading.Lock()
+
+# Formats decoded in-process with libsndfile instead of an ffmpeg subprocess
+LIBSNDFILE_FORMATS = (".wav", ".flac", ".ogg")
+
+
+def _decode_with_soundfile(audio_path: Path) -> np.ndarray:
+    """Decode to 16 kHz mono float32 the way whisper.load_audio does, without ffmpeg."""
+    import soundfile as sf
+    from scipy.signal import resample_poly
+    
+    samples, sample_rate = sf.read(str(audio_path), dtype="float32", always_2d=True)
+    samples = samples.mean(axis=1) if samples.shape[1] > 1 else samples[:, 0]
+    if sample_rate != SAMPLE_RATE:
+        divisor = math.gcd(SAMPLE_RATE, sample_rate)
+        samples = resample_poly(samples, SAMPLE_RATE // divisor, sample_rate // divisor)
+    return np.ascontiguousarray(samples, dtype=np.float32)
+
+# Files shorter than this are passed to Whisper untrimmed
+VAD_MIN_DURATION = 5.0
+
+
+def _speech_regions(samples: np.ndarray, threshold: float = 0.01, padding: float = 0.5,
+                    min_silence: float = 2.0, frame_length: int = 512) -> List[tuple]:
+    """Find (start, end) sample ranges with speech using frame RMS energy."""
+    n_frames = len(samples) // frame_length
+    if n_frames == 0:
+        return [(0, len(samples))]
+    
+    frames = samples[:n_frames * frame_length].reshape(n_frames, frame_length)
+    rms = np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_length)
+    speech_mask = rms >= threshold
+    if not speech_mask.any():
+        return []
+    
+    edges = np.diff(np.concatenate(([False], speech_mask, [False])).astype(np.int8))
+    starts = np.flatnonzero(edges == 1) * frame_length
+    ends = np.flatnonzero(edges == -1) * frame_length
+    
+    # Pad each region and bridge gaps too short to be worth cutting
+    pad = int(padding * SAMPLE_RATE)
+    min_gap = int(min_silence * SAMPLE_RATE)
+    regions = []
+    for start, end in zip(starts, ends):
+        start, end = max(int(start) - pad, 0), min(int(end) + pad, len(samples))
+        if regions and start - regions[-1][1] < min_gap:
+            regions[-1] = (regions[-1][0], end)
+        else:
+            regions.append((start, end))
+    return regions
+
+
+def _restore_timestamps(segments: List[Dict[str, Any]], regions: List[tuple]) -> None:
+    """Map segment times in speech-only audio back to the original audio, in place."""
+    lengths = np.array([end - start for start, end in regions])
+    trimmed_starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    original_starts = np.array([start for start, _ in regions])
+    
+    def restore(seconds: float) -> float:
+        position = seconds * SAMPLE_RATE
+        index = max(int(np.searchsorted(trimmed_starts, position, side="right")) - 1, 0)
+        return float(original_starts[index] + position - trimmed_starts[index]) / SAMPLE_RATE
+    
+    for segment in segments:
+        segment["start"] = restore(segment["start"])
+        segment["end"] = restore(segment["end"])
+        for word in segment.get("words") or []:
+            word["start"] = restore(word["start"])
+            word["end"] = restore(word["end"])
+
+
+def _normalize_word(word: str) -> str:
+    """Lowercase a word and strip punctuation for overlap matching."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def _drop_overlap(previous: List[str], current: List[str], max_words: int = 20) -> List[str]:
+    """Drop the leading words of a window that repeat the tail of the previous one."""
+    prev = [_normalize_word(w) for w in previous[-max_words:]]
+    curr = [_normalize_word(w) for w in current[:max_words]]
+    for size in range(min(len(prev), len(curr)), 0, -1):
+        if prev[-size:] == curr[:size]:
+            return current[size:]
+    return current
+
 
 class LocalWhisperModel(AudioTranscriptionModel):
     """Local Whisper model for offline audio transcription."""
@@ -31,6 +128,16 @@ class LocalWhisperModel(AudioTranscriptionModel):
         "turbo": "809M parameters - Optimized for speed"
     }
     
+    # Supported inference backends
+    BACKENDS = ("openai-whisper", "faster-whisper")
+    
+    # Dependency probes, cached since they don't change during a process lifetime
+    _FFMPEG_OK: Optional[bool] = None
+    _BACKEND_OK: Dict[str, bool] = {}
+    
+    # Weight precisions; None picks fp16 on CUDA and fp32 on CPU
+    PRECISIONS = ("fp16", "int8", "fp32")
+    
     def __init__(self, model_id: str = None, device: Optional[str] = None, **kwargs):
         """
         Initialize local Whisper model.
@@ -56,50 +163,148 @@ class LocalWhisperModel(AudioTranscriptionModel):
         super().__init__(name=f"Whisper {model_id} (Local)", config=kwargs)
         self.model_id = model_id
         self.device = device
+        
+        # "openai-whisper" (reference PyTorch) or "faster-whisper" (CTranslate2)
+        self.backend = self.config.get("backend", os.getenv("WHISPER_BACKEND", "openai-whisper"))
+        if self.backend not in self.BACKENDS:
+            raise ValueError(f"Invalid Whisper backend: {self.backend}. Available: {list(self.BACKENDS)}")
+        self.precision = self.config.get("precision", None)
+        if self.precision is not None and self.precision not in self.PRECISIONS:
+            raise ValueError(f"Invalid Whisper precision: {self.precision}. Available: {list(self.PRECISIONS)}")
         self.model = None
         self._model_loaded = False
+        self._batched_pipeline = None
+        # Replaced by the shared lock of the cached model entry once loaded
+        self._inference_lock = threading.RLock()
         
         # Suppress warnings about FP16 on CPU
         warnings.filterwarnings("ignore", message="FP16 is not supported on CPU")
     
     def _load_model(self):
-        """Load the Whisper model if not already loaded."""
+        """Load the Whisper model if not already loaded, reusing a warm copy if cached."""
         if not self._model_loaded:
             try:
-                # Auto-detect device if not specified
-                if self.device is None:
-                    self.device = "cuda" if torch.cuda.is_available() else "cpu"
+                self._resolve_device()
+                if self.backend != "faster-whisper":
+                    self._resolve_precision()
                 
-                # Download and load model
-                download_root = self.config.get("download_root", None)
-                self.model = whisper.load_model(
-                    self.model_id,
-                    device=self.device,
-                    download_root=download_root
-                )
+                key = (self.backend, self.model_id, self.device, self.precision,
+                       self.config.get("compute_type"), self.config.get("compile", False))
+                with _MODEL_CACHE_LOCK:
+                    if key not in _MODEL_CACHE:
+                        if self.backend == "faster-whisper":
+                            self._load_faster_whisper()
+                        else:
+                            self._load_openai_whisper()
+                        _MODEL_CACHE[key] = (self.model, self._inference_lock)
+                    self.model, self._inference_lock = _MODEL_CACHE[key]
                 self._model_loaded = True
                 
             except Exception as e:
                 raise RuntimeError(f"Failed to load Whisper model '{self.model_id}': {e}")
     
+    def _resolve_device(self):
+        """Auto-detect the device if not specified."""
+        if self.device is None:
+            if self.backend == "faster-whisper":
+                import ctranslate2
+                cuda = ctranslate2.get_cuda_device_count() > 0
+            else:
+                cuda = self._cuda_available()
+            self.device = "cuda" if cuda else "cpu"
+    
+    def _load_openai_whisper(self):
+        """Load the reference PyTorch implementation."""
+        # Heavy backends are imported only once a local model is used
+        import torch
+        import whisper
+        
+        # Download and load model
+        download_root = self.config.get("download_root", None)
+        self.model = whisper.load_model(
+            self.model_id,
+            device=self.device,
+            download_root=download_root
+        )
+        self._apply_precision(torch, whisper)
+        
+        # Opt-in: compilation takes a while up front and only pays off on CUDA
+        if self.config.get("compile", False) and self.device == "cuda" and hasattr(torch, "compile"):
+            self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead")
+            self.model.decoder = torch.compile(self.model.decoder, mode="reduce-overhead")
+            # Trigger compilation now rather than on the first real request
+            self._transcribe_sync(np.zeros(SAMPLE_RATE, dtype=np.float32), {"language": "en"})
+    
+    def _resolve_precision(self) -> str:
+        """Get the configured precision, defaulting by device once it is known."""
+        if self.precision is None:
+            self.precision = "fp16" if self.device == "cuda" else "fp32"
+        return self.precision
+    
+    def _apply_precision(self, torch, whisper):
+        """Convert loaded openai-whisper weights to the configured precision."""
+        precision = self._resolve_precision()
+        if precision == "fp16":
+            if self.device == "cpu":
+                raise ValueError("fp16 precision requires a CUDA device")
+            # Native half weights avoid Whisper's per-call fp32 -> fp16 casts
+            self.model = self.model.half()
+        elif precision == "int8":
+            if self.device != "cpu":
+                raise ValueError("int8 precision is only supported on CPU")
+            # Whisper's Linear subclass only adds dtype casting on forward, so
+            # treat it as a plain Linear for dynamic quantization
+            for module in self.model.modules():
+                if type(module) is whisper.model.Linear:
+                    module.__class__ = torch.nn.Linear
+            self.model = torch.quantization.quantize_dynamic(
+                self.model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+    
+    def _load_faster_whisper(self):
+        """Load the CTranslate2 port, quantized to int8 unless configured otherwise."""
+        from faster_whisper import WhisperModel
+        
+        # An explicit compute_type wins; otherwise map the configured precision
+        compute_types = {"fp16": "float16", "int8": "int8", "fp32": "float32"}
+        if self.precision is None:
+            default_compute_type = "int8_float16" if self.device == "cuda" else "int8"
+        else:
+            default_compute_type = compute_types[self.precision]
+        self.model = WhisperModel(
+            self.model_id,
+            device=self.device,
+            compute_type=self.config.get("compute_type", default_compute_type),
+            download_root=self.config.get("download_root", None)
+        )
+    
+    @staticmethod
+    def _cuda_available() -> bool:
+        """Check for CUDA without requiring torch to be installed."""
+        try:
+            import torch
+        except ImportError:
+            return False
+        return torch.cuda.is_available()
+    
     def is_available(self) -> bool:
         """Check if the model is available and can be loaded."""
-        try:
-            # Check if ffmpeg is available (required for audio processing)
-            import subprocess
-            result = subprocess.run(['ffmpeg', '-version'], 
-                                  capture_output=True, 
-                                  text=True,
-                                  check=False)
-            if result.returncode != 0:
-                return False
-            
-            # Try to import whisper
-            import whisper
-            return True
-            
-        except (ImportError, FileNotFoundError):
+        cls = type(self)
+        if self.backend not in cls._BACKEND_OK:
+            # Locate the package without importing it (and torch with it)
+            module = "faster_whisper" if self.backend == "faster-whisper" else "whisper"
+            cls._BACKEND_OK[self.backend] = importlib.util.find_spec(module) is not None
+        if not cls._BACKEND_OK[self.backend]:
             return False
+        
+        if self.backend == "faster-whisper":
+            # Decodes audio with PyAV, so ffmpeg is not required
+            return True
+        
+        # ffmpeg is required for audio processing; a PATH lookup avoids spawning it
+        if cls._FFMPEG_OK is None:
+            cls._FFMPEG_OK = shutil.which("ffmpeg") is not None
+        return cls._FFMPEG_OK
     
     async def transcribe(self, audio_path: Path) -> str:
         """
@@ -114,32 +319,31 @@ class LocalWhisperModel(AudioTranscriptionModel):
         if not self.is_available():
             raise ValueError("Whisper is not properly installed. Please install with: pip install openai-whisper")
         
-        if not self.validate_audio_file(audio_path):
+        if not await asyncio.to_thread(self.validate_audio_file, audio_path):
             raise ValueError(f"Invalid audio file: {audio_path}")
         
-        # Load model if not already loaded
-        self._load_model()
+        # Load model if not already loaded (reads weights from disk)
+        await asyncio.to_thread(self._load_model)
         
         try:
-            # Prepare transcription options
-            options = {
-                "language": self.config.get("language", None),  # Auto-detect if not specified
-                "task": self.config.get("task", "transcribe"),  # or "translate" 
-                "temperature": self.config.get("temperature", 0.0),
-                "compression_ratio_threshold": self.config.get("compression_ratio_threshold", 2.4),
-                "logprob_threshold": self.config.get("logprob_threshold", -1.0),
-                "no_speech_threshold": self.config.get("no_speech_threshold", 0.6),
-                "condition_on_previous_text": self.config.get("condition_on_previous_text", True),
-                "initial_prompt": self.config.get("initial_prompt", None),
-                "word_timestamps": self.config.get("word_timestamps", False),
-                "verbose": self.config.get("verbose", False)
-            }
-            
-            # Remove None values
-            options = {k: v for k, v in options.items() if v is not None}
+            options = self._transcribe_options()
             
-            # Transcribe the audio
-            result = self.model.transcribe(str(audio_path), **options)
+            if self.config.get("chunked", False):
+                # Bounded windows keep decoding cost flat on very long recordings
+                parts = await asyncio.to_thread(
+                    lambda: list(self._chunked_transcribe(audio_path, options))
+                )
+                result = {"text": " ".join(parts)}
+            elif self._vad_enabled():
+                result = await asyncio.to_thread(self._transcribe_speech, audio_path, options)
+            elif self.backend == "faster-whisper":
+                # Transcribe the audio in a worker thread so the event loop stays responsive
+                result = await asyncio.to_thread(self._transcribe_sync, str(audio_path), options)
+            else:
+                # Decode in-process where possible instead of piping through ffmpeg
+                result = await asyncio.to_thread(
+                    lambda: self._transcribe_sync(self._load_audio(audio_path), options)
+                )
             
             # Extract text from result
             text = result["text"].strip()
@@ -155,6 +359,237 @@ class LocalWhisperModel(AudioTranscriptionModel):
         except Exception as e:
             raise RuntimeError(f"Whisper transcription failed: {e}")
     
+    def _load_audio(self, audio_path: Path):
+        """Decode a file to 16 kHz mono float32 samples with the active backend."""
+        if self.backend == "faster-whisper":
+            from faster_whisper import decode_audio
+            return decode_audio(str(audio_path), sampling_rate=SAMPLE_RATE)
+        
+        if audio_path.suffix.lower() in LIBSNDFILE_FORMATS:
+            try:
+                return _decode_with_soundfile(audio_path)
+            except Exception:
+                pass  # e.g. a codec this libsndfile build lacks; let ffmpeg try
+        
+        import whisper
+        return whisper.load_audio(str(audio_path))
+    
+    async def stream_transcribe(self, audio_path: Path) -> AsyncIterator[str]:
+        """
+        Transcribe audio in bounded windows, yielding each window's text as it completes.
+        
+        Args:
+            audio_path: Path to the audio file
+            
+        Yields:
+            New transcript text for each window
+        """
+        if not self.is_available():
+            raise ValueError("Whisper is not properly installed. Please install with: pip install openai-whisper")
+        
+        if not await asyncio.to_thread(self.validate_audio_file, audio_path):
+            raise ValueError(f"Invalid audio file: {audio_path}")
+        
+        await asyncio.to_thread(self._load_model)
+        
+        try:
+            windows = self._chunked_transcribe(audio_path, self._transcribe_options())
+            # Decode each window in a worker thread; None marks the end
+            while (text := await asyncio.to_thread(next, windows, None)) is not None:
+                yield text
+        except Exception as e:
+            raise RuntimeError(f"Whisper transcription failed: {e}")
+    
+    async def transcribe_batch(self, audio_paths: List[Path]) -> List[str]:
+        """
+        Transcribe several files, batching clips of up to 30 seconds into shared model calls.
+        
+        Args:
+            audio_paths: Paths to the audio files
+            
+        Returns:
+            Transcribed text for each file, in order
+        """
+        if not self.is_available():
+            raise ValueError("Whisper is not properly installed. Please install with: pip install openai-whisper")
+        
+        for audio_path in audio_paths:
+            if not await asyncio.to_thread(self.validate_audio_file, audio_path):
+                raise ValueError(f"Invalid audio file: {audio_path}")
+        
+        await asyncio.to_thread(self._load_model)
+        
+        try:
+            return await asyncio.to_thread(self._transcribe_batch_sync, audio_paths)
+        except Exception as e:
+            raise RuntimeError(f"Whisper transcription failed: {e}")
+    
+    def _transcribe_batch_sync(self, audio_paths: List[Path]) -> List[str]:
+        """Encode and decode short clips in batches; longer files go through transcribe."""
+        if self.backend == "faster-whisper":
+            # CTranslate2 batches the speech segments within a file, not across files
+            options = self._transcribe_options()
+            return [
+                self._transcribe_sync(self._load_audio(path), options, batched=True)["text"].strip()
+                for path in audio_paths
+            ]
+        
+        import torch
+        import whisper
+        
+        samples = [self._load_audio(path) for path in audio_paths]
+        texts: List[Optional[str]] = [None] * len(samples)
+        
+        # A single decoding pass covers one 30-second window per clip
+        short = [i for i, audio in enumerate(samples) if len(audio) <= whisper.audio.N_SAMPLES]
+        options = whisper.DecodingOptions(
+            task=self.config.get("task", "transcribe"),
+            language=self.config.get("language", None),
+            temperature=self.config.get("temperature", 0.0),
+            prompt=self.config.get("initial_prompt", None),
+            fp16=self.precision == "fp16",
+            without_timestamps=True
+        )
+        batch_size = self.config.get("batch_size", 16)
+        for start in range(0, len(short), batch_size):
+            indices = short[start:start + batch_size]
+            mels = torch.stack([
+                whisper.log_mel_spectrogram(whisper.pad_or_trim(samples[i]), self.model.dims.n_mels)
+                for i in indices
+            ]).to(self.model.device)
+            if self.precision == "fp16":
+                mels = mels.half()
+            with self._inference_lock, torch.inference_mode():
+                results = whisper.decode(self.model, mels, options)
+            for i, result in zip(indices, results):
+                texts[i] = result.text.strip()
+        
+        options = self._transcribe_options()
+        for i, text in enumerate(texts):
+            if text is None:
+                texts[i] = self._transcribe_sync(samples[i], options)["text"].strip()
+        return texts
+    
+    def _transcribe_options(self) -> Dict[str, Any]:
+        """Build Whisper transcription options from the model config."""
+        options = {
+            "language": self.config.get("language", None),  # Auto-detect if not specified
+            "task": self.config.get("task", "transcribe"),  # or "translate" 
+            "temperature": self.config.get("temperature", 0.0),
+            "compression_ratio_threshold": self.config.get("compression_ratio_threshold", 2.4),
+            "logprob_threshold": self.config.get("logprob_threshold", -1.0),
+            "no_speech_threshold": self.config.get("no_speech_threshold", 0.6),
+            "condition_on_previous_text": self.config.get("condition_on_previous_text", True),
+            "initial_prompt": self.config.get("initial_prompt", None),
+            "word_timestamps": self.config.get("word_timestamps", False),
+            "verbose": self.config.get("verbose", False)
+        }
+        
+        # Remove None values
+        return {k: v for k, v in options.items() if v is not None}
+    
+    def _vad_enabled(self) -> bool:
+        """Whether to trim silence before openai-whisper (faster-whisper has its own VAD)."""
+        return self.backend != "faster-whisper" and self.config.get("vad", False)
+    
+    def _trim_silence(self, samples: np.ndarray):
+        """Return speech-only samples and the regions they came from (None if untrimmed)."""
+        if len(samples) < VAD_MIN_DURATION * SAMPLE_RATE:
+            return samples, None
+        
+        regions = _speech_regions(
+            samples,
+            threshold=self.config.get("vad_threshold", 0.01),
+            padding=self.config.get("vad_padding_seconds", 0.5),
+            min_silence=self.config.get("vad_min_silence_seconds", 2.0)
+        )
+        if not regions:
+            return samples[:0], regions
+        return np.concatenate([samples[start:end] for start, end in regions]), regions
+    
+    def _transcribe_speech(self, audio_path: Path, options: Dict[str, Any]) -> Dict[str, Any]:
+        """Transcribe only the voiced parts of a file, keeping original timestamps."""
+        speech, regions = self._trim_silence(self._load_audio(audio_path))
+        if regions == []:
+            return {"text": "", "segments": []}
+        
+        result = self._transcribe_sync(speech, options)
+        if regions is not None:
+            _restore_timestamps(result.get("segments", []), regions)
+        return result
+    
+    def _chunked_transcribe(self, audio_path: Path, options: Dict[str, Any]) -> Iterator[str]:
+        """
+        Transcribe audio in bounded, overlapping windows and yield each window's new text.
+        
+        Words repeated across a window boundary are matched against the tail of
+        the previously yielded text and dropped.
+        """
+        window = int(self.config.get("chunk_seconds", 30) * SAMPLE_RATE)
+        overlap = int(self.config.get("chunk_overlap_seconds", 2) * SAMPLE_RATE)
+        if not 0 <= overlap < window:
+            raise ValueError("chunk_overlap_seconds must be smaller than chunk_seconds")
+        
+        samples = self._load_audio(audio_path)
+        if self._vad_enabled():
+            samples, _ = self._trim_silence(samples)
+        if not len(samples):
+            return  # Nothing but silence; don't run the model on an empty window
+        confirmed: List[str] = []
+        for start in range(0, max(len(samples) - overlap, 1), window - overlap):
+            result = self._transcribe_sync(samples[start:start + window], options)
+            words = _drop_overlap(confirmed, result["text"].split())
+            if words:
+                confirmed.extend(words)
+                yield " ".join(words)
+    
+    def _transcribe_sync(self, audio, options: Dict[str, Any], batched: bool = False) -> Dict[str, Any]:
+        """
+        Run the loaded backend and return an openai-whisper style result dict.
+        
+        With batched=True, faster-whisper decodes a file's VAD segments in
+        batches of batch_size through its BatchedInferencePipeline.
+        
+        Models are shared across instances and neither backend is safe to
+        call from several threads at once, so calls hold the model's lock.
+        """
+        if self.backend != "faster-whisper":
+            import torch
+            
+            # Decode in the same precision as the loaded weights, without autograd bookkeeping
+            with self._inference_lock, torch.inference_mode():
+                return self.model.transcribe(audio, fp16=self.precision == "fp16", **options)
+        
+        # faster-whisper takes slightly different option names and has no verbose mode
+        options = dict(options)
+        options.pop("verbose", None)
+        if "logprob_threshold" in options:
+            options["log_prob_threshold"] = options.pop("logprob_threshold")
+        options.setdefault("beam_size", self.config.get("beam_size", 5))
+        options.setdefault("vad_filter", self.config.get("vad_filter", self.config.get("vad", False)))
+        
+        model = self.model
+        if batched:
+            if self._batched_pipeline is None:
+                from faster_whisper import BatchedInferencePipeline
+                self._batched_pipeline = BatchedInferencePipeline(model=self.model)
+            model = self._batched_pipeline
+            # The pipeline batches the segments VAD finds, so VAD is always on
+            options.update(batch_size=self.config.get("batch_size", 16), vad_filter=True)
+        
+        # Segments are generated lazily; consuming them runs the actual decoding
+        with self._inference_lock:
+            segments, info = model.transcribe(audio, **options)
+            segments = [
+                {"start": segment.start, "end": segment.end, "text": segment.text}
+                for segment in segments
+            ]
+        return {
+            "text": "".join(segment["text"] for segment in segments),
+            "segments": segments,
+            "language": info.language
+        }
+    
     def get_supported_formats(self) -> list[str]:
         """Get list of supported audio formats."""
         # Whisper uses ffmpeg, so it supports many formats
@@ -169,11 +604,19 @@ class LocalWhisperModel(AudioTranscriptionModel):
             "model_id": self.model_id,
             "description": self.AVAILABLE_MODELS.get(self.model_id, "Unknown model"),
             "device": self.device or "auto-detect",
+            "backend": self.backend,
+            "precision": self.precision or "auto",
             "loaded": self._model_loaded,
             "multilingual": not self.model_id.endswith(".en"),
             "parameters": self.AVAILABLE_MODELS.get(self.model_id, "").split(" - ")[0]
         }
     
+    @staticmethod
+    def clear_model_cache():
+        """Release all cached models (instances keep their own reference)."""
+        with _MODEL_CACHE_LOCK:
+            _MODEL_CACHE.clear()
+    
     @classmethod
     def list_available_models(cls) -> Dict[str, str]:
         """List all available Whisper models."""
@@ -221,7 +664,7 @@ class LocalWhisperModel(AudioTranscriptionModel):
         factor = speed_factors.get(self.model_id, 1.0)
         
         # Adjust for GPU
-        if self.device == "cuda" or (self.device is None and torch.cuda.is_available()):
+        if self.device == "cuda" or (self.device is None and self._cuda_available()):
             factor *= 0.1  # GPU is roughly 10x faster
         
         return audio_duration_seconds * factor
\ No newline at end of file
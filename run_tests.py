@@ -41,6 +41,13 @@ def run_tests(test_type=None, verbose=False, generate_fixtures=False):
     if verbose:
         cmd.append("-vv")
     
+    # Run across all cores if pytest-xdist is available
+    try:
+        import xdist
+        cmd.extend(["-n", "auto", "--dist=loadscope"])
+    except ImportError:
+        pass
+    
     # Add coverage if available
     try:
         import pytest_cov
@@ -5,32 +5,73 @@ Demonstrates basic API usage including authentication
 """
 
 import asyncio
-import requests
 import json
+import socket
 from pathlib import Path
+from urllib.parse import urlsplit
+
+import httpx
 
 
 API_BASE = "http://localhost:8000/api/v1"
 
+# Last /config response and its ETag, revalidated with If-None-Match
+CONFIG_CACHE = Path.home() / ".cache" / "neuravox" / "config.json"
+
+
+def load_config_cache():
+    """Return the cached {"etag", "data"} entry, or None"""
+    try:
+        return json.loads(CONFIG_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def config_request_headers(cached):
+    """Conditional-GET headers for /config"""
+    return {"If-None-Match": cached["etag"]} if cached else {}
+
+
+def resolve_config_response(cached, status_code, etag, data):
+    """Serve a 304 from the cache and store fresh 200 responses
+    
+    Returns the (status_code, data) pair to report.
+    """
+    if status_code == 304 and cached:
+        return 200, cached["data"]
+    if status_code == 200 and etag:
+        CONFIG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CONFIG_CACHE.write_text(json.dumps({"etag": etag, "data": data}))
+    return status_code, data
+
+
+def server_listening(timeout: float = 0.1) -> bool:
+    """Check that something accepts connections on the API port"""
+    url = urlsplit(API_BASE)
+    port = url.port or (443 if url.scheme == "https" else 80)
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        return sock.connect_ex((url.hostname, port)) == 0
+
 
-def test_health_check():
+async def test_health_check(client: httpx.AsyncClient):
     """Test health check endpoint"""
     print("🔍 Testing health check...")
     
-    response = requests.get(f"{API_BASE}/health")
+    # HEAD is a bodyless liveness probe; servers without it get the full check
+    response = await client.head("/health")
+    if response.status_code == 405:
+        response = await client.get("/health")
     
     if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Health check passed: {data['status']}")
-        print(f"   Database: {data['database']}")
-        print(f"   Workspace: {data['workspace']}")
+        print(f"✅ Health check passed")
         return True
     else:
         print(f"❌ Health check failed: {response.status_code}")
         return False
 
 
-def test_create_api_key():
+async def test_create_api_key(client: httpx.AsyncClient):
     """Test API key creation"""
     print("\n🔑 Testing API key creation...")
     
@@ -40,7 +81,7 @@ def test_create_api_key():
         "rate_limit_per_minute": 100
     }
     
-    response = requests.post(f"{API_BASE}/auth/keys", json=payload)
+    response = await client.post("/auth/keys", json=payload)
     
     if response.status_code == 200:
         data = response.json()
@@ -56,13 +97,13 @@ def test_create_api_key():
         return None
 
 
-def test_authenticated_request(api_key):
+async def test_authenticated_request(client: httpx.AsyncClient, api_key):
     """Test authenticated request"""
     print("\n🔐 Testing authenticated request...")
     
     headers = {"Authorization": f"Bearer {api_key}"}
     
-    response = requests.get(f"{API_BASE}/auth/me", headers=headers)
+    response = await client.get("/auth/me", headers=headers)
     
     if response.status_code == 200:
         data = response.json()
@@ -76,14 +117,15 @@ def test_authenticated_request(api_key):
         return False
 
 
-def test_configuration():
-    """Test configuration endpoint"""
+# The probes below run concurrently, so each one prints its whole report
+# only once its response is in; the reports never interleave. The report_*
+# helpers take a status code and decoded body so batched sub-responses and
+# individual responses print the same way.
+
+def report_configuration(status_code, data):
+    """Print the configuration probe result"""
     print("\n⚙️  Testing configuration...")
-    
-    response = requests.get(f"{API_BASE}/config")
-    
-    if response.status_code == 200:
-        data = response.json()
+    if status_code == 200:
         print(f"✅ Configuration retrieved successfully")
         print(f"   Workspace: {data['workspace']}")
         print(f"   Available models: {len(data['models'])}")
@@ -92,78 +134,153 @@ def test_configuration():
             print(f"     {status} {model['name']} ({model['key']})")
         return True
     else:
-        print(f"❌ Configuration retrieval failed: {response.status_code}")
+        print(f"❌ Configuration retrieval failed: {status_code}")
         return False
 
 
-def test_file_operations(api_key):
-    """Test file operations"""
+def report_file_operations(status_code, files):
+    """Print the file listing probe result"""
     print("\n📁 Testing file operations...")
-    
-    headers = {"Authorization": f"Bearer {api_key}"}
-    
-    # List files
-    response = requests.get(f"{API_BASE}/files", headers=headers)
-    
-    if response.status_code == 200:
-        files = response.json()
+    if status_code == 200:
         print(f"✅ File listing successful")
         print(f"   Files found: {len(files)}")
         return True
     else:
-        print(f"❌ File listing failed: {response.status_code}")
+        print(f"❌ File listing failed: {status_code}")
         return False
 
 
-def test_job_operations(api_key):
-    """Test job operations"""
+def report_job_operations(status_code, data):
+    """Print the job listing probe result"""
     print("\n⚙️  Testing job operations...")
+    if status_code == 200:
+        print(f"✅ Job listing successful")
+        print(f"   Jobs found: {data['total']}")
+        return True
+    else:
+        print(f"❌ Job listing failed: {status_code}")
+        return False
+
+
+def _json_or_none(response: httpx.Response):
+    """Decode a successful response body"""
+    return response.json() if response.status_code == 200 else None
+
+
+async def test_configuration(client: httpx.AsyncClient):
+    """Test configuration endpoint"""
+    cached = load_config_cache()
+    response = await client.get("/config", headers=config_request_headers(cached))
     
+    status_code, data = resolve_config_response(
+        cached, response.status_code, response.headers.get("etag"), _json_or_none(response)
+    )
+    return report_configuration(status_code, data)
+
+
+async def test_file_operations(client: httpx.AsyncClient, api_key):
+    """Test file operations"""
+    headers = {"Authorization": f"Bearer {api_key}"}
+    
+    # List files
+    response = await client.get("/files", headers=headers)
+    return report_file_operations(response.status_code, _json_or_none(response))
+
+
+async def test_job_operations(client: httpx.AsyncClient, api_key):
+    """Test job operations"""
     headers = {"Authorization": f"Bearer {api_key}"}
     
     # List jobs
-    response = requests.get(f"{API_BASE}/jobs", headers=headers)
+    response = await client.get("/jobs", headers=headers)
+    return report_job_operations(response.status_code, _json_or_none(response))
+
+
+# Read-only probes sent together through the $batch endpoint, in report order
+BATCH_PROBES = [
+    ("/config", report_configuration),
+    ("/files", report_file_operations),
+    ("/jobs", report_job_operations),
+]
+
+
+async def test_batch_probes(client: httpx.AsyncClient, api_key):
+    """Run the read-only probes as one $batch request
     
-    if response.status_code == 200:
-        data = response.json()
-        print(f"✅ Job listing successful")
-        print(f"   Jobs found: {data['total']}")
-        return True
-    else:
-        print(f"❌ Job listing failed: {response.status_code}")
+    Returns None if the server has no $batch endpoint, so the caller can
+    fall back to individual requests.
+    """
+    headers = {"Authorization": f"Bearer {api_key}"}
+    cached = load_config_cache()
+    payload = [
+        {
+            "method": "GET",
+            "path": path,
+            "headers": config_request_headers(cached) if path == "/config" else {}
+        }
+        for path, _ in BATCH_PROBES
+    ]
+    
+    response = await client.post("/$batch", json=payload, headers=headers)
+    
+    if response.status_code == 404:
+        return None
+    if response.status_code != 200:
+        print(f"\n❌ Batch request failed: {response.status_code}")
+        print(f"   Response: {response.text}")
         return False
+    
+    results = []
+    for (path, report), item in zip(BATCH_PROBES, response.json()):
+        status_code, data = item["status"], item["body"]
+        if path == "/config":
+            status_code, data = resolve_config_response(
+                cached, status_code, item.get("headers", {}).get("etag"), data
+            )
+        results.append(report(status_code, data))
+    return all(results)
 
 
-def main():
+async def main():
     """Run all API tests"""
     print("🚀 Starting Neuravox API Tests")
     print("=" * 50)
     
-    # Test basic health
-    if not test_health_check():
-        print("\n❌ Basic health check failed. Is the API server running?")
+    # Nothing listening means no server; don't wait on a connection attempt
+    if not server_listening():
+        print(f"\n❌ Nothing is listening at {API_BASE}. Is the API server running?")
         print("   Start it with: neuravox serve")
         return
     
-    # Test API key creation
-    api_key = test_create_api_key()
-    if not api_key:
-        print("\n❌ Cannot continue without API key")
-        return
-    
-    # Test authentication
-    if not test_authenticated_request(api_key):
-        print("\n❌ Authentication test failed")
-        return
-    
-    # Test configuration
-    test_configuration()
-    
-    # Test file operations
-    test_file_operations(api_key)
-    
-    # Test job operations
-    test_job_operations(api_key)
+    # One client for every request; a small keep-alive pool covers the
+    # concurrent probes without opening a connection per request
+    limits = httpx.Limits(max_connections=8, max_keepalive_connections=4)
+    async with httpx.AsyncClient(base_url=API_BASE, limits=limits) as client:
+        # Test basic health
+        if not await test_health_check(client):
+            print("\n❌ Basic health check failed. Is the API server running?")
+            print("   Start it with: neuravox serve")
+            return
+        
+        # Test API key creation
+        api_key = await test_create_api_key(client)
+        if not api_key:
+            print("\n❌ Cannot continue without API key")
+            return
+        
+        # Test authentication
+        if not await test_authenticated_request(client, api_key):
+            print("\n❌ Authentication test failed")
+            return
+        
+        # Configuration, file and job probes go out as one batched request;
+        # servers without $batch get them as concurrent individual requests
+        if await test_batch_probes(client, api_key) is None:
+            await asyncio.gather(
+                test_configuration(client),
+                test_file_operations(client, api_key),
+                test_job_operations(client, api_key)
+            )
     
     print("\n" + "=" * 50)
     print("🎉 API tests completed!")
@@ -172,4 +289,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
@@ -5,86 +5,189 @@ Generate sample audio files for testing the neuravox platform
 import numpy as np
 import soundfile as sf
 from pathlib import Path
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import argparse
 
 
-def generate_sine_wave(frequency: float, duration: float, sample_rate: int = 16000) -> np.ndarray:
-    """Generate a sine wave at the given frequency"""
-    t = np.linspace(0, duration, int(duration * sample_rate), False)
-    return 0.3 * np.sin(2 * np.pi * frequency * t)
+def time_base(duration: float, sample_rate: int = 16000) -> np.ndarray:
+    """Sample times for a clip; slices of it can be shared across segments"""
+    return np.arange(int(duration * sample_rate), dtype=np.float32) / np.float32(sample_rate)
 
 
-def generate_test_audio_files(output_dir: Path):
-    """Generate various test audio files"""
-    output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Test 1: Short continuous audio (10 seconds, no silence)
-    print("Generating test_continuous_10s.wav...")
-    audio = generate_sine_wave(440, 10)
-    sf.write(output_dir / "test_continuous_10s.wav", audio, 16000)
+def generate_sine_wave(
+    frequency: float,
+    duration: float,
+    sample_rate: int = 16000,
+    out: Optional[np.ndarray] = None,
+    t: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Generate a float32 sine wave at the given frequency
     
-    # Test 2: Audio with single silence gap (30 seconds total)
-    print("Generating test_single_gap_30s.wav...")
-    audio = np.zeros(30 * 16000)
-    audio[0:10*16000] = generate_sine_wave(440, 10)  # First 10 seconds
-    # 10 seconds of silence
-    audio[20*16000:30*16000] = generate_sine_wave(880, 10)  # Last 10 seconds
-    sf.write(output_dir / "test_single_gap_30s.wav", audio, 16000)
+    Writes into ``out`` (e.g. a slice of a larger buffer) when given, and
+    reuses a precomputed time base ``t`` instead of building a new one.
+    """
+    num_samples = int(duration * sample_rate)
+    t = time_base(duration, sample_rate) if t is None else t[:num_samples]
+    if out is None:
+        out = np.empty(num_samples, dtype=np.float32)
+    return _fill_sine(t, frequency, out)
+
+
+def _fill_sine(t: np.ndarray, frequency: float, out: np.ndarray) -> np.ndarray:
+    """Write a 0.3-amplitude sine sampled at times ``t`` into ``out``"""
+    np.multiply(t, np.float32(2 * np.pi * frequency), out=out)
+    np.sin(out, out=out)
+    out *= np.float32(0.3)
+    return out
+
+
+def write_tone_segments(
+    path: Path,
+    duration: int,
+    segments: list,
+    sample_rate: int = 16000,
+    block_size: int = 65536
+):
+    """Stream (start, end, frequency) tones separated by silence to a 16-bit file
     
-    # Test 3: Audio with multiple silence gaps (2 minutes)
-    print("Generating test_multiple_gaps_2min.wav...")
-    audio = np.zeros(120 * 16000)
+    Audio is synthesized and written one block at a time, so peak memory
+    stays at a single block regardless of the file's length.
+    """
+    block = np.empty(block_size, dtype=np.float32)
+    with sf.SoundFile(path, mode="w", samplerate=sample_rate, channels=1, subtype="PCM_16") as f:
+        position = 0
+        for start, end, freq in [*segments, (duration, duration, None)]:
+            # Silence is written out explicitly; seeking past the end of a
+            # file being written is not supported
+            block[:] = 0
+            remaining = start * sample_rate - position
+            while remaining > 0:
+                n = min(block_size, remaining)
+                f.write(block[:n])
+                remaining -= n
+            
+            # Each tone starts at zero phase
+            length = (end - start) * sample_rate
+            for offset in range(0, length, block_size):
+                n = min(block_size, length - offset)
+                t = np.arange(offset, offset + n, dtype=np.float32) / np.float32(sample_rate)
+                f.write(_fill_sine(t, freq, block[:n]))
+            position = end * sample_rate
+
+
+def _make_continuous_10s(output_dir: Path) -> str:
+    """Test 1: Short continuous audio (10 seconds, no silence)"""
+    audio = generate_sine_wave(440, 10)
+    sf.write(output_dir / "test_continuous_10s.wav", audio, 16000, subtype="PCM_16")
+    return "test_continuous_10s.wav"
+
+
+def _make_single_gap_30s(output_dir: Path) -> str:
+    """Test 2: Audio with single silence gap (30 seconds total)"""
+    segments = [
+        (0, 10, 440),      # First 10 seconds
+        (20, 30, 880)      # Last 10 seconds (10 seconds of silence before)
+    ]
+    write_tone_segments(output_dir / "test_single_gap_30s.wav", 30, segments)
+    return "test_single_gap_30s.wav"
+
+
+def _make_multiple_gaps_2min(output_dir: Path) -> str:
+    """Test 3: Audio with multiple silence gaps (2 minutes)"""
     segments = [
         (0, 15, 440),      # 0-15s: 440Hz
         (40, 55, 880),     # 40-55s: 880Hz (25s gap)
         (85, 100, 660),    # 85-100s: 660Hz (30s gap)
         (105, 120, 550)    # 105-120s: 550Hz (5s gap - should merge with previous)
     ]
-    for start, end, freq in segments:
-        audio[start*16000:end*16000] = generate_sine_wave(freq, end-start)
-    sf.write(output_dir / "test_multiple_gaps_2min.wav", audio, 16000)
-    
-    # Test 4: Very short audio (3 seconds)
-    print("Generating test_very_short_3s.wav...")
+    write_tone_segments(output_dir / "test_multiple_gaps_2min.wav", 120, segments)
+    return "test_multiple_gaps_2min.wav"
+
+
+def _make_very_short_3s(output_dir: Path) -> str:
+    """Test 4: Very short audio (3 seconds)"""
     audio = generate_sine_wave(440, 3)
-    sf.write(output_dir / "test_very_short_3s.wav", audio, 16000)
-    
-    # Test 5: Audio with varying amplitudes (simulating speech)
-    print("Generating test_varying_amplitude_1min.wav...")
+    sf.write(output_dir / "test_very_short_3s.wav", audio, 16000, subtype="PCM_16")
+    return "test_very_short_3s.wav"
+
+
+def _make_varying_amplitude_1min(output_dir: Path) -> str:
+    """Test 5: Audio with varying amplitudes (simulating speech)"""
     duration = 60
-    t = np.linspace(0, duration, duration * 16000, False)
+    t = time_base(duration)
+    audio = np.empty_like(t)
+    envelope = np.empty_like(t)
+    # Carrier and envelope are built in place on the shared time base
+    np.multiply(t, np.float32(2 * np.pi * 440), out=audio)
+    np.sin(audio, out=audio)
     # Create envelope that varies amplitude
-    envelope = 0.5 + 0.3 * np.sin(2 * np.pi * 0.1 * t)  # Slow variation
-    audio = envelope * np.sin(2 * np.pi * 440 * t)
+    np.multiply(t, np.float32(2 * np.pi * 0.1), out=envelope)  # Slow variation
+    np.sin(envelope, out=envelope)
+    envelope *= np.float32(0.3)
+    envelope += np.float32(0.5)
+    audio *= envelope
     # Add some quiet sections
     audio[20*16000:25*16000] *= 0.01  # Very quiet but not silent
     audio[45*16000:50*16000] *= 0.01
-    sf.write(output_dir / "test_varying_amplitude_1min.wav", audio, 16000)
-    
-    # Test 6: Stereo audio file
-    print("Generating test_stereo_20s.wav...")
-    left_channel = generate_sine_wave(440, 20)
-    right_channel = generate_sine_wave(550, 20)
-    stereo_audio = np.column_stack((left_channel, right_channel))
-    sf.write(output_dir / "test_stereo_20s.wav", stereo_audio, 16000)
-    
-    # Test 7: High sample rate audio (44.1kHz)
-    print("Generating test_high_samplerate_10s.wav...")
+    sf.write(output_dir / "test_varying_amplitude_1min.wav", audio, 16000, subtype="PCM_16")
+    return "test_varying_amplitude_1min.wav"
+
+
+def _make_stereo_20s(output_dir: Path) -> str:
+    """Test 6: Stereo audio file"""
+    stereo_audio = np.empty((20 * 16000, 2), dtype=np.float32)
+    t = time_base(20)
+    generate_sine_wave(440, 20, out=stereo_audio[:, 0], t=t)  # Left channel
+    generate_sine_wave(550, 20, out=stereo_audio[:, 1], t=t)  # Right channel
+    sf.write(output_dir / "test_stereo_20s.wav", stereo_audio, 16000, subtype="PCM_16")
+    return "test_stereo_20s.wav"
+
+
+def _make_high_samplerate_10s(output_dir: Path) -> str:
+    """Test 7: High sample rate audio (44.1kHz)"""
     audio = generate_sine_wave(440, 10, sample_rate=44100)
-    sf.write(output_dir / "test_high_samplerate_10s.wav", audio, 44100)
-    
-    # Test 8: Audio with long silence at the beginning and end
-    print("Generating test_edge_silence_1min.wav...")
-    audio = np.zeros(60 * 16000)
-    audio[30*16000:40*16000] = generate_sine_wave(440, 10)  # 10s of audio in the middle
-    sf.write(output_dir / "test_edge_silence_1min.wav", audio, 16000)
-    
-    # Generate different format files
-    print("\nGenerating files in different formats...")
+    sf.write(output_dir / "test_high_samplerate_10s.wav", audio, 44100, subtype="PCM_16")
+    return "test_high_samplerate_10s.wav"
+
+
+def _make_edge_silence_1min(output_dir: Path) -> str:
+    """Test 8: Audio with long silence at the beginning and end"""
+    # 10s of audio in the middle
+    write_tone_segments(output_dir / "test_edge_silence_1min.wav", 60, [(30, 40, 440)])
+    return "test_edge_silence_1min.wav"
+
+
+def _make_format_flac(output_dir: Path) -> str:
+    """Test 9: Same tone in a different container format (FLAC)"""
     test_audio = generate_sine_wave(440, 5)
+    sf.write(output_dir / "test_format.flac", test_audio, 16000, subtype="PCM_16")
+    return "test_format.flac"
+
+
+# Each generator writes one independent file, so they can run in parallel
+FILE_GENERATORS = [
+    _make_continuous_10s,
+    _make_single_gap_30s,
+    _make_multiple_gaps_2min,
+    _make_very_short_3s,
+    _make_varying_amplitude_1min,
+    _make_stereo_20s,
+    _make_high_samplerate_10s,
+    _make_edge_silence_1min,
+    _make_format_flac,
+]
+
+
+def generate_test_audio_files(output_dir: Path, max_workers: Optional[int] = None):
+    """Generate various test audio files"""
+    output_dir.mkdir(parents=True, exist_ok=True)
     
-    # FLAC format
-    sf.write(output_dir / "test_format.flac", test_audio, 16000)
+    # Sine synthesis and encoding are CPU-bound, so use processes, not threads
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(generate, output_dir) for generate in FILE_GENERATORS]
+        for future in as_completed(futures):
+            print(f"Generated {future.result()}")
     
     # Generate a summary file
     summary = """# Test Audio Files
@@ -0,0 +1,256 @@
+"""In-process integration tests for the REST API
+
+Requests go straight to the FastAPI app through httpx's ASGI transport, so
+no server or socket is involved. Each test runs inside a database
+transaction that is rolled back afterwards; API keys created here never
+persist, and tests stay independent under pytest-xdist.
+
+All tests in the module share one event loop and one database engine, so
+the schema and aiosqlite connection pool are set up once, not per test.
+"""
+import asyncio
+import contextvars
+from collections import defaultdict
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from neuravox.api.main import create_app
+from neuravox.api.models.database import ApiKey
+from neuravox.db.database import Base, get_db_session
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+# How many requests with an open test session enclose the current one
+_session_depth = contextvars.ContextVar("session_depth", default=0)
+
+
+def _sqlite_engine(url: str):
+    """Async SQLite engine whose transactions support nested savepoints
+    
+    pysqlite (and aiosqlite) defer BEGIN on their own, which breaks
+    SAVEPOINT; let SQLAlchemy emit BEGIN itself instead.
+    """
+    engine = create_async_engine(url)
+    
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+    
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+    
+    return engine
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def engine(tmp_path_factory):
+    """Engine on a fresh database with the API schema, shared by the module"""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('api') / 'neuravox_api.db'}"
+    engine = _sqlite_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def db_txn(engine):
+    """Pooled connection inside a transaction that is rolled back after the test"""
+    async with engine.connect() as conn:
+        transaction = await conn.begin()
+        yield conn
+        await transaction.rollback()
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def client(db_txn):
+    """Client for a fresh app whose sessions all join the test transaction"""
+    app = create_app()
+    # Sessions share one connection, so concurrent requests (e.g. $batch
+    # sub-requests) take turns rather than interleave their savepoints. A
+    # $batch call keeps its session while its sub-requests run, so requests
+    # take turns with the others at the same nesting level
+    session_locks = defaultdict(asyncio.Lock)
+    
+    async def _test_session():
+        depth = _session_depth.get()
+        # Service-level commits only release a savepoint of the outer transaction
+        async with session_locks[depth], AsyncSession(
+            bind=db_txn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint"
+        ) as session:
+            # Requests dispatched from inside this one run a level deeper
+            _session_depth.set(depth + 1)
+            yield session
+    
+    app.dependency_overrides[get_db_session] = _test_session
+    
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test/api/v1") as c:
+        yield c
+
+
+@pytest_asyncio.fixture(loop_scope="module")
+async def auth_headers(client):
+    """Authorization headers for a freshly created API key"""
+    response = await client.post("/auth/keys", json={
+        "name": "Test API Key",
+        "user_id": "test_user",
+        "rate_limit_per_minute": 100
+    })
+    assert response.status_code == 201
+    return {"Authorization": f"Bearer {response.json()['key']}"}
+
+
+async def _count_api_keys(db_txn) -> int:
+    """Number of API keys visible inside the test transaction"""
+    result = await db_txn.execute(select(func.count()).select_from(ApiKey))
+    return result.scalar_one()
+
+
+async def test_health_check(client):
+    """Test health check endpoint"""
+    response = await client.get("/health")
+    
+    assert response.status_code == 200
+    assert response.json()["database"] == "healthy"
+
+
+async def test_health_probe(client):
+    """Test the bodyless HEAD liveness probe"""
+    response = await client.head("/health")
+    
+    assert response.status_code == 200
+    assert response.content == b""
+
+
+async def test_create_api_key(client, db_txn):
+    """Test API key creation, starting from an empty key table"""
+    assert await _count_api_keys(db_txn) == 0
+    
+    response = await client.post("/auth/keys", json={
+        "name": "Test API Key",
+        "user_id": "test_user",
+        "rate_limit_per_minute": 100
+    })
+    
+    assert response.status_code == 201
+    data = response.json()
+    assert data["key"]
+    assert data["user_id"] == "test_user"
+    assert data["rate_limit_per_minute"] == 100
+    assert await _count_api_keys(db_txn) == 1
+
+
+async def test_keys_roll_back_between_tests(client, db_txn, auth_headers):
+    """Test that each test only sees the keys it created itself"""
+    assert await _count_api_keys(db_txn) == 1
+
+
+async def test_authenticated_request(client, auth_headers):
+    """Test authenticated request"""
+    response = await client.get("/auth/me", headers=auth_headers)
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user_id"] == "test_user"
+    assert data["name"] == "Test API Key"
+
+
+async def test_unauthenticated_request(client):
+    """Test that protected endpoints reject missing credentials"""
+    response = await client.get("/auth/me")
+    
+    assert response.status_code == 401
+
+
+async def test_configuration(client):
+    """Test configuration endpoint and its ETag revalidation"""
+    response = await client.get("/config")
+    
+    assert response.status_code == 200
+    assert "models" in response.json()
+    etag = response.headers["etag"]
+    
+    response = await client.get("/config", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+async def test_file_operations(client, auth_headers):
+    """Test file listing"""
+    response = await client.get("/files", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert isinstance(response.json(), list)
+
+
+async def test_job_operations(client, auth_headers):
+    """Test job listing"""
+    response = await client.get("/jobs", headers=auth_headers)
+    
+    assert response.status_code == 200
+    assert "total" in response.json()
+
+
+async def test_batch_probes(client, auth_headers):
+    """Test that $batch returns one sub-response per probe, in order"""
+    payload = [{"method": "GET", "path": path} for path in ["/config", "/files", "/jobs"]]
+    
+    response = await client.post("/$batch", json=payload, headers=auth_headers)
+    
+    assert response.status_code == 200
+    results = response.json()
+    assert [item["status"] for item in results] == [200, 200, 200]
+    assert "models" in results[0]["body"]
+    assert "total" in results[2]["body"]
+
+
+async def test_batch_requires_api_key(client):
+    """Test that $batch rejects callers without credentials"""
+    payload = [{"method": "GET", "path": "/config"}]
+    
+    response = await client.post("/$batch", json=payload)
+    
+    assert response.status_code == 401
+
+
+async def test_batch_forwards_x_api_key(client, auth_headers):
+    """Test that sub-requests authenticate with an X-API-Key credential too"""
+    api_key = auth_headers["Authorization"].removeprefix("Bearer ")
+    payload = [{"method": "GET", "path": "/auth/me"}]
+    
+    response = await client.post("/$batch", json=payload, headers={"X-API-Key": api_key})
+    
+    assert response.status_code == 200
+    results = response.json()
+    assert results[0]["status"] == 200
+    assert results[0]["body"]["user_id"] == "test_user"
+
+
+async def test_batch_rejects_credential_headers(client, auth_headers):
+    """Test that sub-requests can't set headers outside the allow-list"""
+    payload = [{"method": "GET", "path": "/auth/me", "headers": {"X-API-Key": "other"}}]
+    
+    response = await client.post("/$batch", json=payload, headers=auth_headers)
+    
+    assert response.status_code == 422
+
+
+async def test_batch_rejects_writes(client, auth_headers):
+    """Test that only GET sub-requests are accepted"""
+    payload = [{"method": "DELETE", "path": "/files/abc"}]
+    
+    response = await client.post("/$batch", json=payload, headers=auth_headers)
+    
+    assert response.status_code == 422
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
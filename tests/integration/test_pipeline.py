@@ -1,7 +1,17 @@
-"""Integration tests for the full audio processing pipeline"""
+"""Integration tests for the full audio processing pipeline
+
+Fixtures are safe to run under pytest-xdist (``pytest -n auto``): the
+synthesized WAVs are session-scoped and read-only, so each worker writes
+its own copy once, and every test gets a private workspace.
+"""
 import asyncio
+import copy
+import functools
+import os
+import shutil
 import tempfile
 from pathlib import Path
+from typing import Optional
 from unittest.mock import patch, MagicMock, AsyncMock
 import pytest
 import numpy as np
@@ -12,54 +22,162 @@ from neuravox.shared.config import UnifiedConfig
 from neuravox.core.exceptions import PipelineError
 
 
+SAMPLE_RATE = 16000
+
+# One period of a sine; tones are synthesized by table lookup instead of sin()
+_TABLE_BITS = 12
+_SINE_TABLE = np.sin(2 * np.pi * np.arange(1 << _TABLE_BITS) / (1 << _TABLE_BITS)).astype(np.float32)
+
+# Fractional bits of the fixed-point phase step, so the pitch is not rounded
+_PHASE_FRACTION_BITS = 16
+
+
+def _wavetable_sine(
+    positions: np.ndarray,
+    freq,
+    sample_rate: int,
+    amp: float = 0.3,
+    out: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """Look up amp * sin(2*pi*freq*n / sample_rate) for integer sample positions n
+    
+    ``freq`` may be a scalar or one frequency per position. Samples are
+    written into ``out`` (e.g. a slice of a larger buffer) when given.
+    """
+    step = np.rint(np.asarray(freq) * (1 << (_TABLE_BITS + _PHASE_FRACTION_BITS)) / sample_rate)
+    phase = positions * step.astype(np.int64)
+    phase >>= _PHASE_FRACTION_BITS
+    phase &= (1 << _TABLE_BITS) - 1
+    audio = np.take(_SINE_TABLE, phase, out=out)
+    audio *= np.float32(amp)
+    return audio
+
+
+@functools.lru_cache(maxsize=8)
+def _make_sine(duration: float, sample_rate: int, freq: float, amp: float = 0.3) -> np.ndarray:
+    """Synthesize a tone once; callers share the read-only buffer"""
+    positions = np.arange(int(duration * sample_rate), dtype=np.int64)
+    audio = _wavetable_sine(positions, freq, sample_rate, amp)
+    audio.flags.writeable = False
+    return audio
+
+
+# Keep fixture audio and workspaces on tmpfs where available
+_DEFAULT_TMP = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
+
+
+def _link_or_copy(source: Path, target: Path) -> Path:
+    """Place a session-cached WAV into a test workspace without rewriting it"""
+    try:
+        os.link(source, target)
+    except OSError:
+        shutil.copyfile(source, target)
+    return target
+
+
+@pytest.fixture(scope="session")
+def audio_dir():
+    """Session directory for synthesized WAVs, on the same filesystem as workspaces"""
+    with tempfile.TemporaryDirectory(dir=_DEFAULT_TMP) as temp_dir:
+        yield Path(temp_dir)
+
+
+@pytest.fixture(scope="session")
+def gapped_wav(audio_dir):
+    """10 seconds of audio with silence gaps, written once per session"""
+    duration = 10  # seconds
+    audio = np.zeros(duration * SAMPLE_RATE, dtype=np.float32)
+    
+    # Tones are written straight into their slices of the buffer
+    positions = np.arange(2 * SAMPLE_RATE, dtype=np.int64)
+    
+    # Add sound from 0-2 seconds (440Hz tone)
+    _wavetable_sine(positions, 440, SAMPLE_RATE, out=audio[0:2*SAMPLE_RATE])
+    
+    # Silence from 2-5 seconds
+    
+    # Add sound from 5-7 seconds (880Hz tone)
+    _wavetable_sine(positions, 880, SAMPLE_RATE, out=audio[5*SAMPLE_RATE:7*SAMPLE_RATE])
+    
+    # Silence from 7-10 seconds
+    
+    path = audio_dir / "test_audio.wav"
+    sf.write(str(path), audio, SAMPLE_RATE, subtype="PCM_16")
+    return path
+
+
+@pytest.fixture(scope="session")
+def long_wav(audio_dir):
+    """2 minutes of audio with multiple 25+ second silence gaps, written once per session"""
+    duration = 120  # seconds
+    audio = np.zeros(duration * SAMPLE_RATE, dtype=np.float32)
+    
+    # Add several speech segments with 25+ second gaps
+    segments = [
+        (0, 20),      # 20 seconds of "speech"
+        (50, 70),     # 20 seconds of "speech" (30s gap)
+        (100, 120)    # 20 seconds of "speech" (30s gap)
+    ]
+    
+    bounds = np.array(segments) * SAMPLE_RATE
+    starts, lengths = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+    
+    # Simulate speech with varying frequency, one per segment
+    freqs = 440 + np.random.randint(-100, 100, size=len(segments))
+    
+    # Synthesize all segments in one pass: each sample's position within its
+    # own segment (so every tone starts at zero phase) and its index in the file
+    positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    indices = positions + np.repeat(starts, lengths)
+    audio[indices] = _wavetable_sine(positions, np.repeat(freqs, lengths), SAMPLE_RATE)
+    
+    path = audio_dir / "long_audio.wav"
+    sf.write(str(path), audio, SAMPLE_RATE, subtype="PCM_16")
+    return path
+
+
+@pytest.fixture(scope="session")
+def continuous_wav(audio_dir):
+    """30 seconds of continuous tone (no silence), written once per session"""
+    path = audio_dir / "continuous.wav"
+    sf.write(str(path), _make_sine(30, SAMPLE_RATE, 440), SAMPLE_RATE, subtype="PCM_16")
+    return path
+
+
+@pytest.fixture
+def temp_workspace():
+    """Create temporary workspace for testing"""
+    with tempfile.TemporaryDirectory(dir=_DEFAULT_TMP) as temp_dir:
+        workspace = Path(temp_dir)
+        (workspace / "input").mkdir()
+        (workspace / "processed").mkdir()
+        (workspace / "transcribed").mkdir()
+        yield workspace
+
+
+@pytest.fixture(scope="module")
+def _base_config():
+    """Load configuration once per module; tests get their own copies"""
+    return UnifiedConfig()
+
+
+@pytest.fixture
+def mock_config(_base_config, temp_workspace):
+    """Create mock configuration"""
+    config = copy.deepcopy(_base_config)
+    config.workspace = temp_workspace
+    config.processing.min_silence_duration = 2.0  # Shorter for testing
+    config.transcription.default_model = "test-model"
+    return config
+
+
 class TestAudioPipeline:
     """Test full pipeline integration"""
     
     @pytest.fixture
-    def temp_workspace(self):
-        """Create temporary workspace for testing"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            workspace = Path(temp_dir)
-            (workspace / "input").mkdir()
-            (workspace / "processed").mkdir()
-            (workspace / "transcribed").mkdir()
-            yield workspace
-    
-    @pytest.fixture
-    def test_audio_file(self, temp_workspace):
+    def test_audio_file(self, temp_workspace, gapped_wav):
         """Create a test audio file"""
-        # Generate test audio: 10 seconds at 16kHz
-        duration = 10  # seconds
-        sample_rate = 16000
-        t = np.linspace(0, duration, duration * sample_rate)
-        
-        # Create audio with silence gaps
-        audio = np.zeros_like(t)
-        
-        # Add sound from 0-2 seconds (440Hz tone)
-        audio[0:2*sample_rate] = 0.3 * np.sin(2 * np.pi * 440 * t[0:2*sample_rate])
-        
-        # Silence from 2-5 seconds
-        
-        # Add sound from 5-7 seconds (880Hz tone)
-        audio[5*sample_rate:7*sample_rate] = 0.3 * np.sin(2 * np.pi * 880 * t[5*sample_rate:7*sample_rate])
-        
-        # Silence from 7-10 seconds
-        
-        # Save test file
-        test_file = temp_workspace / "input" / "test_audio.wav"
-        sf.write(str(test_file), audio, sample_rate)
-        
-        return test_file
-    
-    @pytest.fixture
-    def mock_config(self, temp_workspace):
-        """Create mock configuration"""
-        config = UnifiedConfig()
-        config.workspace.base_path = temp_workspace
-        config.processing.min_silence_duration = 2.0  # Shorter for testing
-        config.transcription.default_model = "test-model"
-        return config
+        return _link_or_copy(gapped_wav, temp_workspace / "input" / "test_audio.wav")
     
     @pytest.mark.asyncio
     async def test_process_single_file(self, test_audio_file, mock_config):
@@ -93,7 +211,7 @@ class TestAudioPipeline:
         assert len(metadata["chunks"]) > 0  # Should have detected chunks
         
         # Verify files were created
-        processed_dir = mock_config.workspace.processed_path / result["file_id"]
+        processed_dir = mock_config.processed_path / result["file_id"]
         assert processed_dir.exists()
         
         # Verify chunk files exist
@@ -124,14 +242,13 @@ class TestAudioPipeline:
     @pytest.mark.asyncio
     async def test_process_batch(self, temp_workspace, mock_config):
         """Test processing multiple files"""
-        # Create multiple test files
-        test_files = []
-        for i in range(3):
-            audio_file = temp_workspace / "input" / f"test_{i}.wav"
-            # Create simple audio file
-            audio = np.random.randn(16000)  # 1 second of noise
-            sf.write(str(audio_file), audio, 16000)
-            test_files.append(audio_file)
+        # Create multiple test files. Only names matter here (file IDs include
+        # the stem), so encode 1 second of noise once and link the rest
+        test_files = [temp_workspace / "input" / f"test_{i}.wav" for i in range(3)]
+        noise = np.random.default_rng().standard_normal(16000, dtype=np.float32)
+        sf.write(str(test_files[0]), noise, 16000, subtype="PCM_16")
+        for test_file in test_files[1:]:
+            _link_or_copy(test_files[0], test_file)
         
         pipeline = AudioPipeline(config=mock_config)
         
@@ -171,21 +288,22 @@ class TestAudioPipeline:
         pipeline.state_manager.mark_failed.assert_called()
     
     def test_resume_failed(self, mock_config):
-        """Test getting failed files for resume"""
+        """Test getting failed files for resume from the state database"""
         pipeline = AudioPipeline(config=mock_config)
         
-        # Mock state manager
-        pipeline.state_manager.get_failed_files = MagicMock(
-            return_value=[
-                {"file_id": "file1", "original_path": "/path/to/file1.mp3"},
-                {"file_id": "file2", "original_path": "/path/to/file2.mp3"}
-            ]
-        )
+        for file_id in ("file1", "file2"):
+            pipeline.state_manager.start_processing(file_id, f"/path/to/{file_id}.mp3")
+            pipeline.state_manager.mark_failed(file_id, f"{file_id} failed")
+        pipeline.state_manager.start_processing("file3", "/path/to/file3.mp3")
         
         failed_files = pipeline.resume_failed()
         
-        assert len(failed_files) == 2
-        assert failed_files[0]["file_id"] == "file1"
+        # Rows are read by key, as the resume command does
+        failed = {row["file_id"]: (row["original_path"], row["error_message"]) for row in failed_files}
+        assert failed == {
+            "file1": ("/path/to/file1.mp3", "file1 failed"),
+            "file2": ("/path/to/file2.mp3", "file2 failed")
+        }
     
     def test_get_status(self, mock_config):
         """Test getting pipeline status"""
@@ -211,9 +329,10 @@ class TestAudioPipeline:
     def test_cleanup_workspace(self, mock_config, temp_workspace):
         """Test workspace cleanup"""
         pipeline = AudioPipeline(config=mock_config)
+        mock_config.ensure_workspace_dirs()
         
         # Create some test files
-        processed_dir = mock_config.workspace.processed_path / "test_id"
+        processed_dir = mock_config.processed_path / "test_id"
         processed_dir.mkdir()
         (processed_dir / "chunk_000.flac").touch()
         (processed_dir / "metadata.json").touch()
@@ -223,6 +342,11 @@ class TestAudioPipeline:
         
         # Verify files were removed
         assert not processed_dir.exists()
+        
+        # Empty workspace directories are recreated on the next call
+        mock_config.ensure_workspace_dirs()
+        assert mock_config.processed_path.is_dir()
+        assert mock_config.transcribed_path.is_dir()
     
     @pytest.mark.asyncio
     async def test_progress_tracking(self, test_audio_file, mock_config):
@@ -273,32 +397,9 @@ class TestPipelineWithRealAudio:
     """Test pipeline with more realistic audio scenarios"""
     
     @pytest.fixture
-    def long_audio_file(self, temp_workspace):
+    def long_audio_file(self, temp_workspace, long_wav):
         """Create a longer test audio file with multiple silence gaps"""
-        # 2 minutes of audio at 16kHz
-        duration = 120  # seconds
-        sample_rate = 16000
-        t = np.linspace(0, duration, duration * sample_rate)
-        
-        audio = np.zeros_like(t)
-        
-        # Add several speech segments with 25+ second gaps
-        segments = [
-            (0, 20),      # 20 seconds of "speech"
-            (50, 70),     # 20 seconds of "speech" (30s gap)
-            (100, 120)    # 20 seconds of "speech" (30s gap)
-        ]
-        
-        for start, end in segments:
-            # Simulate speech with varying frequency
-            freq = 440 + np.random.randint(-100, 100)
-            audio[start*sample_rate:end*sample_rate] = 0.3 * np.sin(2 * np.pi * freq * t[start*sample_rate:end*sample_rate])
-        
-        # Save test file
-        test_file = temp_workspace / "input" / "long_audio.wav"
-        sf.write(str(test_file), audio, sample_rate)
-        
-        return test_file
+        return _link_or_copy(long_wav, temp_workspace / "input" / "long_audio.wav")
     
     @pytest.mark.asyncio
     async def test_process_long_file_with_chunks(self, long_audio_file, mock_config):
@@ -343,16 +444,10 @@ class TestPipelineWithRealAudio:
         assert chunks[2]["start_time"] > 90.0  # Third chunk should start after second silence
     
     @pytest.mark.asyncio
-    async def test_process_file_no_silence(self, temp_workspace, mock_config):
+    async def test_process_file_no_silence(self, temp_workspace, continuous_wav, mock_config):
         """Test processing file with no silence (should process as single chunk)"""
-        # Create continuous audio file
         duration = 30
-        sample_rate = 16000
-        t = np.linspace(0, duration, duration * sample_rate)
-        audio = 0.3 * np.sin(2 * np.pi * 440 * t)  # Continuous tone
-        
-        test_file = temp_workspace / "input" / "continuous.wav"
-        sf.write(str(test_file), audio, sample_rate)
+        test_file = _link_or_copy(continuous_wav, temp_workspace / "input" / "continuous.wav")
         
         pipeline = AudioPipeline(config=mock_config)
         
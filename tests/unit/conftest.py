@@ -0,0 +1,37 @@
+"""Shared fixtures for unit tests
+
+rich (~50 ms to import) is only loaded by the fixtures that need it, so
+modules that never touch progress tracking don't pay for it at collection.
+"""
+from datetime import datetime
+from unittest.mock import create_autospec
+import pytest
+
+
+@pytest.fixture(scope="session")
+def fixed_now():
+    """Fixed timestamp for metadata tests, so results don't depend on the clock"""
+    return datetime(2024, 1, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def tracker():
+    """Fresh progress tracker for each test"""
+    from neuravox.shared.progress import UnifiedProgressTracker
+    return UnifiedProgressTracker()
+
+
+@pytest.fixture(scope="module")
+def progress_mock():
+    """Autospec of rich's Progress, built once per module (autospec is slow)"""
+    from rich.progress import Progress
+    return create_autospec(Progress, instance=True, spec_set=True)
+
+
+@pytest.fixture
+def mocked_tracker(tracker, progress_mock, monkeypatch):
+    """Tracker whose rich progress is a freshly reset Progress mock"""
+    progress_mock.reset_mock(return_value=True, side_effect=True)
+    progress_mock.add_task.return_value = 'task_123'
+    monkeypatch.setattr(tracker, 'progress', progress_mock)
+    return tracker, progress_mock.add_task, progress_mock.update
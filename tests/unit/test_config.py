@@ -1,111 +1,69 @@
 """Unit tests for shared configuration module"""
-import os
 import tempfile
+from dataclasses import asdict
 from pathlib import Path
 import pytest
 import yaml
 
-from neuravox.shared.config import UnifiedConfig, ProcessingConfig, TranscriptionConfig, APIKeysConfig
+from neuravox.shared.config import UnifiedConfig, ProcessingConfig, TranscriptionConfig
+from neuravox.shared.config_loader import SafeLoader
 
 
+def _fields(config, expected):
+    """Pick the fields named in ``expected`` from a config dataclass"""
+    values = asdict(config)
+    return {key: values[key] for key in expected}
 
 
 class TestProcessingConfig:
     """Test ProcessingConfig functionality"""
     
-    def test_default_values(self):
-        """Test default processing configuration"""
-        config = ProcessingConfig()
-        assert config.silence_threshold == 0.01
-        assert config.min_silence_duration == 25.0
-        assert config.min_chunk_duration == 5.0
-        assert config.output_format == "flac"
-        assert config.preserve_timestamps is True
-    
-    def test_custom_values(self):
-        """Test custom processing configuration"""
-        config = ProcessingConfig(
-            silence_threshold=0.02,
-            min_silence_duration=30.0,
-            output_format="wav"
-        )
-        assert config.silence_threshold == 0.02
-        assert config.min_silence_duration == 30.0
-        assert config.output_format == "wav"
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param({}, {
+            "silence_threshold": 0.01,
+            "min_silence_duration": 25.0,
+            "sample_rate": 16000,
+            "output_format": "flac",
+            "normalize": True,
+        }, id="defaults"),
+        pytest.param({
+            "silence_threshold": 0.02,
+            "min_silence_duration": 30.0,
+            "output_format": "wav",
+        }, {
+            "silence_threshold": 0.02,
+            "min_silence_duration": 30.0,
+            "output_format": "wav",
+        }, id="custom"),
+    ])
+    def test_values(self, kwargs, expected):
+        """Test default and custom processing configuration"""
+        assert _fields(ProcessingConfig(**kwargs), expected) == expected
 
 
 class TestTranscriptionConfig:
     """Test TranscriptionConfig functionality"""
     
-    def test_default_values(self):
-        """Test default transcription configuration"""
-        config = TranscriptionConfig()
-        assert config.default_model == "google-gemini"
-        assert config.max_concurrent == 3
-        assert config.chunk_processing is True
-        assert config.include_timestamps is True
-    
-    def test_custom_values(self):
-        """Test custom transcription configuration"""
-        config = TranscriptionConfig(
-            default_model="openai-whisper",
-            max_concurrent=5,
-            chunk_processing=False
-        )
-        assert config.default_model == "openai-whisper"
-        assert config.max_concurrent == 5
-        assert config.chunk_processing is False
-
-
-class TestAPIKeysConfig:
-    """Test APIKeysConfig functionality"""
-    
-    def test_default_values(self):
-        """Test default API keys configuration"""
-        # Clear any existing env vars
-        env_vars = ['GOOGLE_API_KEY', 'OPENAI_API_KEY']
-        original_values = {}
-        for var in env_vars:
-            original_values[var] = os.environ.get(var)
-            if var in os.environ:
-                del os.environ[var]
-        
-        try:
-            config = APIKeysConfig()
-            assert config.google_api_key is None
-            assert config.openai_api_key is None
-        finally:
-            # Restore original values
-            for var, value in original_values.items():
-                if value is not None:
-                    os.environ[var] = value
-    
-    def test_env_var_loading(self):
-        """Test loading API keys from environment variables"""
-        # Set test env vars
-        test_google_key = "test_google_key_123"
-        test_openai_key = "test_openai_key_456"
-        
-        os.environ['GOOGLE_API_KEY'] = test_google_key
-        os.environ['OPENAI_API_KEY'] = test_openai_key
-        
-        try:
-            config = APIKeysConfig()
-            assert config.google_api_key == test_google_key
-            assert config.openai_api_key == test_openai_key
-        finally:
-            # Clean up
-            del os.environ['GOOGLE_API_KEY']
-            del os.environ['OPENAI_API_KEY']
-    
-    def test_direct_values(self):
-        """Test setting API keys directly"""
-        config = APIKeysConfig(
-            google_api_key="direct_google_key",
-            openai_api_key="direct_openai_key"
-        )
-        assert config.google_api_key == "direct_google_key"
-        assert config.openai_api_key == "direct_openai_key"
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param({}, {
+            "default_model": "google-gemini",
+            "max_concurrent": 3,
+            "chunk_processing": True,
+            "include_timestamps": True,
+        }, id="defaults"),
+        pytest.param({
+            "default_model": "openai-whisper",
+            "max_concurrent": 5,
+            "chunk_processing": False,
+        }, {
+            "default_model": "openai-whisper",
+            "max_concurrent": 5,
+            "chunk_processing": False,
+        }, id="custom"),
+    ])
+    def test_values(self, kwargs, expected):
+        """Test default and custom transcription configuration"""
+        assert _fields(TranscriptionConfig(**kwargs), expected) == expected
 
 
 class TestUnifiedConfig:
@@ -118,7 +76,6 @@ class TestUnifiedConfig:
         # Check all sub-configs are initialized
         assert isinstance(config.processing, ProcessingConfig)
         assert isinstance(config.transcription, TranscriptionConfig)
-        assert isinstance(config.api_keys, APIKeysConfig)
     
     def test_load_from_yaml(self):
         """Test loading configuration from YAML file"""
@@ -154,27 +111,34 @@ transcription:
     
     def test_partial_yaml_loading(self):
         """Test loading partial configuration from YAML"""
-        # Create temporary config file with only some sections
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml_content = """
+        # Config with only some sections
+        yaml_content = """
 processing:
   silence_threshold: 0.03
   output_format: "mp3"
 """
-            f.write(yaml_content)
-            temp_path = Path(f.name)
+        config = UnifiedConfig.from_mapping(yaml.load(yaml_content, Loader=SafeLoader))
         
-        try:
-            config = UnifiedConfig(config_path=temp_path)
-            
-            # Check modified values
-            assert config.processing.silence_threshold == 0.03
-            assert config.processing.output_format == "mp3"
-            
-            # Check defaults are preserved for other configs
-            assert config.transcription.default_model == "google-gemini"
-        finally:
-            temp_path.unlink()
+        # Check modified values
+        assert config.processing.silence_threshold == 0.03
+        assert config.processing.output_format == "mp3"
+        
+        # Check defaults are preserved for other configs
+        assert config.transcription.default_model == "google-gemini"
+    
+    def test_from_mapping_skips_config_file(self, tmp_path, monkeypatch):
+        """Test that mapping-built configs ignore the config file on disk"""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("processing:\n  silence_threshold: 0.05\n")
+        monkeypatch.setenv('NEURAVOX_CONFIG', str(config_file))
+        monkeypatch.delenv('NEURAVOX_WORKSPACE', raising=False)
+        
+        assert UnifiedConfig().processing.silence_threshold == 0.05
+        assert UnifiedConfig.from_mapping({}).processing.silence_threshold == 0.01
+        
+        config = UnifiedConfig.from_mapping({"workspace": str(tmp_path / "ws")}, validate=False)
+        assert config.processing.silence_threshold == 0.01
+        assert config.processed_path == tmp_path / "ws" / "processed"
     
     def test_invalid_config_path(self):
         """Test behavior with non-existent config file"""
@@ -185,53 +149,44 @@ processing:
         assert config.processing.silence_threshold == 0.01
         assert config.transcription.default_model == "google-gemini"
     
-    def test_save_config(self):
-        """Test saving configuration to file"""
-        config = UnifiedConfig()
+    def test_api_key_defaults(self, monkeypatch):
+        """Test that API keys are unset without environment variables"""
+        # Clear any existing env vars
+        monkeypatch.delenv('GOOGLE_API_KEY', raising=False)
+        monkeypatch.delenv('OPENAI_API_KEY', raising=False)
         
-        # Modify some values
-        config.processing.silence_threshold = 0.05
-        config.transcription.max_concurrent = 10
+        config = UnifiedConfig()
+        assert config.get_api_key("google") is None
+        assert config.get_api_key("openai") is None
+    
+    def test_env_var_loading(self, monkeypatch):
+        """Test loading API keys from environment variables"""
+        # Set test env vars
+        test_google_key = "test_google_key_123"
+        test_openai_key = "test_openai_key_456"
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            temp_path = Path(f.name)
+        monkeypatch.setenv('GOOGLE_API_KEY', test_google_key)
+        monkeypatch.setenv('OPENAI_API_KEY', test_openai_key)
         
-        try:
-            config.save(temp_path)
-            
-            # Load saved config
-            with open(temp_path) as f:
-                saved_data = yaml.safe_load(f)
-            
-            # Verify saved values
-            assert saved_data['processing']['silence_threshold'] == 0.05
-            assert saved_data['transcription']['max_concurrent'] == 10
-        finally:
-            temp_path.unlink()
+        config = UnifiedConfig()
+        assert config.get_api_key("google") == test_google_key
+        assert config.get_api_key("openai") == test_openai_key
+        assert config.get_api_key("unknown") is None
     
-    def test_config_hierarchy(self):
+    def test_config_hierarchy(self, monkeypatch):
         """Test configuration hierarchy (env vars > config file > defaults)"""
         # Set env var
-        os.environ['GOOGLE_API_KEY'] = "env_var_key"
+        monkeypatch.setenv('GOOGLE_API_KEY', "env_var_key")
         
-        # Create config file with different key
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml_content = """
+        # Config with a different key
+        yaml_content = """
 api_keys:
   google_api_key: "config_file_key"
 """
-            f.write(yaml_content)
-            temp_path = Path(f.name)
+        config = UnifiedConfig.from_mapping(yaml.load(yaml_content, Loader=SafeLoader))
         
-        try:
-            config = UnifiedConfig(config_path=temp_path)
-            
-            # Env var should take precedence
-            assert config.api_keys.google_api_key == "env_var_key"
-        finally:
-            del os.environ['GOOGLE_API_KEY']
-            temp_path.unlink()
+        # Env var should take precedence
+        assert config.get_api_key("google") == "env_var_key"
 
 
 class TestConfigValidation:
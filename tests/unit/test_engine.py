@@ -0,0 +1,195 @@
+"""Unit tests for the transcription engine
+
+Models are stubs, so no backend or network is needed.
+"""
+import asyncio
+import json
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from neuravox.shared.config import UnifiedConfig
+from neuravox.shared.metadata import ChunkArrays, ProcessingMetadata
+from neuravox.transcriber.engine import AudioTranscriber, _group_chunks
+from neuravox.transcriber.models.base import AudioTranscriptionModel
+
+# Chunk durations: 70 s, 40 s, 7.5 s, 6 s, 5 s, 3 s and 2.5 s, in shuffled order
+DURATIONS = [3.0, 40.0, 7.5, 5.0, 70.0, 2.5, 6.0]
+
+
+@pytest.fixture
+def chunks():
+    """Back-to-back chunks with the durations above"""
+    ends = [sum(DURATIONS[:i + 1]) for i in range(len(DURATIONS))]
+    starts = [end - duration for end, duration in zip(ends, DURATIONS)]
+    file_paths = [f"/test/chunk_{i:03d}.flac" for i in range(len(DURATIONS))]
+    return ChunkArrays(starts, ends, file_paths, Path("/test/source.mp3"))
+
+
+def _durations(groups):
+    """Chunk durations of each group, rounded to tenths of a second"""
+    return [[round(c.end_time - c.start_time, 1) for c in group] for group in groups]
+
+
+class TestGroupChunks:
+    """Test grouping chunks into length-bucketed batches"""
+    
+    def test_single(self, chunks):
+        """Test that a batch size of 1 yields one chunk per group, longest first"""
+        assert _durations(_group_chunks(chunks, 1)) == [[70.0], [40.0], [7.5], [6.0], [5.0], [3.0], [2.5]]
+    
+    def test_buckets(self, chunks):
+        """Test that batches stay within a power-of-two bucket and within batch_size"""
+        assert _durations(_group_chunks(chunks, 2)) == [[70.0], [40.0], [7.5, 6.0], [5.0], [3.0, 2.5]]
+    
+    def test_covers_every_chunk(self, chunks):
+        """Test that grouping neither drops nor repeats chunks"""
+        groups = _group_chunks(chunks, 16)
+        
+        assert sorted(c.chunk_index for group in groups for c in group) == list(range(len(chunks)))
+        assert _group_chunks([], 4) == []
+
+
+class StubModel(AudioTranscriptionModel):
+    """Model that transcribes a chunk to its file stem, tracking overlapping calls"""
+    
+    def __init__(self, delay: float = 0.01, fail: str = None):
+        super().__init__(name="Stub", config={})
+        self.delay = delay
+        self.fail = fail
+        self.active = 0
+        self.max_active = 0
+        self.calls = []
+        self.cancelled = 0
+        self.upload_maps = set()
+    
+    def is_available(self) -> bool:
+        return True
+    
+    async def transcribe(self, audio_path: Path, *upload_args) -> str:
+        self.calls.append(audio_path.stem)
+        self.upload_maps.update(id(arg) for arg in upload_args)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            if audio_path.stem == self.fail:
+                raise ValueError("malformed audio")
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        finally:
+            self.active -= 1
+        return audio_path.stem
+
+
+class PrefetchingStubModel(StubModel):
+    """Stub that also uploads ahead, like the Google model"""
+    
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.prefetch_calls = []
+        self.released = []
+    
+    def prefetch(self, audio_paths, prefetched):
+        self.prefetch_calls.append([path.stem for path in audio_paths])
+        prefetched.update((path, f"upload-{path.stem}") for path in audio_paths)
+    
+    async def release_prefetched(self, prefetched):
+        self.released.append(id(prefetched))
+        prefetched.clear()
+
+
+def _chunk_metadata(tmp_path, durations) -> ProcessingMetadata:
+    """Processing metadata for back-to-back chunk files with the given durations"""
+    ends = [sum(durations[:i + 1]) for i in range(len(durations))]
+    starts = [end - duration for end, duration in zip(ends, durations)]
+    file_paths = [tmp_path / f"chunk_{i:03d}.flac" for i in range(len(durations))]
+    for path in file_paths:
+        path.touch()
+    return ProcessingMetadata.from_arrays(
+        starts, ends, file_paths, tmp_path / "source.mp3",
+        file_id="source_1234",
+        original_file=tmp_path / "source.mp3",
+        processed_at=datetime(2024, 1, 1, 12, 0, 0),
+        processing_time=1.0,
+        audio_info={"duration": ends[-1]},
+        processing_params={}
+    )
+
+
+def _transcriber(model) -> AudioTranscriber:
+    """Transcriber whose "stub" model key resolves to ``model``"""
+    transcriber = AudioTranscriber(config=UnifiedConfig.from_mapping({}, validate=False))
+    transcriber._models["stub"] = model
+    return transcriber
+
+
+class TestTranscribeChunks:
+    """Test chunk transcription with stub models"""
+    
+    @pytest.mark.asyncio
+    async def test_results_in_chunk_order(self, tmp_path):
+        """Test that results and sidecar records follow chunk order, not completion order"""
+        # Later chunks are longer, so they are started (and finish) first
+        metadata = _chunk_metadata(tmp_path, [1.0, 2.0, 4.0, 8.0])
+        model = StubModel()
+        
+        result = await _transcriber(model).transcribe_chunks(metadata, "stub", tmp_path / "out", max_concurrent=4)
+        
+        stems = [f"chunk_{i:03d}" for i in range(4)]
+        assert model.calls == stems[::-1]
+        assert [chunk["text"] for chunk in result["chunks"]] == stems
+        assert result["transcription"] == "\n\n".join(stems)
+        assert (tmp_path / "out" / "chunk_002_transcript.txt").read_text() == "chunk_002"
+        
+        assert result["metadata_file"] == result["chunks_file"] == result["sidecar_file"]
+        records = [json.loads(line) for line in result["sidecar_file"].read_text().splitlines()]
+        assert sorted(r["chunk_index"] for r in records[:-1]) == [0, 1, 2, 3]
+        assert all(r["type"] == "chunk" and r["text"] == stems[r["chunk_index"]] for r in records[:-1])
+        assert records[-1]["type"] == "summary"
+        assert records[-1]["chunks_transcribed"] == 4
+    
+    @pytest.mark.asyncio
+    async def test_concurrency_limit(self, tmp_path):
+        """Test that no more than max_concurrent chunks are in flight"""
+        metadata = _chunk_metadata(tmp_path, [1.0] * 6)
+        model = StubModel()
+        
+        await _transcriber(model).transcribe_chunks(metadata, "stub", tmp_path / "out", max_concurrent=2)
+        
+        assert len(model.calls) == 6
+        assert model.max_active == 2
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_window(self, tmp_path):
+        """Test that uploads run a window ahead and belong to the call that made them"""
+        metadata = _chunk_metadata(tmp_path, [6.0, 5.0, 4.0, 3.0, 2.0, 1.0])
+        model = PrefetchingStubModel()
+        
+        await _transcriber(model).transcribe_chunks(metadata, "stub", tmp_path / "out", max_concurrent=2)
+        
+        # Two groups per slot up front, then one more as each group starts
+        assert model.prefetch_calls[0] == ["chunk_000", "chunk_001", "chunk_002", "chunk_003"]
+        assert sum(model.prefetch_calls, []) == [f"chunk_{i:03d}" for i in range(6)]
+        assert len(model.upload_maps) == 1
+        assert model.released == list(model.upload_maps)
+    
+    @pytest.mark.asyncio
+    async def test_first_failure_cancels_the_rest(self, tmp_path):
+        """Test that a failed chunk stops the run instead of waiting for the other chunks"""
+        # The failing chunk is the longest, so it starts first
+        metadata = _chunk_metadata(tmp_path, [8.0, 1.0, 1.0, 1.0, 1.0])
+        model = PrefetchingStubModel(delay=60, fail="chunk_000")
+        
+        with pytest.raises(RuntimeError, match="chunk 0"):
+            await asyncio.wait_for(
+                _transcriber(model).transcribe_chunks(metadata, "stub", tmp_path / "out", max_concurrent=3),
+                timeout=5
+            )
+        
+        # Every other chunk that got started was cancelled, and not all of them started
+        assert len(model.calls) < 5
+        assert model.cancelled == len(model.calls) - 1
+        assert model.released == list(model.upload_maps)
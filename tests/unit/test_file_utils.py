@@ -1,17 +1,22 @@
 """Unit tests for shared file utilities module"""
-import os
-import tempfile
+import hashlib
+import json
+import pickle
 from pathlib import Path
+from unittest.mock import patch
 import pytest
 
+from neuravox.shared import file_utils
 from neuravox.shared.file_utils import (
     ensure_directory,
     create_file_id,
+    FileId,
     get_audio_files,
     format_file_size,
     cleanup_empty_directories,
     move_file_safely,
     calculate_file_hash,
+    iter_audio_with_hashes,
     format_duration,
     load_json_file,
     save_json_file,
@@ -19,187 +24,215 @@ from neuravox.shared.file_utils import (
 )
 
 
+@pytest.fixture(autouse=True)
+def hash_cache(tmp_path_factory, monkeypatch):
+    """Keep the digest cache out of the user's home directory"""
+    cache_path = tmp_path_factory.mktemp("hash_cache") / "hashes.sqlite"
+    monkeypatch.setattr(file_utils, "_HASH_CACHE_PATH", cache_path)
+    return cache_path
+
+
 class TestEnsureDirectory:
     """Test ensure_directory functionality"""
     
-    def test_create_new_directory(self):
+    def test_create_new_directory(self, tmp_path):
         """Test creating a new directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            new_dir = Path(temp_dir) / "test_dir"
-            
-            # Directory should not exist
-            assert not new_dir.exists()
-            
-            # Create directory
-            result = ensure_directory(new_dir)
-            
-            # Verify directory was created
-            assert new_dir.exists()
-            assert new_dir.is_dir()
-            assert result == new_dir
-    
-    def test_existing_directory(self):
+        new_dir = tmp_path / "test_dir"
+        
+        # Directory should not exist
+        assert not new_dir.exists()
+        
+        # Create directory
+        result = ensure_directory(new_dir)
+        
+        # Verify directory was created
+        assert new_dir.exists()
+        assert new_dir.is_dir()
+        assert result == new_dir
+    
+    def test_existing_directory(self, tmp_path):
         """Test with existing directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            existing_dir = Path(temp_dir)
-            
-            # Directory already exists
-            assert existing_dir.exists()
-            
-            # Should not raise error
-            result = ensure_directory(existing_dir)
-            
-            # Should return the same path
-            assert result == existing_dir
-            assert existing_dir.exists()
-    
-    def test_nested_directory_creation(self):
+        existing_dir = tmp_path
+        
+        # Directory already exists
+        assert existing_dir.exists()
+        
+        # Should not raise error
+        result = ensure_directory(existing_dir)
+        
+        # Should return the same path
+        assert result == existing_dir
+        assert existing_dir.exists()
+    
+    def test_nested_directory_creation(self, tmp_path):
         """Test creating nested directories"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            nested_dir = Path(temp_dir) / "level1" / "level2" / "level3"
-            
-            # Create nested structure
-            result = ensure_directory(nested_dir)
-            
-            # Verify all levels were created
-            assert nested_dir.exists()
-            assert nested_dir.is_dir()
-            assert (Path(temp_dir) / "level1").exists()
-            assert (Path(temp_dir) / "level1" / "level2").exists()
-    
-    def test_file_path_handling(self):
+        nested_dir = tmp_path / "level1" / "level2" / "level3"
+        
+        # Create nested structure
+        result = ensure_directory(nested_dir)
+        
+        # Verify all levels were created
+        assert nested_dir.exists()
+        assert nested_dir.is_dir()
+        assert (tmp_path / "level1").exists()
+        assert (tmp_path / "level1" / "level2").exists()
+    
+    def test_file_path_handling(self, tmp_path):
         """Test handling when path points to a file"""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            file_path = Path(temp_file.name)
-            
-            try:
-                # Should handle gracefully or raise appropriate error
-                # This depends on implementation
-                with pytest.raises(Exception):
-                    ensure_directory(file_path)
-            finally:
-                file_path.unlink()
+        file_path = tmp_path / "file"
+        file_path.touch()
+        
+        # Should handle gracefully or raise appropriate error
+        # This depends on implementation
+        with pytest.raises(Exception):
+            ensure_directory(file_path)
 
 
 class TestCreateFileId:
     """Test create_file_id functionality"""
     
-    def test_simple_filename(self):
+    def test_simple_filename(self, tmp_path):
         """Test creating ID from simple filename"""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write(b"test content")
-            
-            try:
-                file_id = create_file_id(temp_path)
-                
-                # Should contain stem and hash
-                assert temp_path.stem in file_id
-                assert '_' in file_id
-                parts = file_id.split('_')
-                assert len(parts) >= 2
-                assert len(parts[-1]) == 8  # 8 character hash
-            finally:
-                temp_path.unlink()
-    
-    def test_consistency(self):
+        temp_path = tmp_path / "audio.mp3"
+        temp_path.write_bytes(b"test content")
+        
+        file_id = create_file_id(temp_path)
+        
+        # Should contain stem and hash
+        assert temp_path.stem in file_id
+        assert '_' in file_id
+        parts = file_id.split('_')
+        assert len(parts) >= 2
+        assert len(parts[-1]) == 8  # 8 character hash
+    
+    def test_consistency(self, tmp_path):
         """Test that same file always produces same ID"""
-        with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write(b"consistent content")
-            
-            try:
-                id1 = create_file_id(temp_path)
-                id2 = create_file_id(temp_path)
-                
-                assert id1 == id2
-            finally:
-                temp_path.unlink()
-    
-    def test_different_content_different_id(self):
+        temp_path = tmp_path / "audio.mp3"
+        temp_path.write_bytes(b"consistent content")
+        
+        id1 = create_file_id(temp_path)
+        id2 = create_file_id(temp_path)
+        
+        assert id1 == id2
+    
+    def test_different_content_different_id(self, tmp_path):
         """Test that different content produces different IDs"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file1 = Path(temp_dir) / "file1.mp3"
-            file2 = Path(temp_dir) / "file2.mp3"
-            
-            file1.write_bytes(b"content 1")
-            file2.write_bytes(b"content 2")
-            
-            id1 = create_file_id(file1)
-            id2 = create_file_id(file2)
-            
-            # Different content should produce different hashes
-            assert id1 != id2
+        file1 = tmp_path / "file1.mp3"
+        file2 = tmp_path / "file2.mp3"
+        
+        file1.write_bytes(b"content 1")
+        file2.write_bytes(b"content 2")
+        
+        id1 = create_file_id(file1)
+        id2 = create_file_id(file2)
+        
+        # Different content should produce different hashes
+        assert id1 != id2
+    
+    def test_id_parts(self, tmp_path):
+        """Test that IDs expose their stem and digest and behave as strings"""
+        temp_path = tmp_path / "my_audio.mp3"
+        temp_path.write_bytes(b"content")
+        
+        file_id = create_file_id(temp_path)
+        
+        assert isinstance(file_id, FileId)
+        assert file_id.stem == "my_audio"
+        assert file_id.digest == calculate_file_hash(temp_path)[:8]
+        assert file_id == f"my_audio_{file_id.digest}"
+        assert pickle.loads(pickle.dumps(file_id)) == file_id
+    
+    def test_sampled_id(self, tmp_path):
+        """Test IDs built from sampled head and tail bytes"""
+        file1 = tmp_path / "file.mp3"
+        file2 = tmp_path / "other" / "file.mp3"
+        file2.parent.mkdir()
+        
+        file1.write_bytes(b"a" * 100 + b"b" * 100)
+        file2.write_bytes(b"a" * 100 + b"c" * 100)
+        
+        id1 = create_file_id(file1, sample_size=64)
+        assert id1 == create_file_id(file1, sample_size=64)
+        assert len(id1.split('_')[-1]) == 8
+        assert id1 != create_file_id(file2, sample_size=64)
 
 
 class TestGetAudioFiles:
     """Test get_audio_files functionality"""
     
-    def test_find_audio_files(self):
+    def test_find_audio_files(self, tmp_path):
         """Test finding audio files in directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create test files
-            audio_files = [
-                "test1.mp3",
-                "test2.wav",
-                "test3.flac",
-                "test4.m4a",
-                "test5.ogg"
-            ]
-            
-            for filename in audio_files:
-                (temp_path / filename).touch()
-            
-            # Create non-audio files
-            (temp_path / "document.txt").touch()
-            (temp_path / "image.png").touch()
-            
-            # Get audio files
-            found_files = get_audio_files(temp_path)
-            
-            # Should find all audio files
-            assert len(found_files) == 5
-            found_names = {f.name for f in found_files}
-            assert found_names == set(audio_files)
-    
-    def test_empty_directory(self):
+        # Create test files
+        audio_files = [
+            "test1.mp3",
+            "test2.wav",
+            "test3.flac",
+            "test4.m4a",
+            "test5.ogg"
+        ]
+        
+        for filename in audio_files:
+            (tmp_path / filename).touch()
+        
+        # Create non-audio files
+        (tmp_path / "document.txt").touch()
+        (tmp_path / "image.png").touch()
+        
+        # Get audio files
+        found_files = get_audio_files(tmp_path)
+        
+        # Should find all audio files
+        assert len(found_files) == 5
+        found_names = {f.name for f in found_files}
+        assert found_names == set(audio_files)
+    
+    def test_empty_directory(self, tmp_path):
         """Test with empty directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            found_files = get_audio_files(Path(temp_dir))
-            assert found_files == []
+        found_files = get_audio_files(tmp_path)
+        assert found_files == []
     
-    def test_custom_extensions(self):
+    def test_custom_extensions(self, tmp_path):
         """Test with custom extensions"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create files with custom extensions
-            (temp_path / "audio.mp3").touch()
-            (temp_path / "audio.custom").touch()
-            (temp_path / "audio.xyz").touch()
-            
-            # Search with custom extensions
-            found_files = get_audio_files(temp_path, extensions=['.mp3', '.custom'])
-            
-            # Should find only specified extensions
-            assert len(found_files) == 2
-            found_names = {f.name for f in found_files}
-            assert found_names == {"audio.mp3", "audio.custom"}
-    
-    def test_case_insensitive_extensions(self):
+        # Create files with custom extensions
+        (tmp_path / "audio.mp3").touch()
+        (tmp_path / "audio.custom").touch()
+        (tmp_path / "audio.xyz").touch()
+        
+        # Search with custom extensions
+        found_files = get_audio_files(tmp_path, extensions=['.mp3', '.custom'])
+        
+        # Should find only specified extensions
+        assert len(found_files) == 2
+        found_names = {f.name for f in found_files}
+        assert found_names == {"audio.mp3", "audio.custom"}
+    
+    def test_case_insensitive_extensions(self, tmp_path):
         """Test handling of uppercase extensions"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create files with various case extensions
-            files = ["test.MP3", "test.Wav", "test.FLAC"]
-            for filename in files:
-                (temp_path / filename).touch()
-            
-            found_files = get_audio_files(temp_path)
-            assert len(found_files) == 3
+        # Create files with various case extensions
+        files = ["test.MP3", "test.Wav", "test.FLAC"]
+        for filename in files:
+            (tmp_path / filename).touch()
+        
+        found_files = get_audio_files(tmp_path)
+        assert len(found_files) == 3
+    
+    def test_recursive_scan(self, tmp_path):
+        """Test finding audio files in nested directories"""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "c").mkdir()
+        
+        expected = [
+            tmp_path / "top.mp3",
+            tmp_path / "a" / "mid.WAV",
+            tmp_path / "a" / "b" / "deep.flac",
+            tmp_path / "c" / "side.ogg",
+        ]
+        for path in expected:
+            path.touch()
+        (tmp_path / "a" / "b" / "notes.txt").touch()
+        
+        assert get_audio_files(tmp_path, recursive=True, workers=2) == sorted(expected)
+        assert get_audio_files(tmp_path) == [tmp_path / "top.mp3"]
 
 
 class TestFormatFileSize:
@@ -248,202 +281,238 @@ class TestFormatFileSize:
 class TestCleanupEmptyDirectories:
     """Test cleanup_empty_directories functionality"""
     
-    def test_cleanup_empty_dirs(self):
+    def test_cleanup_empty_dirs(self, tmp_path):
         """Test removing empty directories"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create empty directories
-            (temp_path / "empty1").mkdir()
-            (temp_path / "empty2" / "nested_empty").mkdir(parents=True)
-            
-            # Create directory with file
-            (temp_path / "not_empty").mkdir()
-            (temp_path / "not_empty" / "file.txt").touch()
-            
-            # Run cleanup
-            cleanup_empty_directories(temp_path)
-            
-            # Empty directories should be removed
-            assert not (temp_path / "empty1").exists()
-            assert not (temp_path / "empty2").exists()
-            
-            # Non-empty directory should remain
-            assert (temp_path / "not_empty").exists()
-            assert (temp_path / "not_empty" / "file.txt").exists()
-    
-    def test_preserve_root(self):
+        # Create empty directories
+        (tmp_path / "empty1").mkdir()
+        (tmp_path / "empty2" / "nested_empty").mkdir(parents=True)
+        
+        # Create directory with file
+        (tmp_path / "not_empty").mkdir()
+        (tmp_path / "not_empty" / "file.txt").touch()
+        
+        # Run cleanup
+        cleanup_empty_directories(tmp_path)
+        
+        # Empty directories should be removed
+        assert not (tmp_path / "empty1").exists()
+        assert not (tmp_path / "empty2").exists()
+        
+        # Non-empty directory should remain
+        assert (tmp_path / "not_empty").exists()
+        assert (tmp_path / "not_empty" / "file.txt").exists()
+    
+    def test_preserve_root(self, tmp_path):
         """Test that root directory is preserved"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Run cleanup on empty root
-            cleanup_empty_directories(temp_path)
-            
-            # Root should still exist
-            assert temp_path.exists()
-    
-    def test_nested_empty_cleanup(self):
+        # Run cleanup on empty root
+        cleanup_empty_directories(tmp_path)
+        
+        # Root should still exist
+        assert tmp_path.exists()
+    
+    def test_nested_empty_cleanup(self, tmp_path):
         """Test cleaning nested empty directories"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create nested structure
-            nested = temp_path / "a" / "b" / "c" / "d"
-            nested.mkdir(parents=True)
-            
-            # Add file in middle
-            (temp_path / "a" / "b" / "file.txt").touch()
-            
-            # Run cleanup
-            cleanup_empty_directories(temp_path)
-            
-            # Directories with file and above should exist
-            assert (temp_path / "a").exists()
-            assert (temp_path / "a" / "b").exists()
-            assert (temp_path / "a" / "b" / "file.txt").exists()
-            
-            # Empty nested directories should be removed
-            assert not (temp_path / "a" / "b" / "c").exists()
+        # Create nested structure
+        nested = tmp_path / "a" / "b" / "c" / "d"
+        nested.mkdir(parents=True)
+        
+        # Add file in middle
+        (tmp_path / "a" / "b" / "file.txt").touch()
+        
+        # Run cleanup
+        cleanup_empty_directories(tmp_path)
+        
+        # Directories with file and above should exist
+        assert (tmp_path / "a").exists()
+        assert (tmp_path / "a" / "b").exists()
+        assert (tmp_path / "a" / "b" / "file.txt").exists()
+        
+        # Empty nested directories should be removed
+        assert not (tmp_path / "a" / "b" / "c").exists()
 
 
 class TestMoveFileSafely:
     """Test move_file_safely functionality"""
     
-    def test_simple_move(self):
+    def test_simple_move(self, tmp_path):
         """Test moving file to new location"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create source file
-            source = temp_path / "source.txt"
-            source.write_text("test content")
-            
-            # Define destination
-            dest = temp_path / "dest.txt"
-            
-            # Move file
-            result = move_file_safely(source, dest)
-            
-            # Verify move
-            assert not source.exists()
-            assert dest.exists()
-            assert dest.read_text() == "test content"
-            assert result == dest
-    
-    def test_move_to_existing_file(self):
+        # Create source file
+        source = tmp_path / "source.txt"
+        source.write_text("test content")
+        
+        # Define destination
+        dest = tmp_path / "dest.txt"
+        
+        # Move file
+        result = move_file_safely(source, dest)
+        
+        # Verify move
+        assert not source.exists()
+        assert dest.exists()
+        assert dest.read_text() == "test content"
+        assert result == dest
+    
+    def test_move_to_existing_file(self, tmp_path):
         """Test moving to location with existing file"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create source and destination files
-            source = temp_path / "source.txt"
-            source.write_text("source content")
-            
-            dest = temp_path / "dest.txt"
-            dest.write_text("existing content")
-            
-            # Should rename to avoid overwriting
-            result = move_file_safely(source, dest)
-            
-            # Verify renamed file
-            assert not source.exists()
-            assert dest.exists()  # Original dest still exists
-            assert dest.read_text() == "existing content"
-            assert result != dest  # New name
-            assert result.exists()
-            assert result.read_text() == "source content"
-            assert "_1" in result.stem  # Should have counter suffix
-    
-    def test_move_with_multiple_conflicts(self):
+        # Create source and destination files
+        source = tmp_path / "source.txt"
+        source.write_text("source content")
+        
+        dest = tmp_path / "dest.txt"
+        dest.write_text("existing content")
+        
+        # Should rename to avoid overwriting
+        result = move_file_safely(source, dest)
+        
+        # Verify renamed file
+        assert not source.exists()
+        assert dest.exists()  # Original dest still exists
+        assert dest.read_text() == "existing content"
+        assert result != dest  # New name
+        assert result.exists()
+        assert result.read_text() == "source content"
+        assert "_1" in result.stem  # Should have counter suffix
+    
+    def test_move_with_multiple_conflicts(self, tmp_path):
         """Test moving with multiple existing files"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create source file
-            source = temp_path / "source.txt"
-            source.write_text("new content")
-            
-            # Create existing files
-            (temp_path / "dest.txt").write_text("existing 1")
-            (temp_path / "dest_1.txt").write_text("existing 2")
-            (temp_path / "dest_2.txt").write_text("existing 3")
-            
-            # Move file
-            result = move_file_safely(source, temp_path / "dest.txt")
-            
-            # Should create dest_3.txt
-            assert result.name == "dest_3.txt"
-            assert result.read_text() == "new content"
-    
-    def test_move_to_different_directory(self):
+        # Create source file
+        source = tmp_path / "source.txt"
+        source.write_text("new content")
+        
+        # Create existing files
+        (tmp_path / "dest.txt").write_text("existing 1")
+        (tmp_path / "dest_1.txt").write_text("existing 2")
+        (tmp_path / "dest_2.txt").write_text("existing 3")
+        
+        # Move file
+        result = move_file_safely(source, tmp_path / "dest.txt")
+        
+        # Should create dest_3.txt
+        assert result.name == "dest_3.txt"
+        assert result.read_text() == "new content"
+    
+    def test_move_to_different_directory(self, tmp_path):
         """Test moving file to different directory"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            temp_path = Path(temp_dir)
-            
-            # Create source file
-            source = temp_path / "source.txt"
-            source.write_text("content")
-            
-            # Create destination directory
-            dest_dir = temp_path / "subdir"
-            dest_dir.mkdir()
-            dest = dest_dir / "moved.txt"
-            
-            # Move file
-            result = move_file_safely(source, dest)
-            
-            # Verify move
-            assert not source.exists()
-            assert dest.exists()
-            assert dest.read_text() == "content"
+        # Create source file
+        source = tmp_path / "source.txt"
+        source.write_text("content")
+        
+        # Create destination directory
+        dest_dir = tmp_path / "subdir"
+        dest_dir.mkdir()
+        dest = dest_dir / "moved.txt"
+        
+        # Move file
+        result = move_file_safely(source, dest)
+        
+        # Verify move
+        assert not source.exists()
+        assert dest.exists()
+        assert dest.read_text() == "content"
 
 
 class TestCalculateFileHash:
     """Test calculate_file_hash functionality"""
     
-    def test_hash_consistency(self):
+    def test_hash_consistency(self, tmp_path):
         """Test that same content produces same hash"""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            temp_file.write(b"test content for hashing")
-            
-            try:
-                hash1 = calculate_file_hash(temp_path)
-                hash2 = calculate_file_hash(temp_path)
-                
-                assert hash1 == hash2
-                assert len(hash1) == 64  # SHA256 produces 64 hex chars
-            finally:
-                temp_path.unlink()
-    
-    def test_different_content_different_hash(self):
+        temp_path = tmp_path / "file.bin"
+        temp_path.write_bytes(b"test content for hashing")
+        
+        hash1 = calculate_file_hash(temp_path)
+        hash2 = calculate_file_hash(temp_path)
+        
+        assert hash1 == hash2
+        assert len(hash1) == 64  # SHA256 produces 64 hex chars
+    
+    def test_different_content_different_hash(self, tmp_path):
         """Test that different content produces different hashes"""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file1 = Path(temp_dir) / "file1.txt"
-            file2 = Path(temp_dir) / "file2.txt"
-            
-            file1.write_bytes(b"content 1")
-            file2.write_bytes(b"content 2")
-            
-            hash1 = calculate_file_hash(file1)
-            hash2 = calculate_file_hash(file2)
-            
-            assert hash1 != hash2
-    
-    def test_large_file(self):
+        file1 = tmp_path / "file1.txt"
+        file2 = tmp_path / "file2.txt"
+        
+        file1.write_bytes(b"content 1")
+        file2.write_bytes(b"content 2")
+        
+        hash1 = calculate_file_hash(file1)
+        hash2 = calculate_file_hash(file2)
+        
+        assert hash1 != hash2
+    
+    def test_large_file(self, tmp_path):
         """Test hashing large file"""
-        with tempfile.NamedTemporaryFile(delete=False) as temp_file:
-            temp_path = Path(temp_file.name)
-            # Write 10MB of data
-            for _ in range(1024):
-                temp_file.write(b"x" * 10240)
-            
-            try:
-                hash_result = calculate_file_hash(temp_path)
-                assert len(hash_result) == 64
-            finally:
-                temp_path.unlink()
+        temp_path = tmp_path / "large.bin"
+        # Write 10MB of data
+        temp_path.write_bytes(b"x" * 10240 * 1024)
+        
+        hash_result = calculate_file_hash(temp_path)
+        assert len(hash_result) == 64
+    
+    def test_alternative_algorithm(self, tmp_path):
+        """Test hashing with a non-default algorithm"""
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"content")
+        
+        hash_result = calculate_file_hash(file_path, algorithm="blake2b")
+        assert hash_result == hashlib.blake2b(b"content").hexdigest()
+        assert hash_result != calculate_file_hash(file_path)
+    
+    def test_hash_cache_hit(self, tmp_path):
+        """Test that an unchanged file is not hashed again"""
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"cached content")
+        
+        hash1 = calculate_file_hash(file_path, use_cache=True)
+        with patch.object(file_utils, "_new_hasher") as new_hasher:
+            hash2 = calculate_file_hash(file_path, use_cache=True)
+        
+        assert hash1 == hash2
+        new_hasher.assert_not_called()
+    
+    def test_hash_cache_follows_renames(self, tmp_path):
+        """Test that cache entries are keyed by inode, not path"""
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"cached content")
+        hash1 = calculate_file_hash(file_path, use_cache=True)
+        
+        renamed = file_path.rename(tmp_path / "renamed.bin")
+        with patch.object(file_utils, "_new_hasher") as new_hasher:
+            hash2 = calculate_file_hash(renamed, use_cache=True)
+        
+        assert hash1 == hash2
+        new_hasher.assert_not_called()
+    
+    def test_hash_cache_off_by_default(self, tmp_path, hash_cache):
+        """Test that the digest cache is only used when asked for"""
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"content")
+        
+        calculate_file_hash(file_path)
+        
+        assert not hash_cache.exists()
+    
+    def test_hash_cache_invalidated_on_change(self, tmp_path):
+        """Test that modifying a file invalidates its cached hash"""
+        file_path = tmp_path / "file.bin"
+        file_path.write_bytes(b"original")
+        hash1 = calculate_file_hash(file_path, use_cache=True)
+        
+        file_path.write_bytes(b"modified content")
+        hash2 = calculate_file_hash(file_path, use_cache=True)
+        
+        assert hash1 != hash2
+        assert hash2 == calculate_file_hash(file_path)
+    
+    def test_iter_audio_with_hashes(self, tmp_path):
+        """Test hashing every audio file in a directory"""
+        for i in range(5):
+            (tmp_path / f"track{i}.wav").write_bytes(bytes([i]) * 1000)
+        (tmp_path / "notes.txt").write_bytes(b"skip")
+        
+        results = dict(iter_audio_with_hashes(tmp_path, workers=2))
+        
+        assert sorted(results) == get_audio_files(tmp_path)
+        for path, digest in results.items():
+            assert digest == calculate_file_hash(path)
 
 
 class TestFormatDuration:
@@ -477,32 +546,23 @@ class TestFormatDuration:
 class TestLoadJsonFile:
     """Test load_json_file functionality"""
     
-    def test_load_valid_json(self):
+    def test_load_valid_json(self, tmp_path):
         """Test loading valid JSON file"""
         test_data = {"key": "value", "number": 123, "list": [1, 2, 3]}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            import json
-            json.dump(test_data, f)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "data.json"
+        temp_path.write_text(json.dumps(test_data))
         
-        try:
-            loaded_data = load_json_file(temp_path)
-            assert loaded_data == test_data
-        finally:
-            temp_path.unlink()
+        loaded_data = load_json_file(temp_path)
+        assert loaded_data == test_data
     
-    def test_load_invalid_json(self):
+    def test_load_invalid_json(self, tmp_path):
         """Test loading invalid JSON file"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            f.write("invalid json content {")
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "invalid.json"
+        temp_path.write_text("invalid json content {")
         
-        try:
-            with pytest.raises(ValueError, match="Error loading JSON"):
-                load_json_file(temp_path)
-        finally:
-            temp_path.unlink()
+        with pytest.raises(ValueError, match="Error loading JSON"):
+            load_json_file(temp_path)
     
     def test_load_nonexistent_file(self):
         """Test loading non-existent file"""
@@ -513,51 +573,56 @@ class TestLoadJsonFile:
 class TestSaveJsonFile:
     """Test save_json_file functionality"""
     
-    def test_save_json(self):
+    def test_save_json(self, tmp_path):
         """Test saving JSON data"""
         test_data = {"name": "test", "values": [1, 2, 3], "nested": {"a": 1}}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "output.json"
-            
-            save_json_file(test_data, output_path)
-            
-            # Verify file was created and contains correct data
-            assert output_path.exists()
-            
-            import json
-            with open(output_path) as f:
-                loaded_data = json.load(f)
-            
-            assert loaded_data == test_data
-    
-    def test_save_with_parent_creation(self):
+        output_path = tmp_path / "output.json"
+        
+        save_json_file(test_data, output_path)
+        
+        # Verify file was created and contains correct data
+        assert output_path.exists()
+        
+        with open(output_path) as f:
+            loaded_data = json.load(f)
+        
+        assert loaded_data == test_data
+    
+    def test_save_with_parent_creation(self, tmp_path):
         """Test saving JSON with parent directory creation"""
         test_data = {"test": "data"}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "nested" / "dir" / "output.json"
-            
-            save_json_file(test_data, output_path)
-            
-            assert output_path.exists()
-            assert output_path.parent.exists()
+        output_path = tmp_path / "nested" / "dir" / "output.json"
+        
+        save_json_file(test_data, output_path)
+        
+        assert output_path.exists()
+        assert output_path.parent.exists()
     
-    def test_save_with_path_objects(self):
+    def test_save_with_path_objects(self, tmp_path):
         """Test saving JSON with Path objects (should convert to string)"""
         test_data = {"path": Path("/test/path"), "number": 42}
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "output.json"
-            
-            save_json_file(test_data, output_path)
-            
-            import json
-            with open(output_path) as f:
-                loaded_data = json.load(f)
-            
-            assert loaded_data["path"] == "/test/path"
-            assert loaded_data["number"] == 42
+        output_path = tmp_path / "output.json"
+        
+        save_json_file(test_data, output_path)
+        
+        with open(output_path) as f:
+            loaded_data = json.load(f)
+        
+        assert loaded_data["path"] == "/test/path"
+        assert loaded_data["number"] == 42
+    
+    def test_save_replaces_atomically(self, tmp_path):
+        """Test that saving over a file leaves no temporary files behind"""
+        output_path = tmp_path / "output.json"
+        output_path.write_text("stale")
+        
+        save_json_file({"fresh": True}, output_path, durable=True)
+        
+        assert load_json_file(output_path) == {"fresh": True}
+        assert list(tmp_path.iterdir()) == [output_path]
 
 
 class TestGetRelativePath:
@@ -0,0 +1,257 @@
+"""Unit tests for the Google AI model
+
+google-genai is replaced by a fake client that keeps uploads in memory and
+answers generate_content requests locally, so no SDK or network is needed.
+"""
+import asyncio
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from neuravox.transcriber.models.google_ai import _BATCH_DELIMITER, GoogleAIModel, _TranscriptCache
+
+SAMPLE_RATE = 16000
+
+
+class FakeFiles:
+    """In-memory stand-in for client.files"""
+    
+    def __init__(self):
+        self.uploaded = []
+        self.deleted = []
+        self.live = {}
+    
+    def upload(self, file):
+        audio_file = SimpleNamespace(name=f"files/{len(self.uploaded)}", path=Path(file))
+        self.uploaded.append(audio_file.path.stem)
+        self.live[audio_file.name] = audio_file
+        return audio_file
+    
+    def get(self, name):
+        if name not in self.live:
+            raise LookupError(name)
+        return self.live[name]
+    
+    def delete(self, name):
+        self.deleted.append(name)
+        self.live.pop(name, None)
+
+
+class FakeModels:
+    """client.models stand-in; queued responses (text or exceptions) are used first"""
+    
+    def __init__(self):
+        self.requests = []
+        self.responses = []
+    
+    def generate_content(self, model, contents):
+        self.requests.append([audio_file.path.stem for audio_file in contents[1:]])
+        if self.responses:
+            response = self.responses.pop(0)
+            if isinstance(response, Exception):
+                raise response
+            return SimpleNamespace(text=response)
+        # One transcript per file, split the way the batch prompt asks for
+        delimiter = f"\n{_BATCH_DELIMITER}\n"
+        return SimpleNamespace(text=delimiter.join(f"text of {f.path.stem}" for f in contents[1:]))
+
+
+class FakeClient:
+    """google.genai.Client stand-in"""
+    
+    def __init__(self, api_key=None, http_options=None):
+        self.files = FakeFiles()
+        self.models = FakeModels()
+
+
+@pytest.fixture
+def make_model(monkeypatch):
+    """Factory for GoogleAIModel instances backed by FakeClient"""
+    monkeypatch.setitem(sys.modules, "google.genai", SimpleNamespace(Client=FakeClient))
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    return lambda **config: GoogleAIModel(**config)
+
+
+@pytest.fixture
+def audio_files(tmp_path):
+    """Three short WAV files with different content (and so different hashes)"""
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"chunk_{i:03d}.wav"
+        sf.write(path, np.full(SAMPLE_RATE // 10, (i + 1) / 10, dtype=np.float32), SAMPLE_RATE)
+        paths.append(path)
+    return paths
+
+
+class TestTranscriptCache:
+    """Test the on-disk transcript cache"""
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_upload_and_generation(self, make_model, audio_files, tmp_path):
+        """Test that a cached transcript is returned without touching the API"""
+        model = make_model(use_cache=True, cache_dir=tmp_path / "cache")
+        
+        first = await model.transcribe(audio_files[0])
+        second = await model.transcribe(audio_files[0])
+        # A new instance reads the same records from disk
+        other = make_model(use_cache=True, cache_dir=tmp_path / "cache")
+        third = await other.transcribe(audio_files[0])
+        
+        assert first == second == third == "text of chunk_000"
+        assert model.client.files.uploaded == ["chunk_000"]
+        assert model.client.models.requests == [["chunk_000"]]
+        assert other.client.files.uploaded == []
+        assert other.client.models.requests == []
+    
+    @pytest.mark.asyncio
+    async def test_upload_reused_within_ttl(self, make_model, audio_files, tmp_path):
+        """Test that a retry after a failed generation reuses the recent upload"""
+        model = make_model(use_cache=True, cache_dir=tmp_path / "cache")
+        model.client.models.responses.append(ConnectionError("generation failed"))
+        
+        with pytest.raises(RuntimeError, match="generation failed"):
+            await model.transcribe(audio_files[0])
+        text = await model.transcribe(audio_files[0])
+        
+        assert text == "text of chunk_000"
+        assert model.client.files.uploaded == ["chunk_000"]
+        assert len(model.client.models.requests) == 2
+    
+    @pytest.mark.asyncio
+    async def test_upload_expires_after_ttl(self, make_model, audio_files, tmp_path):
+        """Test that uploads older than the TTL are uploaded again"""
+        model = make_model(use_cache=True, cache_dir=tmp_path / "cache", cache_upload_ttl=0)
+        model.client.models.responses.append(ConnectionError("generation failed"))
+        
+        with pytest.raises(RuntimeError):
+            await model.transcribe(audio_files[0])
+        await model.transcribe(audio_files[0])
+        
+        assert model.client.files.uploaded == ["chunk_000", "chunk_000"]
+    
+    @pytest.mark.asyncio
+    async def test_least_recently_used_evicted(self, tmp_path):
+        """Test that eviction drops the records read least recently"""
+        cache = _TranscriptCache(tmp_path, max_entries=2)
+        await cache.put_text("a", "key", "text a")
+        await cache.put_text("b", "key", "text b")
+        # Age both records, then read "a" so it becomes the most recent
+        for sha, age in (("a", 200), ("b", 100)):
+            stamp = os.path.getmtime(tmp_path / f"{sha}.json") - age
+            os.utime(tmp_path / f"{sha}.json", (stamp, stamp))
+        assert await cache.get_text("a", "key") == "text a"
+        
+        await cache.put_text("c", "key", "text c")
+        
+        assert sorted(path.stem for path in tmp_path.glob("*.json")) == ["a", "c"]
+        assert await cache.get_text("b", "key") is None
+
+
+class TestTranscribeBatch:
+    """Test several files sharing one generate_content request"""
+    
+    @pytest.mark.asyncio
+    async def test_split_response(self, make_model, audio_files):
+        """Test that a delimited response is split into one transcript per file, in order"""
+        model = make_model()
+        
+        texts = await model.transcribe_batch(audio_files)
+        
+        assert texts == ["text of chunk_000", "text of chunk_001", "text of chunk_002"]
+        assert model.client.models.requests == [["chunk_000", "chunk_001", "chunk_002"]]
+        assert sorted(model.client.files.deleted) == ["files/0", "files/1", "files/2"]
+    
+    @pytest.mark.asyncio
+    async def test_mismatched_split_falls_back_per_file(self, make_model, audio_files):
+        """Test that a response with the wrong number of parts is retried file by file"""
+        model = make_model()
+        model.client.models.responses.append(f"merged transcript\n{_BATCH_DELIMITER}\nof three files")
+        
+        texts = await model.transcribe_batch(audio_files)
+        
+        assert texts == ["text of chunk_000", "text of chunk_001", "text of chunk_002"]
+        assert model.client.models.requests == [
+            ["chunk_000", "chunk_001", "chunk_002"], ["chunk_000"], ["chunk_001"], ["chunk_002"]
+        ]
+        # The batch's uploads are deleted as well as the per-file ones
+        assert not model.client.files.live
+        assert len(model.client.files.deleted) == 6
+    
+    @pytest.mark.asyncio
+    async def test_cached_files_skipped(self, make_model, audio_files, tmp_path):
+        """Test that only files without a cached transcript go into the request"""
+        model = make_model(use_cache=True, cache_dir=tmp_path / "cache")
+        await model.transcribe(audio_files[1])
+        
+        texts = await model.transcribe_batch(audio_files)
+        
+        assert texts == ["text of chunk_000", "text of chunk_001", "text of chunk_002"]
+        assert model.client.models.requests[-1] == ["chunk_000", "chunk_002"]
+
+
+class TestPrefetch:
+    """Test uploads started ahead of transcription"""
+    
+    @pytest.mark.asyncio
+    async def test_transcribe_takes_prefetched_upload(self, make_model, audio_files):
+        """Test that transcribe uses the prefetched upload instead of uploading again"""
+        model = make_model()
+        prefetched = {}
+        
+        model.prefetch(audio_files[:2], prefetched)
+        text = await model.transcribe(audio_files[0], prefetched)
+        
+        assert text == "text of chunk_000"
+        assert sorted(model.client.files.uploaded) == ["chunk_000", "chunk_001"]
+        assert list(prefetched) == [audio_files[1]]
+        await model.release_prefetched(prefetched)
+    
+    @pytest.mark.asyncio
+    async def test_release_deletes_unused_uploads(self, make_model, audio_files):
+        """Test that finished prefetches nobody used are deleted, and the map emptied"""
+        model = make_model()
+        prefetched = {}
+        
+        model.prefetch(audio_files, prefetched)
+        await asyncio.gather(*prefetched.values())
+        await model.transcribe_batch(audio_files[:1], prefetched)
+        await model.release_prefetched(prefetched)
+        
+        assert prefetched == {}
+        # Only the transcribed file was used; the rest are gone from the server
+        assert not model.client.files.live
+        assert model.client.models.requests == [["chunk_000"]]
+    
+    @pytest.mark.asyncio
+    async def test_release_keeps_cached_uploads(self, make_model, audio_files, tmp_path):
+        """Test that with the cache on, released uploads stay for later reuse"""
+        model = make_model(use_cache=True, cache_dir=tmp_path / "cache")
+        prefetched = {}
+        
+        model.prefetch(audio_files[:2], prefetched)
+        await asyncio.gather(*prefetched.values())
+        await model.release_prefetched(prefetched)
+        await model.transcribe(audio_files[1])
+        
+        # chunk_001's upload was reused then deleted; chunk_000's is still there
+        assert sorted(model.client.files.uploaded) == ["chunk_000", "chunk_001"]
+        assert [f.path.stem for f in model.client.files.live.values()] == ["chunk_000"]
+    
+    @pytest.mark.asyncio
+    async def test_prefetch_maps_are_per_caller(self, make_model, audio_files):
+        """Test that releasing one caller's prefetches leaves another's in place"""
+        model = make_model()
+        mine, theirs = {}, {}
+        
+        model.prefetch(audio_files[:1], mine)
+        model.prefetch(audio_files[:1], theirs)
+        await model.release_prefetched(mine)
+        text = await model.transcribe(audio_files[0], theirs)
+        
+        assert text == "text of chunk_000"
+        assert theirs == {}
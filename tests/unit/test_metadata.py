@@ -1,57 +1,90 @@
 """Unit tests for shared metadata module"""
 import json
-import tempfile
+from dataclasses import asdict
 from pathlib import Path
-from datetime import datetime
+import numpy as np
 import pytest
 
-from neuravox.shared.metadata import ChunkMetadata, ProcessingMetadata, TranscriptionMetadata, MetadataManager
+from neuravox.shared.metadata import ChunkArrays, ChunkMetadata, ProcessingMetadata, TranscriptionMetadata, MetadataManager
+
+SOURCE_FILE = Path("/test/source.mp3")
+CHUNK_FILES = [Path("/test/chunk_000.flac"), Path("/test/chunk_001.flac")]
+
+
+@pytest.fixture(scope="module")
+def sample_chunks():
+    """Two 30 s chunks of SOURCE_FILE, shared read-only by the module"""
+    return [
+        ChunkMetadata(
+            chunk_index=index,
+            total_chunks=2,
+            start_time=start,
+            end_time=start + 30.0,
+            duration=30.0,
+            file_path=chunk_file,
+            source_file=SOURCE_FILE
+        )
+        for index, (start, chunk_file) in enumerate(zip([0.0, 30.0], CHUNK_FILES))
+    ]
+
+
+@pytest.fixture
+def list_metadata(sample_chunks, fixed_now):
+    """Processing metadata built from ChunkMetadata objects"""
+    return ProcessingMetadata(
+        file_id="test_save_load",
+        original_file=SOURCE_FILE,
+        processed_at=fixed_now,
+        processing_time=2.5,
+        chunks=sample_chunks,
+        audio_info={"duration": 60.0, "sample_rate": 16000},
+        processing_params={"silence_threshold": 0.01}
+    )
+
+
+@pytest.fixture
+def array_metadata(fixed_now):
+    """The same metadata built from parallel chunk arrays"""
+    return ProcessingMetadata.from_arrays(
+        start_times=[0.0, 30.0],
+        end_times=[30.0, 60.0],
+        file_paths=CHUNK_FILES,
+        source_file=SOURCE_FILE,
+        file_id="test_save_load",
+        original_file=SOURCE_FILE,
+        processed_at=fixed_now,
+        processing_time=2.5,
+        audio_info={"duration": 60.0, "sample_rate": 16000},
+        processing_params={"silence_threshold": 0.01}
+    )
 
 
 class TestChunkMetadata:
     """Test ChunkMetadata functionality"""
     
-    def test_creation(self):
+    def test_creation(self, sample_chunks):
         """Test creating chunk metadata"""
-        chunk = ChunkMetadata(
-            chunk_index=0,
-            total_chunks=5,
-            start_time=0.0,
-            end_time=30.0,
-            duration=30.0,
-            file_path=Path("/test/chunk_000.flac"),
-            source_file=Path("/test/source.mp3")
-        )
-        
-        assert chunk.chunk_index == 0
-        assert chunk.total_chunks == 5
-        assert chunk.start_time == 0.0
-        assert chunk.end_time == 30.0
-        assert chunk.duration == 30.0
-        assert chunk.file_path == Path("/test/chunk_000.flac")
-        assert chunk.source_file == Path("/test/source.mp3")
+        assert asdict(sample_chunks[0]) == {
+            "chunk_index": 0,
+            "total_chunks": 2,
+            "start_time": 0.0,
+            "end_time": 30.0,
+            "duration": 30.0,
+            "file_path": Path("/test/chunk_000.flac"),
+            "source_file": SOURCE_FILE
+        }
     
-    def test_to_dict(self):
+    def test_to_dict(self, sample_chunks):
         """Test converting chunk metadata to dictionary"""
-        chunk = ChunkMetadata(
-            chunk_index=1,
-            total_chunks=3,
-            start_time=30.0,
-            end_time=60.0,
-            duration=30.0,
-            file_path=Path("/test/chunk_001.flac"),
-            source_file=Path("/test/source.mp3")
-        )
-        
-        chunk_dict = chunk.to_dict()
-        
-        assert chunk_dict["chunk_index"] == 1
-        assert chunk_dict["total_chunks"] == 3
-        assert chunk_dict["start_time"] == 30.0
-        assert chunk_dict["end_time"] == 60.0
-        assert chunk_dict["duration"] == 30.0
-        assert chunk_dict["file_path"] == "/test/chunk_001.flac"
-        assert chunk_dict["source_file"] == "/test/source.mp3"
+        assert sample_chunks[1].to_dict() == {
+            "chunk_index": 1,
+            "total_chunks": 2,
+            "start_time": 30.0,
+            "end_time": 60.0,
+            "duration": 30.0,
+            "file_path": "/test/chunk_001.flac",
+            "source_file": "/test/source.mp3"
+        }
     
     def test_duration_calculation(self):
         """Test that duration matches end_time - start_time"""
@@ -62,146 +95,117 @@ class TestChunkMetadata:
             end_time=45.7,
             duration=35.2,
             file_path=Path("/test/chunk.flac"),
-            source_file=Path("/test/source.mp3")
+            source_file=SOURCE_FILE
         )
         
         assert chunk.duration == pytest.approx(chunk.end_time - chunk.start_time, rel=1e-6)
+    
+    @pytest.mark.parametrize("n_chunks", [1, 10_000])
+    def test_duration_calculation_arrays(self, n_chunks):
+        """Test serialized durations of array-backed chunks in one vectorized check"""
+        rng = np.random.default_rng(0)
+        end = np.cumsum(rng.uniform(1.0, 60.0, n_chunks))
+        start = end - rng.uniform(0.5, 1.0, n_chunks) * np.diff(end, prepend=0.0)
+        file_paths = [f"/test/chunk_{index:05d}.flac" for index in range(n_chunks)]
+        
+        chunk_dicts = ChunkArrays(start, end, file_paths, SOURCE_FILE).to_dicts()
+        
+        durations = np.fromiter((chunk["duration"] for chunk in chunk_dicts), float, n_chunks)
+        np.testing.assert_allclose(durations, end - start, rtol=1e-6)
 
 
 class TestProcessingMetadata:
     """Test ProcessingMetadata functionality"""
     
-    def test_creation(self):
+    def test_creation(self, sample_chunks, fixed_now):
         """Test creating processing metadata"""
-        chunks = [
-            ChunkMetadata(
-                chunk_index=0,
-                total_chunks=2,
-                start_time=0.0,
-                end_time=30.0,
-                duration=30.0,
-                file_path=Path("/test/chunk_000.flac"),
-                source_file=Path("/test/source.mp3")
-            ),
-            ChunkMetadata(
-                chunk_index=1,
-                total_chunks=2,
-                start_time=30.0,
-                end_time=60.0,
-                duration=30.0,
-                file_path=Path("/test/chunk_001.flac"),
-                source_file=Path("/test/source.mp3")
-            )
-        ]
-        
         metadata = ProcessingMetadata(
             file_id="test_file_id",
-            original_file=Path("/test/source.mp3"),
-            processed_at=datetime.now(),
+            original_file=SOURCE_FILE,
+            processed_at=fixed_now,
             processing_time=5.5,
-            chunks=chunks,
+            chunks=sample_chunks,
             audio_info={"duration": 60.0, "sample_rate": 44100},
             processing_params={"silence_threshold": 0.01}
         )
         
         assert metadata.file_id == "test_file_id"
-        assert metadata.original_file == Path("/test/source.mp3")
+        assert metadata.original_file == SOURCE_FILE
         assert metadata.processing_time == 5.5
-        assert len(metadata.chunks) == 2
-        assert metadata.audio_info["duration"] == 60.0
-        assert metadata.processing_params["silence_threshold"] == 0.01
+        assert metadata.chunks == sample_chunks
+        assert metadata.audio_info == {"duration": 60.0, "sample_rate": 44100}
+        assert metadata.processing_params == {"silence_threshold": 0.01}
     
-    def test_to_dict(self):
+    def test_to_dict(self, sample_chunks, fixed_now):
         """Test converting processing metadata to dictionary"""
-        chunks = [
-            ChunkMetadata(
-                chunk_index=0,
-                total_chunks=1,
-                start_time=0.0,
-                end_time=30.0,
-                duration=30.0,
-                file_path=Path("/test/chunk_000.flac"),
-                source_file=Path("/test/source.mp3")
-            )
-        ]
-        
-        now = datetime.now()
         metadata = ProcessingMetadata(
             file_id="test_id",
-            original_file=Path("/test/source.mp3"),
-            processed_at=now,
+            original_file=SOURCE_FILE,
+            processed_at=fixed_now,
             processing_time=3.5,
-            chunks=chunks,
+            chunks=sample_chunks,
             audio_info={"duration": 30.0},
             processing_params={"output_format": "flac"}
         )
         
-        meta_dict = metadata.to_dict()
-        
-        assert meta_dict["file_id"] == "test_id"
-        assert meta_dict["original_file"] == "/test/source.mp3"
-        assert meta_dict["processed_at"] == now.isoformat()
-        assert meta_dict["processing_time"] == 3.5
-        assert len(meta_dict["chunks"]) == 1
-        assert meta_dict["chunks"][0]["chunk_index"] == 0
-        assert meta_dict["chunks"][0]["file_path"] == "/test/chunk_000.flac"
+        assert metadata.to_dict() == {
+            "file_id": "test_id",
+            "original_file": "/test/source.mp3",
+            "processed_at": fixed_now.isoformat(),
+            "processing_time": 3.5,
+            "chunks": [chunk.to_dict() for chunk in sample_chunks],
+            "audio_info": {"duration": 30.0},
+            "processing_params": {"output_format": "flac"}
+        }
     
-    def test_save_and_load(self):
+    @pytest.mark.parametrize("metadata_fixture", ["list_metadata", "array_metadata"])
+    def test_save_and_load(self, request, metadata_fixture, tmp_path):
         """Test saving and loading processing metadata"""
-        chunks = [
-            ChunkMetadata(
-                chunk_index=0,
-                total_chunks=1,
-                start_time=0.0,
-                end_time=30.0,
-                duration=30.0,
-                file_path=Path("/test/chunk_000.flac"),
-                source_file=Path("/test/source.mp3")
-            )
-        ]
+        original_metadata = request.getfixturevalue(metadata_fixture)
+        temp_path = tmp_path / "meta.json"
         
-        original_metadata = ProcessingMetadata(
-            file_id="test_save_load",
-            original_file=Path("/test/source.mp3"),
-            processed_at=datetime.now(),
-            processing_time=2.5,
-            chunks=chunks,
-            audio_info={"duration": 30.0, "sample_rate": 16000},
-            processing_params={"silence_threshold": 0.01}
-        )
+        original_metadata.save(temp_path)
         
-        # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            temp_path = Path(f.name)
+        # Load from file
+        loaded_metadata = ProcessingMetadata.load(temp_path)
+        
+        # Verify loaded data matches original, with types restored
+        assert loaded_metadata.to_dict() == original_metadata.to_dict()
+        assert loaded_metadata.processed_at == original_metadata.processed_at
+        assert loaded_metadata.chunks == list(original_metadata.chunks)
+    
+    def test_from_arrays_matches_list(self, list_metadata, array_metadata):
+        """Test that array-backed chunks serialize like a chunk list"""
+        assert isinstance(array_metadata.chunks, ChunkArrays)
+        assert array_metadata.chunks[-1] == list_metadata.chunks[-1]
+        assert array_metadata.to_dict() == list_metadata.to_dict()
+    
+    def test_array_chunks_slice(self, list_metadata, array_metadata):
+        """Test that slicing array-backed chunks returns ChunkMetadata lists"""
+        assert array_metadata.chunks[:] == list_metadata.chunks
+        assert array_metadata.chunks[1:] == list_metadata.chunks[1:]
+        assert array_metadata.chunks[::-1] == list_metadata.chunks[::-1]
+        assert array_metadata.chunks[5:] == []
+    
+    def test_array_chunk_dicts_are_cached(self, array_metadata):
+        """Test that array-backed chunks serialize once and stay immutable"""
+        first = array_metadata.chunks.to_dicts()
+        second = array_metadata.chunks.to_dicts()
         
-        try:
-            original_metadata.save(temp_path)
-            
-            # Load from file
-            loaded_metadata = ProcessingMetadata.load(temp_path)
-            
-            # Verify loaded data matches original
-            assert loaded_metadata.file_id == original_metadata.file_id
-            assert loaded_metadata.original_file == original_metadata.original_file
-            assert loaded_metadata.processing_time == original_metadata.processing_time
-            assert len(loaded_metadata.chunks) == len(original_metadata.chunks)
-            assert loaded_metadata.chunks[0].chunk_index == 0
-            assert loaded_metadata.chunks[0].file_path == Path("/test/chunk_000.flac")
-            assert loaded_metadata.audio_info == original_metadata.audio_info
-            assert loaded_metadata.processing_params == original_metadata.processing_params
-        finally:
-            temp_path.unlink()
+        assert first == second
+        assert all(a is b for a, b in zip(first, second))
+        assert not array_metadata.chunks.times.flags.writeable
 
 
 class TestTranscriptionMetadata:
     """Test TranscriptionMetadata functionality"""
     
-    def test_creation(self):
+    def test_creation(self, fixed_now):
         """Test creating transcription metadata"""
         metadata = TranscriptionMetadata(
             file_id="test_transcript",
             model_used="google-gemini",
-            transcribed_at=datetime.now(),
+            transcribed_at=fixed_now,
             transcription_time=45.5,
             word_count=500,
             char_count=2500,
@@ -209,21 +213,23 @@ class TestTranscriptionMetadata:
             combined=True
         )
         
-        assert metadata.file_id == "test_transcript"
-        assert metadata.model_used == "google-gemini"
-        assert metadata.transcription_time == 45.5
-        assert metadata.word_count == 500
-        assert metadata.char_count == 2500
-        assert metadata.chunks_transcribed == 5
-        assert metadata.combined is True
+        assert asdict(metadata) == {
+            "file_id": "test_transcript",
+            "model_used": "google-gemini",
+            "transcribed_at": fixed_now,
+            "transcription_time": 45.5,
+            "word_count": 500,
+            "char_count": 2500,
+            "chunks_transcribed": 5,
+            "combined": True
+        }
     
-    def test_to_dict(self):
+    def test_to_dict(self, fixed_now):
         """Test converting transcription metadata to dictionary"""
-        now = datetime.now()
         metadata = TranscriptionMetadata(
             file_id="test_dict",
             model_used="openai-whisper",
-            transcribed_at=now,
+            transcribed_at=fixed_now,
             transcription_time=30.0,
             word_count=300,
             char_count=1500,
@@ -231,78 +237,52 @@ class TestTranscriptionMetadata:
             combined=False
         )
         
-        meta_dict = metadata.to_dict()
-        
-        assert meta_dict["file_id"] == "test_dict"
-        assert meta_dict["model_used"] == "openai-whisper"
-        assert meta_dict["transcribed_at"] == now.isoformat()
-        assert meta_dict["transcription_time"] == 30.0
-        assert meta_dict["word_count"] == 300
-        assert meta_dict["char_count"] == 1500
-        assert meta_dict["chunks_transcribed"] == 3
-        assert meta_dict["combined"] is False
+        assert metadata.to_dict() == {
+            "file_id": "test_dict",
+            "model_used": "openai-whisper",
+            "transcribed_at": fixed_now.isoformat(),
+            "transcription_time": 30.0,
+            "word_count": 300,
+            "char_count": 1500,
+            "chunks_transcribed": 3,
+            "combined": False
+        }
 
 
 class TestMetadataManager:
     """Test MetadataManager functionality"""
     
-    def test_create_manifest(self):
+    def test_create_manifest(self, sample_chunks, fixed_now, tmp_path):
         """Test creating a manifest from processing metadata"""
-        chunks = [
-            ChunkMetadata(
-                chunk_index=0,
-                total_chunks=2,
-                start_time=0.0,
-                end_time=30.0,
-                duration=30.0,
-                file_path=Path("/output/chunk_000.flac"),
-                source_file=Path("/input/source.mp3")
-            ),
-            ChunkMetadata(
-                chunk_index=1,
-                total_chunks=2,
-                start_time=30.0,
-                end_time=60.0,
-                duration=30.0,
-                file_path=Path("/output/chunk_001.flac"),
-                source_file=Path("/input/source.mp3")
-            )
-        ]
-        
         processing_metadata = ProcessingMetadata(
             file_id="test_manifest",
-            original_file=Path("/input/source.mp3"),
-            processed_at=datetime.now(),
+            original_file=SOURCE_FILE,
+            processed_at=fixed_now,
             processing_time=5.0,
-            chunks=chunks,
+            chunks=sample_chunks,
             audio_info={"duration": 60.0, "sample_rate": 16000},
             processing_params={"output_format": "flac"}
         )
         
-        # Create temporary output directory
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir)
-            
-            # Create manifest
-            manifest_path = MetadataManager.create_manifest(processing_metadata, output_dir)
-            
-            # Verify manifest was created
-            assert manifest_path.exists()
-            assert manifest_path.name == "test_manifest_manifest.json"
-            
-            # Load and verify manifest content
-            with open(manifest_path) as f:
-                manifest = json.load(f)
-            
-            assert manifest["file_id"] == "test_manifest"
-            assert manifest["original_file"] == "/input/source.mp3"
-            assert manifest["total_chunks"] == 2
-            assert len(manifest["chunks"]) == 2
-            assert manifest["chunks"][0]["chunk_index"] == 0
-            assert manifest["chunks"][1]["chunk_index"] == 1
-            assert manifest["audio_info"]["duration"] == 60.0
+        # Create manifest
+        manifest_path = MetadataManager.create_manifest(processing_metadata, tmp_path)
+        
+        # Verify manifest was created
+        assert manifest_path.exists()
+        assert manifest_path.name == "test_manifest_manifest.json"
+        
+        # Load and verify manifest content
+        manifest = json.loads(manifest_path.read_text())
+        
+        assert manifest == {
+            "file_id": "test_manifest",
+            "original_file": "/test/source.mp3",
+            "total_chunks": 2,
+            "audio_info": {"duration": 60.0, "sample_rate": 16000},
+            "chunks": [chunk.to_dict() for chunk in sample_chunks]
+        }
     
-    def test_load_manifest(self):
+    def test_load_manifest(self, tmp_path):
         """Test loading a manifest file"""
         # Create test manifest
         manifest_data = {
@@ -321,47 +301,34 @@ class TestMetadataManager:
         }
         
         # Save to temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(manifest_data, f)
-            temp_path = Path(f.name)
+        temp_path = tmp_path / "manifest.json"
+        temp_path.write_text(json.dumps(manifest_data))
+        
+        # Load manifest
+        loaded_manifest = MetadataManager.load_manifest(temp_path)
         
-        try:
-            # Load manifest
-            loaded_manifest = MetadataManager.load_manifest(temp_path)
-            
-            # Verify loaded data
-            assert loaded_manifest["file_id"] == "test_load"
-            assert loaded_manifest["original_file"] == "/test/audio.mp3"
-            assert loaded_manifest["total_chunks"] == 3
-            assert loaded_manifest["audio_info"]["duration"] == 90.0
-            assert len(loaded_manifest["chunks"]) == 1
-            assert loaded_manifest["chunks"][0]["chunk_index"] == 0
-        finally:
-            temp_path.unlink()
+        # Verify loaded data
+        assert loaded_manifest == manifest_data
     
-    def test_manifest_with_empty_chunks(self):
+    def test_manifest_with_empty_chunks(self, fixed_now, tmp_path):
         """Test creating manifest with no chunks (single file processing)"""
         processing_metadata = ProcessingMetadata(
             file_id="no_chunks",
             original_file=Path("/input/short.mp3"),
-            processed_at=datetime.now(),
+            processed_at=fixed_now,
             processing_time=1.0,
             chunks=[],  # No chunks - file processed as single unit
             audio_info={"duration": 10.0},
             processing_params={}
         )
         
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir)
-            
-            # Create manifest
-            manifest_path = MetadataManager.create_manifest(processing_metadata, output_dir)
-            
-            # Load and verify
-            manifest = MetadataManager.load_manifest(manifest_path)
-            assert manifest["total_chunks"] == 0
-            assert manifest["chunks"] == []
-
+        # Create manifest
+        manifest_path = MetadataManager.create_manifest(processing_metadata, tmp_path)
+        
+        # Load and verify
+        manifest = MetadataManager.load_manifest(manifest_path)
+        assert manifest["total_chunks"] == 0
+        assert manifest["chunks"] == []
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
@@ -0,0 +1,45 @@
+"""Progress tracker scenarios spanning several pipeline stages"""
+from unittest.mock import call
+import pytest
+
+
+@pytest.mark.integration
+class TestProgressIntegration:
+    """Test progress tracker integration scenarios"""
+    
+    def test_pipeline_progress_simulation(self, mocked_tracker):
+        """Simulate a typical pipeline progress flow"""
+        tracker, mock_add, mock_update = mocked_tracker
+        mock_add.side_effect = ['proc_id', 'trans_id']
+        
+        # Simulate audio processing; step granularity isn't under test
+        tracker.add_task('processing', 'Processing audio.mp3', 100)
+        tracker.update_task('processing', advance=100)
+        tracker.finish_task('processing')
+        
+        # Simulate transcription, relabelling the task for each chunk
+        tracker.add_task('transcription', 'Transcribing 5 chunks', 5)
+        
+        for i in range(5):
+            tracker.update_task('transcription', advance=1,
+                              description=f'Transcribing chunk {i+1}/5')
+        
+        tracker.finish_task('transcription')
+        
+        # Verify correct number of updates
+        assert tracker.tasks['processing']['completed'] == 100
+        assert tracker.tasks['transcription']['completed'] == 5
+        
+        # Finishing completed tasks adds no updates
+        expected = [call('proc_id', advance=100)]
+        for i in range(5):
+            expected += [
+                call('trans_id', advance=1),
+                call('trans_id', description=f'Transcribing chunk {i+1}/5'),
+            ]
+        mock_update.assert_has_calls(expected)
+        assert mock_update.call_count == len(expected)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
\ No newline at end of file
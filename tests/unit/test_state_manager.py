@@ -0,0 +1,195 @@
+"""Unit tests for the SQLite pipeline state manager"""
+import json
+import sqlite3
+
+import pytest
+
+from neuravox.core.state_manager import StateManager
+
+# Schema written by releases before child rows cascaded with their file
+_LEGACY_SCHEMA = '''
+    CREATE TABLE files (
+        file_id TEXT PRIMARY KEY,
+        original_path TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE TABLE processing_stages (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_id TEXT REFERENCES files(file_id),
+        stage TEXT NOT NULL,
+        status TEXT NOT NULL,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP,
+        error_message TEXT,
+        metadata TEXT
+    );
+    CREATE TABLE chunks (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        file_id TEXT REFERENCES files(file_id),
+        chunk_index INTEGER,
+        audio_path TEXT,
+        transcript_path TEXT,
+        start_time REAL,
+        end_time REAL,
+        transcribed BOOLEAN DEFAULT FALSE
+    );
+    CREATE INDEX idx_files_status ON files(status);
+    CREATE INDEX idx_stages_file_id ON processing_stages(file_id);
+'''
+
+
+def _query(db_path, sql, *params):
+    """Run a query on a fresh connection and return all rows as tuples"""
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute(sql, params).fetchall()
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """Workspace whose state database predates ON DELETE CASCADE"""
+    conn = sqlite3.connect(tmp_path / '.pipeline_state.db')
+    conn.executescript(_LEGACY_SCHEMA)
+    conn.execute("INSERT INTO files (file_id, original_path, status) VALUES ('a', '/in/a.mp3', 'completed')")
+    conn.executemany(
+        "INSERT INTO processing_stages (file_id, stage, status, metadata) VALUES (?, ?, 'completed', ?)",
+        [('a', 'processing', None), ('a', 'transcribing', '{"chunks": 2}'), ('gone', 'processing', None)]
+    )
+    conn.executemany(
+        "INSERT INTO chunks (file_id, chunk_index, audio_path) VALUES (?, ?, ?)",
+        [('a', 0, '/out/a/chunk_000.flac'), ('a', 1, '/out/a/chunk_001.flac')]
+    )
+    conn.commit()
+    conn.close()
+    return tmp_path
+
+
+class TestSchemaMigration:
+    """Test upgrading databases created before cascading deletes"""
+    
+    def test_migrates_legacy_database(self, legacy_db):
+        """Test that opening an old database rebuilds its child tables and keeps the data"""
+        db_path = legacy_db / '.pipeline_state.db'
+        assert _query(db_path, 'PRAGMA user_version') == [(0,)]
+        
+        manager = StateManager(legacy_db)
+        
+        assert _query(db_path, 'PRAGMA user_version') == [(StateManager.SCHEMA_VERSION,)]
+        for table in ('processing_stages', 'chunks'):
+            foreign_keys = _query(db_path, f'PRAGMA foreign_key_list({table})')
+            assert [fk[6] for fk in foreign_keys] == ['CASCADE']
+        
+        # Rows with a parent file survive; the orphaned stage row is dropped
+        history = manager.get_processing_history('a')
+        assert [(record.stage, record.metadata) for record in history] == [
+            ('processing', None), ('transcribing', {'chunks': 2})
+        ]
+        assert _query(db_path, "SELECT COUNT(*) FROM processing_stages WHERE file_id = 'gone'") == [(0,)]
+        assert _query(db_path, 'SELECT chunk_index, audio_path FROM chunks ORDER BY chunk_index') == [
+            (0, '/out/a/chunk_000.flac'), (1, '/out/a/chunk_001.flac')
+        ]
+        assert manager.get_file_status('a')['status'] == 'completed'
+    
+    def test_migration_runs_once(self, legacy_db):
+        """Test that reopening a migrated database leaves it as it is"""
+        db_path = legacy_db / '.pipeline_state.db'
+        StateManager(legacy_db)
+        tables = _query(db_path, "SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name")
+        
+        StateManager(legacy_db)
+        
+        assert _query(db_path, "SELECT name, sql FROM sqlite_master WHERE type = 'table' ORDER BY name") == tables
+        assert _query(db_path, 'SELECT COUNT(*) FROM processing_stages') == [(2,)]
+    
+    def test_new_database_is_current(self, tmp_path):
+        """Test that a fresh database starts at the current schema version"""
+        StateManager(tmp_path)
+        
+        db_path = tmp_path / '.pipeline_state.db'
+        assert _query(db_path, 'PRAGMA user_version') == [(StateManager.SCHEMA_VERSION,)]
+        assert [fk[6] for fk in _query(db_path, 'PRAGMA foreign_key_list(chunks)')] == ['CASCADE']
+
+
+class TestCleanupOldRecords:
+    """Test pruning finished files from the state database"""
+    
+    @pytest.fixture
+    def manager(self, tmp_path):
+        """State manager holding an old and a recent completed file, each with chunks"""
+        manager = StateManager(tmp_path)
+        for file_id in ('old', 'new'):
+            manager.start_processing(file_id, f'/in/{file_id}.mp3')
+            manager.update_stage(file_id, 'transcribing')
+            manager.complete_processing(file_id)
+        conn = sqlite3.connect(manager.db_path)
+        conn.executemany(
+            "INSERT INTO chunks (file_id, chunk_index) VALUES (?, ?)",
+            [('old', 0), ('old', 1), ('new', 0)]
+        )
+        conn.execute("UPDATE files SET updated_at = datetime('now', '-40 days') WHERE file_id = 'old'")
+        conn.commit()
+        conn.close()
+        return manager
+    
+    def test_child_rows_cascade(self, manager):
+        """Test that deleting an old file also deletes its stage and chunk rows"""
+        manager.cleanup_old_records(30)
+        
+        assert manager.get_file_status('old') is None
+        assert manager.get_processing_history('old') == []
+        assert _query(manager.db_path, "SELECT COUNT(*) FROM chunks WHERE file_id = 'old'") == [(0,)]
+        # The recent file keeps everything
+        assert manager.get_file_status('new')['status'] == 'completed'
+        assert len(manager.get_processing_history('new')) == 2
+        assert _query(manager.db_path, "SELECT COUNT(*) FROM chunks WHERE file_id = 'new'") == [(1,)]
+    
+    def test_unfinished_files_kept(self, manager):
+        """Test that old files still in progress are not removed"""
+        conn = sqlite3.connect(manager.db_path)
+        conn.execute("UPDATE files SET status = 'transcribing' WHERE file_id = 'old'")
+        conn.commit()
+        conn.close()
+        
+        manager.cleanup_old_records(30)
+        
+        assert manager.get_file_status('old')['status'] == 'transcribing'
+        assert _query(manager.db_path, "SELECT COUNT(*) FROM chunks WHERE file_id = 'old'") == [(2,)]
+
+
+class TestQueries:
+    """Test the shapes returned by the read queries"""
+    
+    def test_failed_files_are_dicts(self, tmp_path):
+        """Test that failed files come back as plain, serializable dicts"""
+        manager = StateManager(tmp_path)
+        manager.start_processing('a', '/in/a.mp3')
+        manager.mark_failed('a', 'decoder error')
+        
+        failed = manager.get_failed_files()
+        
+        assert [type(row) for row in failed] == [dict]
+        assert failed[0]['file_id'] == 'a'
+        assert failed[0]['original_path'] == '/in/a.mp3'
+        assert failed[0]['error_message'] == 'decoder error'
+        json.dumps(failed)
+    
+    def test_summary_is_serializable(self, tmp_path):
+        """Test that the pipeline summary lists recent activity as dicts"""
+        manager = StateManager(tmp_path)
+        manager.start_processing('a', '/in/a.mp3')
+        manager.complete_processing('a')
+        manager.start_processing('b', '/in/b.mp3')
+        
+        summary = manager.get_pipeline_summary()
+        
+        assert summary['status_counts'] == {'completed': 1, 'processing': 1}
+        assert summary['total_files'] == 2
+        assert all(type(row) is dict for row in summary['recent_activity'])
+        assert {row['file_id']: row['status'] for row in summary['recent_activity']} == {
+            'a': 'completed', 'b': 'processing'
+        }
+        json.dumps(summary)
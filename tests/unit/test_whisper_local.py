@@ -0,0 +1,211 @@
+"""Unit tests for the local Whisper model
+
+No Whisper backend is needed: the loaded model is replaced by a stub, and
+audio is synthesized in numpy.
+"""
+import asyncio
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+from neuravox.transcriber.models.whisper_local import (
+    LocalWhisperModel, SAMPLE_RATE, _drop_overlap, _restore_timestamps, _speech_regions
+)
+
+FRAME = 512
+
+
+class StubWhisper:
+    """faster-whisper stand-in that records how many calls overlap"""
+    
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+        self.options = []
+        self._counter_lock = threading.Lock()
+    
+    def _segments(self, audio):
+        with self._counter_lock:
+            self.active += 1
+            self.calls += 1
+            self.max_active = max(self.max_active, self.active)
+        # Long enough for another worker thread to try the model meanwhile
+        time.sleep(0.05)
+        with self._counter_lock:
+            self.active -= 1
+        yield SimpleNamespace(start=0.0, end=1.0, text=f" {audio}")
+    
+    def transcribe(self, audio, **options):
+        self.options.append(options)
+        return self._segments(audio), SimpleNamespace(language="en")
+
+
+@pytest.fixture
+def stub_model(monkeypatch):
+    """Stub loaded in place of faster-whisper, shared through the model cache"""
+    stub = StubWhisper()
+    
+    def load(self):
+        self.model = stub
+    
+    LocalWhisperModel.clear_model_cache()
+    monkeypatch.setattr(LocalWhisperModel, "_load_faster_whisper", load)
+    monkeypatch.setattr(LocalWhisperModel, "is_available", lambda self: True)
+    yield stub
+    LocalWhisperModel.clear_model_cache()
+
+
+@pytest.fixture
+def chunk_files(tmp_path):
+    """Two one-second WAV chunks"""
+    paths = []
+    for i in range(2):
+        path = tmp_path / f"chunk_{i:03d}.wav"
+        sf.write(path, np.zeros(SAMPLE_RATE, dtype=np.float32), SAMPLE_RATE)
+        paths.append(path)
+    return paths
+
+
+def _local_model(**config):
+    """faster-whisper model on CPU, so loading needs no device probe"""
+    return LocalWhisperModel(model_id="tiny", device="cpu", backend="faster-whisper", **config)
+
+
+def _bursts(n_frames, *bursts):
+    """Silent samples with full-scale bursts over the given (first, last) frame ranges"""
+    samples = np.zeros(n_frames * FRAME, dtype=np.float32)
+    for first, last in bursts:
+        samples[first * FRAME:last * FRAME] = 0.5
+    return samples
+
+
+class TestConcurrency:
+    """Test sharing one loaded model between instances"""
+    
+    def test_concurrent_chunks_take_turns(self, stub_model, chunk_files):
+        """Test that chunks transcribed concurrently never run the shared model at once"""
+        models = [_local_model(), _local_model()]
+        
+        async def run():
+            return await asyncio.gather(*(
+                model.transcribe(path) for model, path in zip(models, chunk_files)
+            ))
+        
+        texts = asyncio.run(run())
+        
+        assert texts == [str(path) for path in chunk_files]
+        assert models[0].model is models[1].model is stub_model
+        assert models[0]._inference_lock is models[1]._inference_lock
+        assert stub_model.calls == 2
+        assert stub_model.max_active == 1
+
+
+class TestSpeechHelpers:
+    """Test the silence trimming and window stitching helpers"""
+    
+    def test_speech_regions_padded(self):
+        """Test that separate bursts become padded regions clipped to the audio"""
+        samples = _bursts(300, (0, 10), (200, 220))
+        pad = SAMPLE_RATE // 2
+        
+        assert _speech_regions(samples, frame_length=FRAME) == [
+            (0, 10 * FRAME + pad),
+            (200 * FRAME - pad, 220 * FRAME + pad)
+        ]
+    
+    def test_speech_regions_bridge_short_gaps(self):
+        """Test that bursts separated by less than min_silence merge into one region"""
+        samples = _bursts(300, (100, 110), (150, 160))
+        pad = SAMPLE_RATE // 2
+        
+        assert _speech_regions(samples, frame_length=FRAME) == [(100 * FRAME - pad, 160 * FRAME + pad)]
+    
+    def test_speech_regions_silence_and_short_input(self):
+        """Test that silence has no regions and audio shorter than a frame is kept whole"""
+        assert _speech_regions(np.zeros(10 * FRAME, dtype=np.float32), frame_length=FRAME) == []
+        assert _speech_regions(np.ones(FRAME - 1, dtype=np.float32), frame_length=FRAME) == [(0, FRAME - 1)]
+    
+    def test_restore_timestamps(self):
+        """Test that times in trimmed audio map back to their original regions"""
+        # Speech at 1-2 s and 4-5 s became the first and second trimmed seconds
+        regions = [(SAMPLE_RATE, 2 * SAMPLE_RATE), (4 * SAMPLE_RATE, 5 * SAMPLE_RATE)]
+        segments = [
+            {"start": 0.25, "end": 1.5, "words": [{"start": 0.25, "end": 0.5}, {"start": 1.0, "end": 1.5}]},
+            {"start": 1.75, "end": 2.0}
+        ]
+        
+        _restore_timestamps(segments, regions)
+        
+        assert segments == [
+            {"start": 1.25, "end": 4.5, "words": [{"start": 1.25, "end": 1.5}, {"start": 4.0, "end": 4.5}]},
+            {"start": 4.75, "end": 5.0}
+        ]
+    
+    @pytest.mark.parametrize("previous, current, expected", [
+        (["the", "quick", "brown", "fox"], ["Brown", "fox,", "jumps"], ["jumps"]),
+        (["the", "quick"], ["brown", "fox"], ["brown", "fox"]),
+        (["the", "quick"], ["the", "quick"], []),
+        ([], ["the", "quick"], ["the", "quick"]),
+    ])
+    def test_drop_overlap(self, previous, current, expected):
+        """Test that words repeating the previous window's tail are dropped"""
+        assert _drop_overlap(previous, current) == expected
+    
+    def test_drop_overlap_max_words(self):
+        """Test that overlaps longer than max_words are not matched"""
+        words = ["one", "two", "three"]
+        
+        assert _drop_overlap(words, words, max_words=2) == words
+
+
+class TestChunkedTranscribe:
+    """Test decoding long audio in overlapping windows"""
+    
+    @pytest.mark.parametrize("samples, expected_calls", [
+        pytest.param(np.zeros(10 * SAMPLE_RATE, dtype=np.float32), 0, id="silent"),
+        pytest.param(_bursts(400, (100, 200)), 1, id="speech"),
+    ])
+    def test_vad_skips_silence(self, monkeypatch, samples, expected_calls):
+        """Test that chunked decoding with VAD never runs the model on all-silent audio"""
+        model = LocalWhisperModel(model_id="tiny", device="cpu", chunked=True, vad=True)
+        calls = []
+        
+        def transcribe_sync(audio, options):
+            calls.append(len(audio))
+            return {"text": "words"}
+        
+        monkeypatch.setattr(model, "_load_audio", lambda path: samples)
+        monkeypatch.setattr(model, "_transcribe_sync", transcribe_sync)
+        
+        parts = list(model._chunked_transcribe("audio.wav", {}))
+        
+        assert len(calls) == expected_calls
+        assert all(calls)
+        assert " ".join(parts) == ("words" if expected_calls else "")
+
+
+class TestTranscribeBatch:
+    """Test transcribing several files in one call"""
+    
+    def test_transcribe_batch(self, stub_model, chunk_files, monkeypatch):
+        """Test that faster-whisper batches run each file through the batched pipeline, in order"""
+        model = _local_model(batch_size=4)
+        model._batched_pipeline = stub_model
+        monkeypatch.setattr(LocalWhisperModel, "_load_audio", lambda self, path: str(path))
+        
+        texts = asyncio.run(model.transcribe_batch(chunk_files))
+        
+        assert texts == [str(path) for path in chunk_files]
+        assert [(o["batch_size"], o["vad_filter"]) for o in stub_model.options] == [(4, True)] * 2
+    
+    def test_transcribe_batch_rejects_invalid_file(self, stub_model, chunk_files, tmp_path):
+        """Test that a batch with an unreadable file fails before any decoding"""
+        with pytest.raises(ValueError):
+            asyncio.run(_local_model().transcribe_batch([*chunk_files, tmp_path / "missing.wav"]))
+        
+        assert stub_model.calls == 0